@@ -6,5 +6,18 @@ This package provides tools and APIs for generating pulp fiction stories in vari
 
 __version__ = "0.1.0"
 
-# Export key story components for easy import
-from .story import StoryGenerator, StoryOutput, StoryArtifacts, StoryStateManager 
\ No newline at end of file
+# Key story components exported for easy import. They are imported on first
+# access, so importing a subpackage such as the CLI or the prompts does not
+# load the story generator and crewai.
+_STORY_EXPORTS = ("StoryGenerator", "StoryOutput", "StoryArtifacts", "StoryStateManager")
+
+
+def __getattr__(name):
+    """Import the exported story components on first access."""
+    if name in _STORY_EXPORTS:
+        from . import story
+        return getattr(story, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["__version__", *_STORY_EXPORTS]
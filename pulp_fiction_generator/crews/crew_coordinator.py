@@ -3,7 +3,6 @@ CrewCoordinator manages and orchestrates the creation and execution of agent cre
 """
 
 from typing import Any, Dict, List, Optional, Union
-import copy
 
 from crewai import Agent, Crew, Process, Task
 
@@ -313,8 +312,9 @@ class CrewCoordinator:
             self.execution_engine.debug_mode = debug_mode
         
         try:
-            # Make a copy of the config to modify
-            crew_config = copy.deepcopy(config) if config else {}
+            # Crew factories only read the config and merge it into a new dict,
+            # so a shallow copy is enough
+            crew_config = dict(config) if config else {}
             
             # Choose crew creation approach
             try:
@@ -2,11 +2,22 @@
 Base classes for the plugin system.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from typing import ClassVar, Dict, Any, List, Type
 
+# Module attribute listing the concrete plugin classes defined in that module
+MODULE_PLUGINS_ATTR = "__pulp_plugins__"
+
 class PluginMeta(type):
-    """Metaclass for plugins to register attributes"""
+    """
+    Metaclass for plugins to register attributes.
+    
+    Every concrete plugin class is appended to the __pulp_plugins__ list of
+    the module that defines it, so the plugin manager can find a module's
+    plugins without inspecting all of its attributes. Classes that set
+    ``abstract = True`` in their body are treated as abstract bases.
+    """
     
     def __new__(mcs, name, bases, attrs):
         # Create the class
@@ -17,6 +28,8 @@ class PluginMeta(type):
             return cls
         
         # Skip validation for abstract classes (those that don't define implementations)
+        if attrs.get("abstract", False):
+            return cls
         if hasattr(cls, "__abstractmethods__") and cls.__abstractmethods__:
             return cls
             
@@ -26,6 +39,11 @@ class PluginMeta(type):
             if not hasattr(cls, attr) or getattr(cls, attr) is None:
                 raise TypeError(f"Plugin class {name} must define {attr}")
         
+        # Record the plugin in its defining module
+        module = sys.modules.get(cls.__module__)
+        if module is not None:
+            vars(module).setdefault(MODULE_PLUGINS_ATTR, []).append(cls)
+        
         return cls
 
 # Define an ABC-compatible metaclass
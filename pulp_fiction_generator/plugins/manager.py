@@ -5,7 +5,10 @@ This module provides functionality for discovering, loading, and managing plugin
 from various sources including:
 1. User-specific plugin directories (~/.pulp-fiction/plugins/)
 2. Project-local plugin directories (./plugins/)
-3. Installed Python packages with the prefix 'pulp-fiction-plugin-'
+3. Installed Python packages that declare plugin classes under the
+   'pulp_fiction.genres', 'pulp_fiction.agents' or 'pulp_fiction.models'
+   entry-point groups
+4. Installed Python packages with the prefix 'pulp-fiction-plugin-' (legacy)
 
 The plugin manager automatically discovers plugins from these sources and registers
 them with the plugin registry, making them available for use throughout the application.
@@ -29,18 +32,55 @@ Example Usage:
     ```
 """
 
-from typing import Dict, List, Type, Optional, Any
+from typing import Dict, List, Type, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import os
 import sys
+import threading
 import importlib
+import importlib.util
 import pkgutil
-import inspect
+from importlib.machinery import ModuleSpec
 from pathlib import Path
 
-from .base import BasePlugin, PluginMeta
+from .base import BasePlugin, MODULE_PLUGINS_ATTR
 from .registry import PluginRegistry
 from .exceptions import PluginLoadError, PluginValidationError
 
+logger = logging.getLogger(__name__)
+
+# Distribution name prefix of legacy plugin packages, and the translation
+# from a distribution name to its top-level module name
+_PLUGIN_PACKAGE_PREFIX = "pulp-fiction-plugin-"
+_DASH_TO_UNDERSCORE = str.maketrans("-", "_")
+
+# Upper bound on threads used to import plugin modules concurrently
+MAX_IMPORT_WORKERS = 8
+
+# Entry-point groups under which installed packages declare plugin classes
+PLUGIN_ENTRY_POINT_GROUPS = (
+    "pulp_fiction.genres",
+    "pulp_fiction.agents",
+    "pulp_fiction.models",
+)
+
+
+def _iter_entry_points(group: str):
+    """
+    Iterate over the installed entry points in a group.
+    
+    Uses the selectable ``entry_points(group=...)`` API where available and
+    falls back to the dict-based API of Python 3.8/3.9.
+    """
+    from importlib.metadata import entry_points
+    
+    try:
+        return entry_points(group=group)
+    except TypeError:
+        return entry_points().get(group, ())
+
+
 class PluginManager:
     """
     Plugin Manager for the Pulp Fiction Generator.
@@ -49,15 +89,17 @@ class PluginManager:
     from multiple sources:
     - User-specific plugins (~/.pulp-fiction/plugins/)
     - Project-local plugins (./plugins/)
+    - Installed Python packages declaring 'pulp_fiction.*' entry points
     - Installed Python packages (pulp-fiction-plugin-*)
     
-    The manager automatically discovers plugin classes within modules and registers
-    them with the plugin registry. It provides methods for retrieving plugins
-    by type or ID.
+    Entry points name plugin classes directly, so installed plugins are registered
+    without scanning module contents. Plugin classes found in directory modules
+    are discovered within those modules and registered with the plugin registry.
+    It provides methods for retrieving plugins by type or ID.
     
     Attributes:
         registry (PluginRegistry): Registry where discovered plugins are registered
-        plugin_paths (List[Path]): Paths where the manager looks for plugins
+        plugin_paths (List[Path]): Existing directories where the manager looks for plugins
     
     Methods:
         discover_plugins(): Discover and register all available plugins
@@ -67,10 +109,17 @@ class PluginManager:
     
     def __init__(self):
         self.registry = PluginRegistry()
-        self.plugin_paths = [
+        # Only directories that exist are kept, so discovery never stats missing paths
+        self.plugin_paths: List[Path] = []
+        for plugin_path in (
             Path.home() / ".pulp-fiction" / "plugins",
             Path.cwd() / "plugins",
-        ]
+        ):
+            self.add_path(plugin_path)
+        # Plugin classes found in each loaded module, so re-discovery skips the scan
+        self._module_plugins: Dict[str, List[Type[BasePlugin]]] = {}
+        # Serializes registration of plugins imported on worker threads
+        self._register_lock = threading.Lock()
         
     def discover_plugins(self) -> None:
         """
@@ -79,50 +128,167 @@ class PluginManager:
         This method searches for plugins in multiple locations:
         1. User plugin directory (~/.pulp-fiction/plugins/)
         2. Project plugin directory (./plugins/)
-        3. Installed Python packages with the prefix 'pulp-fiction-plugin-'
+        3. Entry points in the PLUGIN_ENTRY_POINT_GROUPS groups
+        4. Installed Python packages with the prefix 'pulp-fiction-plugin-'
+        
+        The directory scan is skipped entirely when none of the plugin
+        directories exist, which is the normal case for installed plugins.
         
         Each discovered plugin is validated and registered with the plugin registry.
-        Any errors during discovery are caught and logged, but don't stop the discovery process.
+        Any errors during discovery are caught and logged as warnings, but don't stop the discovery process.
         
         Returns:
             None
         """
-        # Search in user and local plugin directories
-        for plugin_path in self.plugin_paths:
-            if plugin_path.exists() and plugin_path.is_dir():
-                self._discover_in_path(plugin_path)
+        # Search in user and local plugin directories. Modules from all
+        # directories are imported together; earlier directories win when
+        # two contain a module with the same name.
+        if self.plugin_paths_present():
+            modules: Dict[str, Optional[ModuleSpec]] = {}
+            for plugin_path in self.plugin_paths:
+                for module_name, spec in self._collect_path_modules(plugin_path):
+                    modules.setdefault(module_name, spec)
+            self._load_plugin_modules(list(modules.items()))
+        
+        # Register plugin classes declared through entry points
+        self._discover_entry_point_plugins()
                 
         # Search installed packages with the pulp-fiction-plugin prefix
         self._discover_installed_plugins()
+        
+        logger.info("Registered %d plugins", len(self.registry.plugins))
     
-    def _discover_in_path(self, path: Path) -> None:
+    def add_path(self, path: Path) -> bool:
         """
-        Discover plugins in a specified directory path.
+        Add a directory to search for plugins.
         
-        Searches for Python modules or packages in the given path that may contain plugins.
-        For each discovered module/package, attempts to load it and register any plugins within.
+        The path is only added if it is an existing directory that is not
+        already being searched.
         
-        The path is temporarily added to sys.path during discovery to allow for imports.
+        Args:
+            path (Path): The directory path to add
+            
+        Returns:
+            bool: True if the path was added
+        """
+        path = Path(path)
+        if path in self.plugin_paths or not path.is_dir():
+            return False
+        
+        self.plugin_paths.append(path)
+        return True
+    
+    def plugin_paths_present(self) -> bool:
+        """
+        Check whether there are any plugin directories to search.
+        
+        Returns:
+            bool: True if at least one plugin directory exists
+        """
+        return bool(self.plugin_paths)
+    
+    def _discover_entry_point_plugins(self) -> None:
+        """
+        Discover plugins declared through package entry points.
+        
+        Each entry point in the PLUGIN_ENTRY_POINT_GROUPS groups must reference a
+        plugin class, e.g. in a plugin package's setup.py:
+        
+            entry_points={
+                "pulp_fiction.genres": ["western = my_plugin:WesternGenrePlugin"],
+            }
+        
+        Only the referenced classes are loaded and registered; the modules that
+        define them are not scanned for further plugins.
+        
+        Returns:
+            None
+        """
+        for group in PLUGIN_ENTRY_POINT_GROUPS:
+            for entry_point in _iter_entry_points(group):
+                try:
+                    plugin_class = entry_point.load()
+                    # Skip plugins already registered by an earlier discovery
+                    if self.registry.plugins.get(plugin_class.plugin_id) is plugin_class:
+                        continue
+                    self.registry.register_plugin(plugin_class)
+                except Exception as e:
+                    logger.warning("Error loading plugin entry point %s (%s): %s", entry_point.name, group, e)
+    
+    def _collect_path_modules(self, path: Path) -> List[Tuple[str, Optional[ModuleSpec]]]:
+        """
+        Find the plugin modules and packages in a directory.
+        
+        Modules are imported directly from their file locations, so sys.path is
+        never modified. Packages are resolved through the cached path importer
+        for the directory.
         
         Args:
             path (Path): The directory path to search for plugins
             
+        Returns:
+            List[Tuple[str, Optional[ModuleSpec]]]: Module names and the specs to import them from
+        """
+        try:
+            finder = pkgutil.get_importer(str(path))
+            
+            # Candidate module names mapped to the file of a flat module, or to
+            # None for a package. A package and a flat module with the same
+            # name are only loaded once, and the package wins as it does for
+            # regular imports.
+            candidates: Dict[str, Optional[str]] = {}
+            
+            # Iterate through directory entries, looking for plugin modules.
+            # DirEntry caches the file type from the directory read, so only
+            # packages need an extra stat for their __init__.py.
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir():
+                        if os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                            candidates[name] = None
+                    elif name.endswith(".py") and name != "__init__.py":
+                        candidates.setdefault(name[:-3], entry.path)
+            
+            modules = []
+            for module_name, file_path in candidates.items():
+                if file_path is None:
+                    spec = finder.find_spec(module_name)
+                else:
+                    spec = importlib.util.spec_from_file_location(module_name, file_path)
+                modules.append((module_name, spec))
+            return modules
+        except OSError as e:
+            # The directory may have been removed since it was validated
+            logger.warning("Error reading plugin directory %s: %s", path, e)
+            return []
+    
+    def _load_plugin_modules(self, modules: List[Tuple[str, Optional[ModuleSpec]]]) -> None:
+        """
+        Load several plugin modules and register their plugins.
+        
+        Importing is dominated by file I/O, so independent modules are imported
+        on a thread pool. Plugins are then registered serially, in the order the
+        modules were given.
+        
+        Args:
+            modules (List[Tuple[str, Optional[ModuleSpec]]]): Module names and specs to load
+            
         Returns:
             None
         """
-        # Add path to sys.path temporarily
-        sys.path.insert(0, str(path))
+        if len(modules) <= 1:
+            for module_name, spec in modules:
+                self._load_plugin_module(module_name, spec)
+            return
         
-        try:
-            # Iterate through directories, looking for plugin modules
-            for item in path.iterdir():
-                if item.is_dir() and (item / "__init__.py").exists():
-                    self._load_plugin_module(item.name)
-                elif item.suffix == ".py" and item.stem != "__init__":
-                    self._load_plugin_module(item.stem)
-        finally:
-            # Remove path from sys.path
-            sys.path.remove(str(path))
+        max_workers = min(MAX_IMPORT_WORKERS, os.cpu_count() or 1, len(modules))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda module: self._import_only(*module), modules))
+        
+        for (module_name, _), plugin_classes in zip(modules, results):
+            if plugin_classes is not None:
+                self._register_found_plugins(module_name, plugin_classes)
     
     def _discover_installed_plugins(self) -> None:
         """
@@ -133,7 +299,9 @@ class PluginManager:
         and register any plugins it contains.
         
         This method uses pkg_resources to find installed packages. If pkg_resources
-        is not available, this discovery method is skipped.
+        is not available, this discovery method is skipped. New plugins should
+        declare entry points instead, which avoids walking every installed
+        distribution.
         
         Returns:
             None
@@ -142,18 +310,19 @@ class PluginManager:
             import pkg_resources
             
             for dist in pkg_resources.working_set:
-                if dist.project_name.startswith("pulp-fiction-plugin-"):
-                    try:
-                        # Load the plugin module
-                        module_name = dist.project_name.replace("-", "_")
-                        self._load_plugin_module(module_name)
-                    except Exception as e:
-                        print(f"Error loading plugin package {dist.project_name}: {e}")
+                name = dist.project_name
+                if not name.startswith(_PLUGIN_PACKAGE_PREFIX):
+                    continue
+                try:
+                    # Load the plugin module
+                    self._load_plugin_module(name.translate(_DASH_TO_UNDERSCORE))
+                except Exception as e:
+                    logger.warning("Error loading plugin package %s: %s", name, e)
         except ImportError:
             # pkg_resources not available, skip this discovery method
             pass
     
-    def _load_plugin_module(self, module_name: str) -> None:
+    def _load_plugin_module(self, module_name: str, spec: Optional[ModuleSpec] = None) -> None:
         """
         Load a plugin module and register its plugins.
         
@@ -164,35 +333,127 @@ class PluginManager:
         1. Be actual classes (not functions or other objects)
         2. Use the PluginMeta metaclass (inherit from BasePlugin)
         3. Be defined in the module (not imported)
-        4. Not be BasePlugin itself
+        4. Be concrete (not BasePlugin, a plugin base class or abstract)
+        
+        Modules that are already imported are taken from sys.modules without
+        going through the import machinery, and the plugin classes found in a
+        module are cached so that discovering plugins again does not rescan it.
         
         Args:
             module_name (str): The name of the module to load
+            spec (Optional[ModuleSpec]): Spec to import the module from; if None
+                                         the module is imported by name
             
         Returns:
             None
         """
-        try:
-            module = importlib.import_module(module_name)
+        plugin_classes = self._import_only(module_name, spec)
+        if plugin_classes is not None:
+            self._register_found_plugins(module_name, plugin_classes)
+    
+    def _import_only(
+        self,
+        module_name: str,
+        spec: Optional[ModuleSpec] = None
+    ) -> Optional[List[Type[BasePlugin]]]:
+        """
+        Import a plugin module and find its plugin classes without registering them.
+        
+        Safe to call from worker threads. Import errors are logged and reported
+        by returning None, so one broken plugin does not affect the others.
+        
+        Args:
+            module_name (str): The name of the module to load
+            spec (Optional[ModuleSpec]): Spec to import the module from; if None
+                                         the module is imported by name
             
-            # Look for plugin classes in the module
-            for item_name in dir(module):
-                item = getattr(module, item_name)
+        Returns:
+            Optional[List[Type[BasePlugin]]]: The plugin classes, or None if the import failed
+        """
+        try:
+            plugin_classes = self._module_plugins.get(module_name)
+            if plugin_classes is None:
+                modules = sys.modules
+                module = modules.get(module_name)
+                if module is None:
+                    if spec is not None:
+                        module = self._import_from_spec(spec)
+                    else:
+                        module = importlib.import_module(module_name)
                 
-                # Check if the item is a plugin class
-                if (inspect.isclass(item) and 
-                    isinstance(item, PluginMeta) and 
-                    item.__module__ == module.__name__ and
-                    item is not BasePlugin):
-                    
-                    try:
-                        # Register the plugin
-                        self.registry.register_plugin(item)
-                    except Exception as e:
-                        print(f"Error registering plugin {item_name} from {module_name}: {e}")
+                # Look for plugin classes defined in the module
+                plugin_classes = self._module_plugins[module_name] = self._find_plugin_classes(module)
+            return plugin_classes
         
         except Exception as e:
-            print(f"Error loading plugin module {module_name}: {e}")
+            logger.warning("Error loading plugin module %s: %s", module_name, e)
+            return None
+    
+    def _register_found_plugins(self, module_name: str, plugin_classes: List[Type[BasePlugin]]) -> None:
+        """
+        Register the plugin classes found in a module.
+        
+        Args:
+            module_name (str): The name of the module the plugins come from
+            plugin_classes (List[Type[BasePlugin]]): The plugin classes to register
+            
+        Returns:
+            None
+        """
+        with self._register_lock:
+            for item in plugin_classes:
+                # Skip plugins already registered by an earlier discovery
+                if self.registry.plugins.get(item.plugin_id) is item:
+                    continue
+                    
+                try:
+                    # Register the plugin
+                    self.registry.register_plugin(item)
+                except Exception as e:
+                    logger.warning("Error registering plugin %s from %s: %s", item.__name__, module_name, e)
+    
+    @staticmethod
+    def _import_from_spec(spec: ModuleSpec):
+        """
+        Import a module from its spec and add it to sys.modules.
+        
+        Args:
+            spec (ModuleSpec): The spec of the module to import
+            
+        Returns:
+            The imported module
+            
+        Raises:
+            PluginLoadError: If no loader is available for the module
+        """
+        if spec is None or spec.loader is None:
+            raise PluginLoadError("No loader found for plugin module")
+        
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(spec.name, None)
+            raise
+        return module
+    
+    @staticmethod
+    def _find_plugin_classes(module) -> List[Type[BasePlugin]]:
+        """
+        Find the plugin classes defined in a module.
+        
+        PluginMeta records every concrete plugin class in the __pulp_plugins__
+        list of its defining module, so the module's other attributes are
+        never inspected.
+        
+        Args:
+            module: The imported module to inspect
+            
+        Returns:
+            List[Type[BasePlugin]]: Plugin classes defined in the module
+        """
+        return list(getattr(module, MODULE_PLUGINS_ATTR, ()))
     
     def get_plugins(self, plugin_type: Optional[Type] = None) -> List[Type[BasePlugin]]:
         """
@@ -2,15 +2,28 @@
 Registry for plugins.
 """
 
+import logging
 from typing import Dict, List, Type, Optional
 from .base import BasePlugin, GenrePlugin, AgentPlugin, ModelPlugin
 from .exceptions import PluginRegistrationError, PluginNotFoundError
 
+logger = logging.getLogger(__name__)
+
 class PluginRegistry:
     """Registry for plugins"""
     
+    __slots__ = ("plugins", "_by_base", "_cached_all")
+    
     def __init__(self):
         self.plugins: Dict[str, Type[BasePlugin]] = {}
+        # Plugins bucketed by plugin base class, filled in at registration time
+        self._by_base: Dict[Type[BasePlugin], List[Type[BasePlugin]]] = {
+            GenrePlugin: [],
+            AgentPlugin: [],
+            ModelPlugin: [],
+        }
+        # List of all plugins returned by get_plugins(), rebuilt after registration
+        self._cached_all: Optional[List[Type[BasePlugin]]] = None
         
     def register_plugin(self, plugin_class: Type[BasePlugin]) -> None:
         """Register a plugin class"""
@@ -25,19 +38,39 @@ class PluginRegistry:
         
         # Register the plugin
         self.plugins[plugin_id] = plugin_class
+        self._cached_all = None
+        for base, bucket in self._by_base.items():
+            if issubclass(plugin_class, base):
+                bucket.append(plugin_class)
         
-        print(f"Registered plugin: {plugin_class.plugin_name} ({plugin_id})")
+        logger.debug("Registered plugin: %s (%s)", plugin_class.plugin_name, plugin_id)
     
     def get_plugins(self, plugin_type: Optional[Type] = None) -> List[Type[BasePlugin]]:
-        """Get all registered plugins, optionally filtered by type"""
+        """
+        Get all registered plugins, optionally filtered by type.
+        
+        The unfiltered list is cached and shared between calls until another
+        plugin is registered, so it must not be modified by callers; use
+        get_plugins_snapshot() for a list that can be changed.
+        """
         if plugin_type is None:
-            return list(self.plugins.values())
+            if self._cached_all is None:
+                self._cached_all = list(self.plugins.values())
+            return self._cached_all
+        
+        bucket = self._by_base.get(plugin_type)
+        if bucket is not None:
+            return list(bucket)
         
         return [
             plugin for plugin in self.plugins.values()
             if issubclass(plugin, plugin_type)
         ]
     
+    def get_plugins_snapshot(self, plugin_type: Optional[Type] = None) -> List[Type[BasePlugin]]:
+        """Get a copy of the registered plugins that callers may modify"""
+        return list(self.get_plugins(plugin_type))
+    
     def get_plugin(self, plugin_id: str) -> Type[BasePlugin]:
         """Get a specific plugin by ID"""
         if plugin_id not in self.plugins:
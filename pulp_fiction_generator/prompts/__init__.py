@@ -5,7 +5,7 @@ Prompt templates and management for the Pulp Fiction Generator.
 from pulp_fiction_generator.prompts.templates import (
     PromptTemplate,
     PromptLibrary,
-    prompt_library
+    get_prompt_library
 )
 from pulp_fiction_generator.prompts.genre_templates import (
     register_genre_templates,
@@ -25,6 +25,7 @@ from pulp_fiction_generator.prompts.custom_templates import (
 from pulp_fiction_generator.prompts.utility import (
     save_prompt_context,
     load_prompt_context,
+    load_prompt_context_keys,
     save_template,
     load_template,
     save_library,
@@ -34,14 +35,20 @@ from pulp_fiction_generator.prompts.utility import (
     validate_context
 )
 
-# Initialize genre templates
-register_genre_templates(prompt_library)
+
+def __getattr__(name):
+    """Create the shared prompt_library on first access."""
+    if name == "prompt_library":
+        return get_prompt_library()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Core prompt template system
     "PromptTemplate", 
     "PromptLibrary", 
     "prompt_library",
+    "get_prompt_library",
     
     # Genre template registration functions
     "register_genre_templates",
@@ -61,6 +68,7 @@ __all__ = [
     # Utility functions
     "save_prompt_context",
     "load_prompt_context",
+    "load_prompt_context_keys",
     "save_template",
     "load_template",
     "save_library",
@@ -5,9 +5,10 @@ This module provides utilities for creating and registering custom prompt templa
 for different genres and agent types beyond the predefined ones.
 """
 
+from types import MappingProxyType
 from typing import Dict, Optional
 
-from pulp_fiction_generator.prompts.templates import PromptLibrary, PromptTemplate
+from pulp_fiction_generator.prompts.templates import AGENT_TYPES, PromptLibrary, PromptTemplate
 
 
 def create_custom_genre(
@@ -51,24 +52,14 @@ def register_custom_genre(
         genre_name: The name of the genre
         context: The genre context dictionary
     """
-    # Agent types to create templates for
-    agent_types = [
-        "researcher",
-        "worldbuilder",
-        "character_creator",
-        "plotter",
-        "writer",
-        "editor"
-    ]
-    
     # Create and register templates for each agent type
-    for agent_type in agent_types:
+    for agent_type in AGENT_TYPES:
         try:
             # Get the base template
             base_template = library.get_template(agent_type, "base")
             
-            # Create a new template with the same template string but with default variables
-            genre_template = PromptTemplate(base_template.template_str, context)
+            # Create a new template sharing the base template string but with default variables
+            genre_template = PromptTemplate.from_base(base_template, context)
             
             # Add the genre-specific template
             library.add_template(agent_type, genre_name, genre_template)
@@ -127,8 +118,8 @@ def create_custom_agent_type(
     return create_custom_template(library, agent_type, "base", base_template, default_variables)
 
 
-# Example custom genre creation
-example_cyberpunk = {
+# Example custom genre creation (read-only, pass as create_custom_genre(**example_cyberpunk))
+example_cyberpunk = MappingProxyType({
     "name": "cyberpunk",
     "instructions": """
     Create high-tech, low-life cyberpunk pulp fiction. Emphasize:
@@ -143,4 +134,4 @@ example_cyberpunk = {
     Include vivid sensory descriptions of the neon-lit, overcrowded,
     technologically saturated world.
     """
-} 
\ No newline at end of file
+}) 
\ No newline at end of file
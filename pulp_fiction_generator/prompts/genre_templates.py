@@ -6,37 +6,16 @@ pulp fiction genres, extending the base templates with genre-specific
 instructions and details.
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
 
-from pulp_fiction_generator.prompts.templates import PromptLibrary, PromptTemplate
+from pulp_fiction_generator.prompts.templates import AGENT_TYPES, PromptLibrary, PromptTemplate
 
 
-def register_genre_templates(library: PromptLibrary) -> None:
-    """
-    Register genre-specific templates with the prompt library.
-    
-    Args:
-        library: The prompt library to register templates with
-    """
-    # Register noir templates
-    register_noir_templates(library)
-    
-    # Register hardboiled detective templates
-    register_hardboiled_templates(library)
-    
-    # Register sci-fi templates
-    register_scifi_templates(library)
-    
-    # Register western templates 
-    register_western_templates(library)
-    
-    # Register horror templates
-    register_horror_templates(library)
-
-
-def register_noir_templates(library: PromptLibrary) -> None:
-    """Register noir-specific templates."""
-    noir_context = {
+# Default template variables for each built-in genre, keyed by template name.
+# The contexts are shared by every template built from them, so they are read-only.
+_GENRE_CONTEXTS: Dict[str, Mapping[str, str]] = {
+    "noir": MappingProxyType({
         "genre": "noir",
         "genre_specific_instructions": """
         Focus on the dark, cynical atmosphere of noir fiction. Emphasize:
@@ -50,20 +29,8 @@ def register_noir_templates(library: PromptLibrary) -> None:
         Classic noir stories often involve crime, betrayal, and doomed romance.
         Authenticity is critical - don't sanitize the grim realities of the noir world.
         """
-    }
-    
-    # Add genre-specific templates for each agent role
-    _add_genre_template(library, "researcher", "noir", noir_context)
-    _add_genre_template(library, "worldbuilder", "noir", noir_context)
-    _add_genre_template(library, "character_creator", "noir", noir_context)
-    _add_genre_template(library, "plotter", "noir", noir_context)
-    _add_genre_template(library, "writer", "noir", noir_context)
-    _add_genre_template(library, "editor", "noir", noir_context)
-
-
-def register_hardboiled_templates(library: PromptLibrary) -> None:
-    """Register hardboiled detective-specific templates."""
-    hardboiled_context = {
+    }),
+    "hardboiled": MappingProxyType({
         "genre": "hardboiled detective",
         "genre_specific_instructions": """
         Capture the tough, unsentimental style of hardboiled detective fiction. Focus on:
@@ -77,20 +44,8 @@ def register_hardboiled_templates(library: PromptLibrary) -> None:
         The detective should be flawed but principled in their own way, operating 
         in a world where justice and the law don't always align.
         """
-    }
-    
-    # Add genre-specific templates for each agent role
-    _add_genre_template(library, "researcher", "hardboiled", hardboiled_context)
-    _add_genre_template(library, "worldbuilder", "hardboiled", hardboiled_context)
-    _add_genre_template(library, "character_creator", "hardboiled", hardboiled_context)
-    _add_genre_template(library, "plotter", "hardboiled", hardboiled_context)
-    _add_genre_template(library, "writer", "hardboiled", hardboiled_context)
-    _add_genre_template(library, "editor", "hardboiled", hardboiled_context)
-
-
-def register_scifi_templates(library: PromptLibrary) -> None:
-    """Register science fiction-specific templates."""
-    scifi_context = {
+    }),
+    "scifi": MappingProxyType({
         "genre": "science fiction",
         "genre_specific_instructions": """
         Create pulp sci-fi in the tradition of the golden age magazines. Emphasize:
@@ -104,20 +59,8 @@ def register_scifi_templates(library: PromptLibrary) -> None:
         Focus on the adventure and excitement rather than hard scientific accuracy.
         Embrace the optimism or cautionary themes common in classic pulp sci-fi.
         """
-    }
-    
-    # Add genre-specific templates for each agent role
-    _add_genre_template(library, "researcher", "scifi", scifi_context)
-    _add_genre_template(library, "worldbuilder", "scifi", scifi_context)
-    _add_genre_template(library, "character_creator", "scifi", scifi_context)
-    _add_genre_template(library, "plotter", "scifi", scifi_context)
-    _add_genre_template(library, "writer", "scifi", scifi_context)
-    _add_genre_template(library, "editor", "scifi", scifi_context)
-
-
-def register_western_templates(library: PromptLibrary) -> None:
-    """Register western-specific templates."""
-    western_context = {
+    }),
+    "western": MappingProxyType({
         "genre": "western",
         "genre_specific_instructions": """
         Capture the rugged frontier spirit of pulp westerns. Focus on:
@@ -132,20 +75,8 @@ def register_western_templates(library: PromptLibrary) -> None:
         good vs. evil narratives. Characters should have clear motivations
         shaped by the harsh realities of frontier life.
         """
-    }
-    
-    # Add genre-specific templates for each agent role
-    _add_genre_template(library, "researcher", "western", western_context)
-    _add_genre_template(library, "worldbuilder", "western", western_context)
-    _add_genre_template(library, "character_creator", "western", western_context)
-    _add_genre_template(library, "plotter", "western", western_context)
-    _add_genre_template(library, "writer", "western", western_context)
-    _add_genre_template(library, "editor", "western", western_context)
-
-
-def register_horror_templates(library: PromptLibrary) -> None:
-    """Register horror-specific templates."""
-    horror_context = {
+    }),
+    "horror": MappingProxyType({
         "genre": "horror",
         "genre_specific_instructions": """
         Create unsettling, atmospheric horror in the pulp tradition. Focus on:
@@ -160,37 +91,115 @@ def register_horror_templates(library: PromptLibrary) -> None:
         and the unknown, using suggestion and atmosphere as much as explicit
         descriptions of horror elements.
         """
-    }
+    }),
+}
+
+
+def register_genre_templates(library: PromptLibrary) -> None:
+    """
+    Register genre-specific templates with the prompt library.
     
-    # Add genre-specific templates for each agent role
-    _add_genre_template(library, "researcher", "horror", horror_context)
-    _add_genre_template(library, "worldbuilder", "horror", horror_context)
-    _add_genre_template(library, "character_creator", "horror", horror_context)
-    _add_genre_template(library, "plotter", "horror", horror_context)
-    _add_genre_template(library, "writer", "horror", horror_context)
-    _add_genre_template(library, "editor", "horror", horror_context)
+    Args:
+        library: The prompt library to register templates with
+    """
+    base_templates = _get_base_templates(library)
+    for genre_name in _GENRE_CONTEXTS:
+        _register_one(library, genre_name, base_templates)
+
+
+def register_noir_templates(library: PromptLibrary) -> None:
+    """Register noir-specific templates."""
+    _register_one(library, "noir")
+
+
+def register_hardboiled_templates(library: PromptLibrary) -> None:
+    """Register hardboiled detective-specific templates."""
+    _register_one(library, "hardboiled")
+
+
+def register_scifi_templates(library: PromptLibrary) -> None:
+    """Register science fiction-specific templates."""
+    _register_one(library, "scifi")
+
+
+def register_western_templates(library: PromptLibrary) -> None:
+    """Register western-specific templates."""
+    _register_one(library, "western")
+
+
+def register_horror_templates(library: PromptLibrary) -> None:
+    """Register horror-specific templates."""
+    _register_one(library, "horror")
+
+
+def _get_base_templates(library: PromptLibrary) -> Callable[[str], PromptTemplate]:
+    """
+    Create a lookup of base templates that fetches each agent type's template once.
+    
+    The base templates are lazy themselves, so they are only fetched when the
+    first genre template of an agent type is built.
+    
+    Args:
+        library: The prompt library to read the base templates from
+        
+    Returns:
+        A function returning the base template of an agent type
+    """
+    base_templates: Dict[str, PromptTemplate] = {}
+    
+    def get_base_template(agent_type: str) -> PromptTemplate:
+        template = base_templates.get(agent_type)
+        if template is None:
+            template = base_templates[agent_type] = library.get_template(agent_type, "base")
+        return template
+    
+    return get_base_template
+
+
+def _register_one(
+    library: PromptLibrary,
+    genre_name: str,
+    base_templates: Optional[Callable[[str], PromptTemplate]] = None
+) -> None:
+    """
+    Register the templates of one built-in genre for every agent role.
+    
+    Args:
+        library: The prompt library to register templates with
+        genre_name: The key of the genre in _GENRE_CONTEXTS
+        base_templates: Base template lookup from _get_base_templates, created if not given
+    """
+    if base_templates is None:
+        base_templates = _get_base_templates(library)
+        
+    context = _GENRE_CONTEXTS[genre_name]
+    for agent_type in AGENT_TYPES:
+        _add_genre_template(library, base_templates, agent_type, genre_name, context)
 
 
 def _add_genre_template(
     library: PromptLibrary, 
+    base_templates: Callable[[str], PromptTemplate],
     agent_type: str, 
     genre_name: str, 
-    context: Dict[str, str]
+    context: Mapping[str, str]
 ) -> None:
     """
-    Add a genre-specific template based on the base template.
+    Register a genre-specific template based on the base template.
+    
+    The template is registered lazily and only built when it is first
+    requested from the library.
     
     Args:
         library: The prompt library to add to
+        base_templates: Base template lookup from _get_base_templates
         agent_type: The agent type to add a template for
         genre_name: The name of the genre
         context: The context to initialize the template with
     """
-    # Get the base template
-    base_template = library.get_template(agent_type, "base")
-    
-    # Create a new template with the same template string but with default variables
-    genre_template = PromptTemplate(base_template.template_str, context)
-    
-    # Add the genre-specific template
-    library.add_template(agent_type, genre_name, genre_template) 
\ No newline at end of file
+    # Create a new template with the base template string but with default variables
+    library.register_lazy(
+        agent_type,
+        genre_name,
+        lambda: PromptTemplate.from_base(base_templates(agent_type), context)
+    ) 
\ No newline at end of file
@@ -2,8 +2,132 @@
 Template system for generating prompts.
 """
 
+import sys
+import textwrap
+from collections import OrderedDict
+from functools import lru_cache
 from string import Template
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+
+# Marks placeholders without a value
+_MISSING = object()
+
+
+class CompiledTemplate:
+    """
+    Parsed form of a template string, shared by every PromptTemplate built from it.
+    
+    The template string is dedented and stripped, so the indentation of
+    triple-quoted templates does not end up in every rendered prompt. It is
+    then split once into literal text and placeholder slots,
+    so substitution is a list fill and a join instead of a regex scan of the
+    whole template on every render. Substitution follows the rules of
+    string.Template.safe_substitute.
+    
+    Attributes:
+        source: The dedented template string
+        template: The equivalent string.Template
+        placeholders: Placeholder names in order of first appearance
+        required: The placeholder names as a set, for validating contexts
+    """
+    
+    __slots__ = ("source", "template", "placeholders", "required", "_parts", "_fields")
+    
+    def __init__(self, template_str: str):
+        """
+        Parse a template string.
+        
+        Args:
+            template_str: The template string with $variable placeholders
+        """
+        template_str = self.source = textwrap.dedent(template_str).strip()
+        self.template = Template(template_str)
+        
+        # Literal text with a slot for each placeholder, and the
+        # (slot index, name, original text) of every placeholder
+        parts: List[str] = []
+        fields: List[Tuple[int, str, str]] = []
+        literal: List[str] = []
+        position = 0
+        for match in self.template.pattern.finditer(template_str):
+            literal.append(template_str[position:match.start()])
+            position = match.end()
+            name = match.group("named") or match.group("braced")
+            if name is not None:
+                # Templates share placeholder names, so keep one copy of each
+                name = sys.intern(name)
+                parts.append("".join(literal))
+                literal = []
+                fields.append((len(parts), name, match.group()))
+                parts.append(match.group())
+            elif match.group("escaped") is not None:
+                literal.append(template_str[match.start()])
+            else:
+                # Invalid placeholders are kept as they are
+                literal.append(match.group())
+        literal.append(template_str[position:])
+        parts.append("".join(literal))
+        
+        self._parts: Tuple[str, ...] = tuple(parts)
+        self._fields: Tuple[Tuple[int, str, str], ...] = tuple(fields)
+        self.placeholders: Tuple[str, ...] = tuple(dict.fromkeys(name for _, name, _ in fields))
+        self.required: FrozenSet[str] = frozenset(self.placeholders)
+        
+    def substitute(self, mapping: Mapping[str, Any]) -> str:
+        """
+        Substitute placeholders, leaving those missing from the mapping untouched.
+        
+        Args:
+            mapping: Values for the placeholders
+            
+        Returns:
+            The template string with placeholders substituted
+        """
+        parts = list(self._parts)
+        for index, name, original in self._fields:
+            value = mapping.get(name, _MISSING)
+            if value is not _MISSING:
+                parts[index] = str(value)
+        return "".join(parts)
+
+
+# Number of rendered prompts each PromptTemplate keeps
+RENDER_CACHE_SIZE = 128
+
+# Number of template strings whose compiled form is kept
+COMPILED_CACHE_SIZE = 256
+
+# Compiled templates keyed by template string, both as given and dedented;
+# genre templates and reloaded libraries reuse the same strings, so each
+# distinct template is only dedented and parsed once.
+_COMPILED_CACHE: "OrderedDict[str, CompiledTemplate]" = OrderedDict()
+
+
+def compile_template(template_str: str) -> CompiledTemplate:
+    """
+    Get the compiled form of a template string, parsing it on first use.
+    
+    Args:
+        template_str: The template string with $variable placeholders
+        
+    Returns:
+        The shared compiled template
+    """
+    cache = _COMPILED_CACHE
+    compiled = cache.get(template_str)
+    if compiled is not None:
+        cache.move_to_end(template_str)
+        return compiled
+        
+    compiled = CompiledTemplate(template_str)
+    # Saved templates hold the dedented text, so share the entry with them
+    compiled = cache.setdefault(compiled.source, compiled)
+    cache.move_to_end(compiled.source)
+    cache[template_str] = compiled
+    while len(cache) > COMPILED_CACHE_SIZE:
+        cache.popitem(last=False)
+    return compiled
 
 
 class PromptTemplate:
@@ -11,38 +135,99 @@ class PromptTemplate:
     Template for generating prompts with variable substitution.
     
     This class provides a simple template system for creating prompts
-    with variable substitution using Python's string.Template.
+    with $variable substitution following Python's string.Template. Templates
+    built from the same string share one compiled template, and recently
+    rendered prompts are cached per template.
     """
     
-    def __init__(self, template: str, variables: Optional[Dict[str, str]] = None):
+    def __init__(self, template: str, variables: Optional[Mapping[str, str]] = None):
         """
         Initialize a prompt template.
         
         Args:
-            template: The template string with $variable placeholders
-            variables: Optional default values for variables
+            template: The template string with $variable placeholders; common
+                      leading indentation and surrounding blank space are removed
+            variables: Optional default values for variables. The mapping is
+                       kept by reference, not copied, so shared contexts should
+                       be read-only (e.g. types.MappingProxyType).
         """
-        self.template_str = template
-        self.template = Template(template)
+        compiled = compile_template(template)
+        self.template_str = compiled.source
+        self.compiled = compiled
+        self.template = compiled.template
+        self.placeholders = compiled.placeholders
+        self.required = compiled.required
         self.variables = variables or {}
+        self._render_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+        
+    @classmethod
+    def from_base(
+        cls,
+        base_template: "PromptTemplate",
+        variables: Optional[Mapping[str, str]] = None
+    ) -> "PromptTemplate":
+        """
+        Create a template that shares another template's parsed template string.
+        
+        Args:
+            base_template: The template whose template string is reused
+            variables: Optional default values for variables
+            
+        Returns:
+            A new template with the base template's text and the given variables
+        """
+        template = cls.__new__(cls)
+        template.template_str = base_template.template_str
+        template.compiled = base_template.compiled
+        template.template = base_template.template
+        template.placeholders = base_template.placeholders
+        template.required = base_template.required
+        template.variables = variables or {}
+        template._render_cache = OrderedDict()
+        return template
         
     def render(self, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Render the template with the provided context.
         
+        The output only depends on the string forms of the template's
+        placeholder values, so renders are cached by those strings. Keying on
+        the strings keeps values that compare equal but render differently,
+        such as 1, 1.0 and True, apart.
+        
         Args:
             context: Dictionary of variables to substitute in the template
             
         Returns:
             The rendered template with variables substituted
         """
-        # Combine default variables with context
-        combined_context = {**self.variables}
-        if context:
-            combined_context.update(context)
+        # Combine default variables with context, copying only when both are set
+        if not context:
+            combined_context = self.variables
+        elif not self.variables:
+            combined_context = context
+        else:
+            combined_context = {**self.variables, **context}
+        
+        key = tuple(
+            _MISSING if value is _MISSING else str(value)
+            for value in (combined_context.get(name, _MISSING) for name in self.placeholders)
+        )
+        cache = self._render_cache
+        rendered = cache.get(key)
+        if rendered is not None:
+            cache.move_to_end(key)
+            return rendered
             
         # Substitute variables in the template
-        return self.template.safe_substitute(combined_context)
+        rendered = cache[key] = self.compiled.substitute(combined_context)
+        if len(cache) > RENDER_CACHE_SIZE:
+            cache.popitem(last=False)
+        return rendered
+    
+    def clear_cache(self) -> None:
+        """Discard the cached rendered prompts."""
+        self._render_cache.clear()
     
     def __str__(self) -> str:
         """
@@ -54,25 +239,48 @@ class PromptTemplate:
         return self.template_str
 
 
+# Agent types that have a base template in every PromptLibrary
+AGENT_TYPES = (
+    "researcher",
+    "worldbuilder",
+    "character_creator",
+    "plotter",
+    "writer",
+    "editor",
+)
+
+
 class PromptLibrary:
     """
     Library of prompt templates for different agent types and genres.
+    
+    Templates can be added directly with add_template, or registered lazily
+    with register_lazy, in which case the template is only built the first
+    time it is requested.
     """
     
     def __init__(self):
         """Initialize the prompt library with base templates."""
         self.templates: Dict[str, Dict[str, PromptTemplate]] = {}
+        # The same templates keyed by (agent type, template name) for lookups
+        self._flat_templates: Dict[Tuple[str, str], PromptTemplate] = {}
+        self._lazy_templates: Dict[str, Dict[str, Callable[[], PromptTemplate]]] = {}
         
-        # Initialize with base templates for each agent type
+        # Register base templates for each agent type
         self._initialize_base_templates()
         
     def _initialize_base_templates(self) -> None:
-        """Initialize base templates for each agent type."""
+        """
+        Register base templates for each agent type.
+        
+        The templates are registered lazily, so only the agent types that are
+        actually used get their template parsed.
+        """
         # Researcher agent
-        self.add_template(
+        self.register_lazy(
             "researcher",
             "base",
-            PromptTemplate(
+            lambda: PromptTemplate(
                 """
                 You are a $role focused on researching $genre pulp fiction.
                 
@@ -98,10 +306,10 @@ class PromptLibrary:
         )
         
         # WorldBuilder agent
-        self.add_template(
+        self.register_lazy(
             "worldbuilder",
             "base",
-            PromptTemplate(
+            lambda: PromptTemplate(
                 """
                 You are a $role responsible for creating the world for a $genre pulp fiction story.
                 
@@ -129,10 +337,10 @@ class PromptLibrary:
         )
         
         # Character Creator agent
-        self.add_template(
+        self.register_lazy(
             "character_creator",
             "base",
-            PromptTemplate(
+            lambda: PromptTemplate(
                 """
                 You are a $role tasked with creating characters for a $genre pulp fiction story.
                 
@@ -168,10 +376,10 @@ class PromptLibrary:
         )
         
         # Plotter agent
-        self.add_template(
+        self.register_lazy(
             "plotter",
             "base",
-            PromptTemplate(
+            lambda: PromptTemplate(
                 """
                 You are a $role responsible for developing the plot for a $genre pulp fiction story.
                 
@@ -205,10 +413,10 @@ class PromptLibrary:
         )
         
         # Writer agent
-        self.add_template(
+        self.register_lazy(
             "writer",
             "base",
-            PromptTemplate(
+            lambda: PromptTemplate(
                 """
                 You are a $role tasked with writing a $genre pulp fiction story.
                 
@@ -246,10 +454,10 @@ class PromptLibrary:
         )
         
         # Editor agent
-        self.add_template(
+        self.register_lazy(
             "editor",
             "base",
-            PromptTemplate(
+            lambda: PromptTemplate(
                 """
                 You are a $role responsible for refining a $genre pulp fiction story.
                 
@@ -289,12 +497,45 @@ class PromptLibrary:
             template_name: The name of the template
             template: The template object
         """
+        agent_type = sys.intern(agent_type)
+        template_name = sys.intern(template_name)
+        
         # Initialize the agent type dictionary if it doesn't exist
         if agent_type not in self.templates:
             self.templates[agent_type] = {}
             
-        # Add the template
+        # Add the template, replacing any pending lazy registration
         self.templates[agent_type][template_name] = template
+        self._flat_templates[(agent_type, template_name)] = template
+        self._lazy_templates.get(agent_type, {}).pop(template_name, None)
+        
+    def register_lazy(
+        self,
+        agent_type: str,
+        template_name: str,
+        factory: Callable[[], PromptTemplate]
+    ) -> None:
+        """
+        Register a template that is built on first access.
+        
+        Args:
+            agent_type: The type of agent the template is for
+            template_name: The name of the template
+            factory: Callable returning the template object when first requested
+        """
+        agent_type = sys.intern(agent_type)
+        template_name = sys.intern(template_name)
+        
+        if agent_type not in self._lazy_templates:
+            self._lazy_templates[agent_type] = {}
+            
+        self._lazy_templates[agent_type][template_name] = factory
+        
+    def materialize_templates(self) -> None:
+        """Build every lazily registered template so that self.templates is complete."""
+        for agent_type, factories in list(self._lazy_templates.items()):
+            for template_name in list(factories):
+                self.get_template(agent_type, template_name)
         
     def get_template(self, agent_type: str, template_name: str = "base") -> PromptTemplate:
         """
@@ -310,13 +551,22 @@ class PromptLibrary:
         Raises:
             ValueError: If the template is not found
         """
-        if agent_type not in self.templates:
-            raise ValueError(f"No templates found for agent type: {agent_type}")
+        try:
+            return self._flat_templates[(agent_type, template_name)]
+        except KeyError:
+            pass
             
-        if template_name not in self.templates[agent_type]:
-            raise ValueError(f"No template named '{template_name}' found for agent type: {agent_type}")
+        # Build a lazily registered template on first access
+        factories = self._lazy_templates.get(agent_type, {})
+        if template_name in factories:
+            template = factories[template_name]()
+            self.add_template(agent_type, template_name, template)
+            return template
             
-        return self.templates[agent_type][template_name]
+        if agent_type not in self.templates and agent_type not in self._lazy_templates:
+            raise ValueError(f"No templates found for agent type: {agent_type}")
+            
+        raise ValueError(f"No template named '{template_name}' found for agent type: {agent_type}")
     
     def generate_prompt(
         self, 
@@ -339,5 +589,26 @@ class PromptLibrary:
         return template.render(context)
 
 
-# Create a singleton instance
-prompt_library = PromptLibrary() 
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_prompt_library() -> PromptLibrary:
+    """
+    Get the shared prompt library, creating it on first use.
+    
+    The shared library includes the built-in genre templates.
+    
+    Returns:
+        The shared prompt library
+    """
+    # Imported here because genre_templates imports this module
+    from pulp_fiction_generator.prompts.genre_templates import register_genre_templates
+    
+    library = PromptLibrary()
+    register_genre_templates(library)
+    return library
+
+
+def __getattr__(name: str) -> Any:
+    """Create the shared prompt_library on first access."""
+    if name == "prompt_library":
+        return get_prompt_library()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,11 +7,40 @@ prompt templates and context data.
 
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from pulp_fiction_generator.prompts.templates import PromptLibrary, PromptTemplate
 
+# orjson is an optional, faster drop-in for the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson is optional and lets load_prompt_context_keys stream large files
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Name of the single file save_library writes a whole library to
+LIBRARY_FILENAME = "library.json"
+
+# Matches $placeholder and ${placeholder}
+_PLACEHOLDER_RE = re.compile(r'\$\{?([A-Za-z_][A-Za-z0-9_]*)\}?')
+
+# Number of template strings whose placeholders are remembered
+PLACEHOLDER_CACHE_SIZE = 256
+
+# Maximum number of template files read concurrently by load_library
+MAX_LOAD_WORKERS = 8
+
 
 def save_prompt_context(
     context: Dict[str, Any], 
@@ -21,6 +50,9 @@ def save_prompt_context(
     """
     Save prompt context (variables) to a JSON file.
     
+    The file is written next to the target and then moved into place, so
+    the target never holds a partially written context.
+    
     Args:
         context: The context dictionary to save
         filepath: The path to save to
@@ -29,13 +61,27 @@ def save_prompt_context(
     # Ensure directory exists
     path = Path(filepath)
     path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
     
-    # Save to file
-    with open(path, 'w') as f:
-        if pretty:
-            json.dump(context, f, indent=2)
+    # Save to a temporary file
+    try:
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(context, option=option))
         else:
-            json.dump(context, f)
+            with open(tmp_path, 'w') as f:
+                if pretty:
+                    json.dump(context, f, indent=2)
+                else:
+                    json.dump(context, f)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    
+    os.replace(tmp_path, path)
 
 
 def load_prompt_context(filepath: Union[str, Path]) -> Dict[str, Any]:
@@ -52,10 +98,56 @@ def load_prompt_context(filepath: Union[str, Path]) -> Dict[str, Any]:
         FileNotFoundError: If the file doesn't exist
         json.JSONDecodeError: If the file contains invalid JSON
     """
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    
     with open(filepath, 'r') as f:
         return json.load(f)
 
 
+def load_prompt_context_keys(
+    filepath: Union[str, Path],
+    keys: Iterable[str]
+) -> Dict[str, Any]:
+    """
+    Load only some top-level keys of a prompt context JSON file.
+    
+    With ijson installed the file is streamed, so only the requested values
+    are kept in memory and reading stops once all of them have been found.
+    This is slower than load_prompt_context for small files, but keeps
+    memory flat for large contexts such as saved story state. Without ijson
+    the whole file is loaded and the requested keys are picked from it.
+    
+    Args:
+        filepath: The path to load from
+        keys: The top-level keys to load
+        
+    Returns:
+        Dictionary with the requested keys that are present in the file
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    wanted = set(keys)
+    if not wanted:
+        return {}
+    
+    if not IJSON_AVAILABLE:
+        context = load_prompt_context(filepath)
+        return {key: value for key, value in context.items() if key in wanted}
+    
+    result: Dict[str, Any] = {}
+    with open(filepath, 'rb') as f:
+        for key, value in ijson.kvitems(f, '', use_float=True):
+            if key in wanted:
+                result[key] = value
+                if len(result) == len(wanted):
+                    break
+    return result
+
+
 def save_template(
     template: PromptTemplate,
     filepath: Union[str, Path],
@@ -71,7 +163,7 @@ def save_template(
     """
     data = {
         "template": template.template_str,
-        "variables": template.variables if include_variables else {}
+        "variables": dict(template.variables) if include_variables else {}
     }
     
     save_prompt_context(data, filepath)
@@ -111,25 +203,29 @@ def save_library(
     """
     Save all templates in a library to a directory.
     
+    The whole library is written to a single library.json file, mapping
+    agent types to template names to the saved template data.
+    
     Args:
         library: The library to save
         directory: The directory to save to
         pretty: Whether to format the JSON with indentation
     """
-    # Ensure directory exists
-    path = Path(directory)
-    path.mkdir(parents=True, exist_ok=True)
+    # Build any lazily registered templates so they are saved too
+    library.materialize_templates()
     
-    # Save templates by agent type and template name
-    for agent_type, templates in library.templates.items():
-        # Create agent type directory
-        agent_dir = path / agent_type
-        agent_dir.mkdir(exist_ok=True)
-        
-        # Save each template
-        for template_name, template in templates.items():
-            template_path = agent_dir / f"{template_name}.json"
-            save_template(template, template_path, pretty)
+    data = {
+        agent_type: {
+            template_name: {
+                "template": template.template_str,
+                "variables": dict(template.variables)
+            }
+            for template_name, template in templates.items()
+        }
+        for agent_type, templates in library.templates.items()
+    }
+    
+    save_prompt_context(data, Path(directory) / LIBRARY_FILENAME, pretty)
 
 
 def load_library(
@@ -139,6 +235,10 @@ def load_library(
     """
     Load templates from a directory into a library.
     
+    Reads the library.json written by save_library, or falls back to the
+    older layout of one directory per agent type with one JSON file per
+    template.
+    
     Args:
         directory: The directory to load from
         existing_library: Optional existing library to load into
@@ -149,22 +249,40 @@ def load_library(
     # Create a new library or use the existing one
     library = existing_library or PromptLibrary()
     
-    # Load templates from each agent type directory
     path = Path(directory)
+    library_file = path / LIBRARY_FILENAME
     
-    for agent_dir in path.iterdir():
-        if not agent_dir.is_dir():
-            continue
-            
-        agent_type = agent_dir.name
-        
-        # Load each template file in the agent directory
-        for template_file in agent_dir.glob("*.json"):
-            template_name = template_file.stem
-            template = load_template(template_file)
-            
-            # Add to library
-            library.add_template(agent_type, template_name, template)
+    if library_file.exists():
+        data = load_prompt_context(library_file)
+        for agent_type, templates in data.items():
+            for template_name, template_data in templates.items():
+                library.add_template(
+                    agent_type,
+                    template_name,
+                    PromptTemplate(
+                        template_data["template"],
+                        template_data.get("variables", {})
+                    )
+                )
+        return library
+    
+    # Collect the template files in each agent type directory
+    template_files = [
+        (agent_dir.name, template_file.stem, template_file)
+        for agent_dir in path.iterdir()
+        if agent_dir.is_dir()
+        for template_file in agent_dir.glob("*.json")
+    ]
+    
+    # Read the files concurrently, then add the templates in order on this thread
+    if len(template_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(template_files))) as executor:
+            templates = list(executor.map(load_template, [f for _, _, f in template_files]))
+    else:
+        templates = [load_template(f) for _, _, f in template_files]
+    
+    for (agent_type, template_name, _), template in zip(template_files, templates):
+        library.add_template(agent_type, template_name, template)
     
     return library
 
@@ -189,47 +307,48 @@ def merge_contexts(*contexts: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
-def extract_placeholders(template_str: str) -> List[str]:
+@lru_cache(maxsize=PLACEHOLDER_CACHE_SIZE)
+def extract_placeholders(template_str: str) -> Tuple[str, ...]:
     """
     Extract all placeholder variables from a template string.
     
+    Results are cached per template string, since the same templates are
+    validated over and over.
+    
     Args:
         template_str: The template string to analyze
         
     Returns:
-        List of unique placeholder names
+        Tuple of unique placeholder names, in order of first appearance
     """
-    import re
-    
     # Find all $placeholders, including those with braces like ${placeholder}
-    matches = re.findall(r'\$\{?([a-zA-Z0-9_]+)\}?', template_str)
+    matches = _PLACEHOLDER_RE.findall(template_str)
     
-    # Return unique placeholder names
-    return list(set(matches))
+    # Return unique placeholder names in order of first appearance
+    return tuple(dict.fromkeys(matches))
 
 
 def validate_context(
     template: PromptTemplate, 
-    context: Dict[str, Any]
+    context: Optional[Dict[str, Any]]
 ) -> List[str]:
     """
     Validate that a context contains all required placeholders for a template.
     
+    Uses the placeholder set computed when the template was compiled, so no
+    template text is scanned here.
+    
     Args:
         template: The template to validate against
-        context: The context to validate
+        context: The context to validate, or None to check the defaults only
         
     Returns:
-        List of missing placeholder names
+        List of missing placeholder names, in order of first appearance
     """
-    # Extract all placeholders from the template
-    placeholders = extract_placeholders(template.template_str)
-    
-    # Combine with template variables
-    combined_context = {**template.variables}
-    combined_context.update(context)
-    
-    # Find missing placeholders
-    missing = [p for p in placeholders if p not in combined_context]
+    missing = template.required - template.variables.keys()
+    if context and missing:
+        missing -= context.keys()
     
-    return missing 
\ No newline at end of file
+    if not missing:
+        return []
+    return [p for p in template.placeholders if p in missing] 
\ No newline at end of file
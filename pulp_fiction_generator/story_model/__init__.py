@@ -2,6 +2,6 @@
 Story Model module containing story structures and state management.
 """
 
-from .state import StoryStateManager
+from .state import PhaseCache, StoryStateManager
 
-__all__ = ['StoryStateManager'] 
\ No newline at end of file
+__all__ = ['PhaseCache', 'StoryStateManager'] 
\ No newline at end of file
@@ -5,11 +5,19 @@ Handles execution, error handling, and timeouts.
 """
 
 from typing import Any, Dict, Optional, Union, List
+import asyncio
+import functools
 
 from crewai import Task, Crew
+from crewai.tasks.conditional_task import ConditionalTask
 from pydantic import BaseModel
 
-from ..utils.errors import ErrorHandler, logger, timeout, TimeoutError
+from ..utils.errors import ErrorHandler, logger, call_with_timeout, TimeoutError
+
+
+class ConditionalTaskSkipped(Exception):
+    """Raised when a conditional task is not executed because its condition is not met"""
+    pass
 
 
 class ExecutionEngine:
@@ -51,8 +59,16 @@ class ExecutionEngine:
             The result of the task execution
             
         Raises:
+            ConditionalTaskSkipped: If the task is a conditional task whose
+                                    condition is not met by its context's output
             TimeoutError: If the task execution times out after max retries
         """
+        # Skip conditional tasks whose condition is not met before building a crew
+        if isinstance(task, ConditionalTask):
+            previous_output = self._get_context_output(task)
+            if previous_output is not None and not task.should_execute(previous_output):
+                raise ConditionalTaskSkipped(f"Condition of task {task.name} was not met")
+        
         # Add task context to diagnostic information
         context = {
             "task_description": task.description,
@@ -60,8 +76,8 @@ class ExecutionEngine:
             "expected_output": task.expected_output,
         }
         
-        logger.info(f"Starting task execution: {context['agent_name']}")
-        logger.info(f"Task description: {task.description[:100]}...")
+        logger.info("Starting task execution: %s", context['agent_name'])
+        logger.info("Task description: %s...", task.description[:100])
         
         # Create a simple crew with just this task
         single_task_crew = Crew(
@@ -71,19 +87,19 @@ class ExecutionEngine:
         )
         
         try:
-            # Execute the crew with a timeout
-            logger.info(f"Executing crew with timeout of {timeout_seconds} seconds")
-            with timeout(timeout_seconds):
-                result = single_task_crew.kickoff()
+            # Execute the crew with a timeout, which is also enforced when the
+            # task runs on a worker thread
+            logger.info("Executing crew with timeout of %s seconds", timeout_seconds)
+            result = call_with_timeout(single_task_crew.kickoff, timeout_seconds)
                 
-            logger.info(f"Task completed successfully, result length: {len(result)} chars")
+            logger.info("Task completed successfully, result length: %s chars", len(result))
             
             # Access task output directly
             task_output = None
             if hasattr(task, 'output'):
                 # Check if we have a structured output
                 if hasattr(task.output, 'parsed') and task.output.parsed:
-                    logger.info(f"Task has structured output: {type(task.output.parsed)}")
+                    logger.info("Task has structured output: %s", type(task.output.parsed))
                     
                     # For structured outputs, we'll use the content field or convert to string
                     if hasattr(task.output.parsed, 'content'):
@@ -102,7 +118,7 @@ class ExecutionEngine:
                 try:
                     task.callback(task)
                 except Exception as e:
-                    logger.error(f"Error in task callback: {e}")
+                    logger.error("Error in task callback: %s", e)
             
             return task_output or result
             
@@ -113,16 +129,16 @@ class ExecutionEngine:
             # Implement retry mechanism for timeouts
             if retry_count < self.max_retries:
                 retry_count += 1
-                logger.info(f"Retrying task execution (attempt {retry_count}/{self.max_retries})")
+                logger.info("Retrying task execution (attempt %s/%s)", retry_count, self.max_retries)
                 
                 # Increase timeout for retry attempts
                 new_timeout = int(timeout_seconds * 1.5)
-                logger.info(f"Increasing timeout to {new_timeout} seconds for retry")
+                logger.info("Increasing timeout to %s seconds for retry", new_timeout)
                 
                 # Recursive call with incremented retry count
                 return self.execute_task(task, new_timeout, retry_count)
             else:
-                logger.error(f"Task execution failed after {retry_count} retries")
+                logger.error("Task execution failed after %s retries", retry_count)
                 raise TimeoutError(f"Task execution timed out after {retry_count+1} attempts (last timeout: {timeout_seconds}s)")
             
         except Exception as e:
@@ -135,7 +151,7 @@ class ExecutionEngine:
             )
             
             # Log that we're attempting to recover
-            logger.warning(f"Task execution failed. Attempting to return partial results.")
+            logger.warning("Task execution failed. Attempting to return partial results.")
             
             # If we have a partial result in the context, use it
             if hasattr(single_task_crew, "last_result") and single_task_crew.last_result:
@@ -145,6 +161,47 @@ class ExecutionEngine:
             # Raise the original exception with enhanced context
             raise
     
+    @staticmethod
+    def _get_context_output(task: Task) -> Any:
+        """
+        Get the output of the last task in a task's context.
+        
+        Args:
+            task: The task whose context to look at
+            
+        Returns:
+            The output of the last context task that has one, or None
+        """
+        context = task.context if isinstance(task.context, list) else []
+        for context_task in reversed(context):
+            output = getattr(context_task, "output", None)
+            if output is not None:
+                return output
+        return None
+    
+    async def execute_task_async(
+        self,
+        task: Task,
+        timeout_seconds: int = 120
+    ) -> str:
+        """
+        Execute a task without blocking the event loop.
+        
+        The task is executed with execute_task in the event loop's default
+        executor, so it gets the same retries, output handling and callbacks.
+        
+        Args:
+            task: The task to execute
+            timeout_seconds: Maximum time to wait for task completion
+            
+        Returns:
+            The result of the task execution
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.execute_task, task, timeout_seconds)
+        )
+    
     def execute_crew(
         self, 
         crew: Crew, 
@@ -171,28 +228,27 @@ class ExecutionEngine:
         """
         try:
             # Execute the crew with a timeout
-            logger.info(f"Starting crew execution with timeout of {timeout_seconds} seconds")
-            
-            with timeout(timeout_seconds):
-                # First, check if there are stored custom inputs in the crew_factory
-                stored_inputs = None
-                if crew_factory:
-                    stored_inputs = crew_factory.get_custom_inputs(crew)
-                    if stored_inputs:
-                        logger.info(f"Using custom_inputs from CrewFactory storage")
-                
-                # If we have stored inputs, use those
+            logger.info("Starting crew execution with timeout of %s seconds", timeout_seconds)
+            
+            # First, check if there are stored custom inputs in the crew_factory
+            stored_inputs = None
+            if crew_factory:
+                stored_inputs = crew_factory.get_custom_inputs(crew)
                 if stored_inputs:
-                    result = crew.kickoff(inputs=stored_inputs)
-                # Otherwise, use the custom_inputs from the method parameter
-                elif custom_inputs:
-                    logger.info(f"Using custom_inputs from method parameter")
-                    result = crew.kickoff(inputs=custom_inputs)
-                else:
-                    logger.info(f"No custom_inputs provided")
-                    result = crew.kickoff()
+                    logger.info("Using custom_inputs from CrewFactory storage")
+            
+            # If we have stored inputs, use those
+            if stored_inputs:
+                result = call_with_timeout(crew.kickoff, timeout_seconds, inputs=stored_inputs)
+            # Otherwise, use the custom_inputs from the method parameter
+            elif custom_inputs:
+                logger.info("Using custom_inputs from method parameter")
+                result = call_with_timeout(crew.kickoff, timeout_seconds, inputs=custom_inputs)
+            else:
+                logger.info("No custom_inputs provided")
+                result = call_with_timeout(crew.kickoff, timeout_seconds)
                 
-            logger.info(f"Crew execution complete, result length: {len(result)} characters")
+            logger.info("Crew execution complete, result length: %s characters", len(result))
             
             return result
         except TimeoutError:
@@ -202,16 +258,16 @@ class ExecutionEngine:
             # Implement retry mechanism for timeouts
             if retry_count < self.max_retries:
                 retry_count += 1
-                logger.info(f"Retrying crew execution (attempt {retry_count}/{self.max_retries})")
+                logger.info("Retrying crew execution (attempt %s/%s)", retry_count, self.max_retries)
                 
                 # Increase timeout for retry attempts
                 new_timeout = int(timeout_seconds * 1.5)
-                logger.info(f"Increasing timeout to {new_timeout} seconds for retry")
+                logger.info("Increasing timeout to %s seconds for retry", new_timeout)
                 
                 # Recursive call with incremented retry count
                 return self.execute_crew(crew, custom_inputs, new_timeout, retry_count)
             else:
-                logger.error(f"Crew execution failed after {retry_count} retries")
+                logger.error("Crew execution failed after %s retries", retry_count)
                 raise TimeoutError(f"Crew execution timed out after {retry_count+1} attempts (last timeout: {timeout_seconds}s)")
         except Exception as e:
             # Enhance the exception with crew context and diagnostic information
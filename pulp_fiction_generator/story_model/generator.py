@@ -5,25 +5,194 @@ This module contains the main StoryGenerator class that orchestrates
 the story generation process using the component classes.
 """
 
-from typing import Any, Dict, List, Optional, Union, Callable, Type
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Union, Callable, Type, Tuple
+import asyncio
+import functools
+import hashlib
 import os
-import traceback
+import threading
+from pathlib import Path
+from types import MappingProxyType
 import json
-import copy
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
-from crewai import Task, Crew
+from crewai import Task
 
 from .tasks import TaskFactory
-from .execution import ExecutionEngine
+from .execution import ConditionalTaskSkipped, ExecutionEngine
 from .validation import StoryValidator
-from .state import StoryStateManager
-from .models import StoryArtifacts, StoryOutput
-from ..utils.errors import logger, timeout, TimeoutError, with_error_handling
+from .state import PhaseCache, StoryStateManager, flush_writes, project_dir_name, queue_write
+from .models import Phase, PhaseSpec, StoryArtifacts, StoryOutput
+from ..utils.errors import (
+    logger, timeout, TimeoutError, with_error_handling,
+    ConfigurationError, InputValidationError, ModelConnectionError
+)
+
+# Fallback templates for emergency recovery, keyed by step type. They are
+# shared by every generator, so they are read-only.
+_FALLBACK_TEMPLATES: Mapping[str, str] = MappingProxyType({
+    Phase.RESEARCH: "This is placeholder research text for the {genre} genre. The real story generation is currently experiencing technical difficulties.",
+    Phase.WORLDBUILDING: "This is a placeholder world for a {genre} story. The real story generation is currently experiencing technical difficulties.",
+    Phase.CHARACTERS: "The main character is a typical {genre} protagonist with a strong motivation. The real story generation is currently experiencing technical difficulties.",
+    Phase.PLOT: "A standard {genre} plot with beginning, middle, and end. The real story generation is currently experiencing technical difficulties.",
+    Phase.DRAFT: "This is a placeholder draft for a {genre} story. The real story generation is currently experiencing technical difficulties.",
+    Phase.FINAL_STORY: "Your {genre} story is currently experiencing technical difficulties. Please try regenerating it or consider fixing the CrewFactory issue."
+})
+
+
+# Names of the chunked pipeline's tasks mapped to the artifacts they produce
+_TASK_ARTIFACTS: Mapping[str, str] = MappingProxyType({
+    "research": "research",
+    "research_expansion": "research_expanded",
+    "worldbuilding": "worldbuilding",
+    "characters": "characters",
+    "character_development": "characters_enhanced",
+    "plot": "plot",
+    "plot_twist": "plot_twist",
+    "draft": "draft",
+    "style_improvement": "style_improved",
+    "consistency_check": "consistency_fixed",
+    "final": "final_story",
+})
+
+# Artifacts mapped to the names of the tasks producing them
+_ARTIFACT_TASKS: Mapping[str, str] = MappingProxyType({
+    artifact: task_name for task_name, artifact in _TASK_ARTIFACTS.items()
+})
+
+
+# Tools of the raw tool pipeline mapped to the name of the task using them,
+# which is also its artifact, and the TaskFactory method creating the task.
+# Other tools get a generic tool task named after them.
+_RAW_TOOL_TASKS: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    "search_tool": ("raw_genre_research", "create_raw_research_task"),
+    "character_tool": ("raw_character_references", "create_raw_character_references_task"),
+    "style_tool": ("raw_style_examples", "create_raw_style_examples_task"),
+    "plot_tool": ("raw_plot_structures", "create_raw_plot_structures_task"),
+})
+
+
+# Sections of the research brief compiled by execute_detailed_research, in
+# the order of the research subtasks
+_RESEARCH_SECTIONS = ("Core Genre Elements", "Historical Context", "Writing Style Guide")
+
+
+def _has_task_context(task: Task) -> bool:
+    """Check whether a task takes the output of other tasks as its context."""
+    context = getattr(task, "context", None)
+    return isinstance(context, list) and bool(context)
+
+
+# Maximum length of the research and worldbuilding passed to the draft phase
+_BACKGROUND_CONTEXT_CHARS = 4000
+
+
+def _research_context(artifacts: StoryArtifacts) -> str:
+    """Combine the research with the expanded research, if there is any."""
+    if artifacts.research_expanded:
+        return f"{artifacts.research}\n\nEXPANDED RESEARCH:\n{artifacts.research_expanded}"
+    return artifacts.research
+
+
+def _character_context(artifacts: StoryArtifacts) -> Optional[str]:
+    """Get the enhanced characters, or the characters if there are none."""
+    return artifacts.characters_enhanced or artifacts.characters
+
+
+def _plot_context(artifacts: StoryArtifacts) -> Optional[str]:
+    """Combine the plot with its twist, if there is one."""
+    if artifacts.plot_twist:
+        return f"{artifacts.plot}\n\nPLOT TWIST:\n{artifacts.plot_twist}"
+    return artifacts.plot
+
+
+def _excerpt(text: Optional[str], limit: int) -> Optional[str]:
+    """Shorten a text to at most about limit characters, preferably at a paragraph break."""
+    if not text or len(text) <= limit:
+        return text
+    cut = text.rfind("\n\n", 0, limit)
+    if cut < limit // 2:
+        cut = limit
+    return text[:cut].rstrip() + "\n[...]"
+
+
+def _draft_context(artifacts: StoryArtifacts) -> List[Optional[str]]:
+    """
+    Build the draft's context from the earlier phases.
+    
+    The characters and plot the draft is written from are passed in full.
+    The research and worldbuilding they were built on are already reflected
+    in them, so only the start of each is passed, keeping the prompt short.
+    """
+    return [
+        _excerpt(artifacts.research, _BACKGROUND_CONTEXT_CHARS),
+        _excerpt(artifacts.worldbuilding, _BACKGROUND_CONTEXT_CHARS),
+        _character_context(artifacts),
+        _plot_context(artifacts)
+    ]
+
+
+# Phases made of a main task and an optional follow-up task, run by
+# StoryGenerator._run_phase. The final phase chains several tasks and has
+# its own processor.
+_PHASE_SPECS: Mapping[Phase, PhaseSpec] = MappingProxyType({
+    Phase.RESEARCH: PhaseSpec(
+        Phase.RESEARCH, "create_research_task", "research", "research",
+        create_followup="create_research_expansion_task",
+        followup_name="research_expansion",
+        followup_artifact="research_expanded",
+        background_followup=True
+    ),
+    Phase.WORLDBUILDING: PhaseSpec(
+        Phase.WORLDBUILDING, "create_worldbuilding_task", "worldbuilding", "worldbuilding",
+        context=lambda artifacts: artifacts.research
+    ),
+    Phase.CHARACTERS: PhaseSpec(
+        Phase.CHARACTERS, "create_character_task", "characters", "characters",
+        context=lambda artifacts: [_research_context(artifacts), artifacts.worldbuilding],
+        create_followup="create_character_development_task",
+        followup_name="character_development",
+        followup_artifact="characters_enhanced"
+    ),
+    Phase.PLOT: PhaseSpec(
+        Phase.PLOT, "create_plot_task", "plot", "plot",
+        context=lambda artifacts: [artifacts.research, artifacts.worldbuilding, _character_context(artifacts)],
+        create_followup="create_plot_twist_task",
+        followup_name="plot_twist",
+        followup_artifact="plot_twist"
+    ),
+    Phase.DRAFT: PhaseSpec(
+        Phase.DRAFT, "create_writing_task", "draft", "draft",
+        context=_draft_context
+    ),
+})
+
+
+# Number of follow-up tasks run in the background at once, across all generators
+MAX_BACKGROUND_FOLLOWUPS = 4
+
+# Runs the follow-up tasks of phases with background_followup set. It is
+# shared by every generator, so generators own no threads that would need
+# shutting down; its threads are started on first use.
+_followup_executor = ThreadPoolExecutor(
+    max_workers=MAX_BACKGROUND_FOLLOWUPS,
+    thread_name_prefix="story-followup"
+)
+
 
 class GenerationError(Exception):
     """Exception raised when story generation fails"""
     pass
 
+
+def _story_cache_key(genre: str, custom_inputs: Optional[Dict[str, Any]]) -> str:
+    """Build the story cache key of a genre and its custom inputs."""
+    payload = genre + json.dumps(custom_inputs or {}, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
 class StoryGenerator:
     """
     Responsible for generating stories using agent crews.
@@ -34,13 +203,71 @@ class StoryGenerator:
     and Dependency Injection.
     """
     
+    # Phases of the phased pipeline mapped to the phases whose output they use
+    PHASE_DEPENDENCIES: Dict[Phase, Tuple[Phase, ...]] = {
+        Phase.RESEARCH: (),
+        Phase.WORLDBUILDING: (Phase.RESEARCH,),
+        Phase.CHARACTERS: (Phase.RESEARCH, Phase.WORLDBUILDING),
+        Phase.PLOT: (Phase.RESEARCH, Phase.WORLDBUILDING, Phase.CHARACTERS),
+        Phase.DRAFT: (Phase.RESEARCH, Phase.WORLDBUILDING, Phase.CHARACTERS, Phase.PLOT),
+        Phase.FINAL_STORY: (Phase.DRAFT,),
+    }
+    
+    # Artifact fields produced by each phase, main output first; a phase's
+    # checkpoint holds all of them
+    PHASE_ARTIFACTS: Dict[Phase, Tuple[str, ...]] = {
+        Phase.RESEARCH: ("research", "research_expanded"),
+        Phase.WORLDBUILDING: ("worldbuilding",),
+        Phase.CHARACTERS: ("characters", "characters_enhanced"),
+        Phase.PLOT: ("plot", "plot_twist"),
+        Phase.DRAFT: ("draft",),
+        Phase.FINAL_STORY: ("final_story", "style_improved", "consistency_fixed"),
+    }
+    
+    # Artifacts of the phases a phase depends on that it is generated without.
+    # The research expansion runs in the background while the world is built
+    # from the research alone; the characters get the expanded research.
+    PHASE_SKIPPED_INPUTS: Dict[Phase, Tuple[str, ...]] = {
+        Phase.WORLDBUILDING: ("research_expanded",),
+    }
+    
+    # Version of the phase prompts and outputs; bump it to invalidate saved phase checkpoints
+    CHECKPOINT_VERSION = 1
+    
+    # Age in seconds after which a phase checkpoint is regenerated instead of resumed
+    CHECKPOINT_TTL: Optional[float] = 24 * 60 * 60
+    
+    # Fallback templates for emergency recovery
+    fallback_templates: Mapping[str, str] = _FALLBACK_TEMPLATES
+    
+    # Number of flow-generated stories kept by generate_story_with_flow
+    STORY_CACHE_SIZE = 128
+    
+    # Errors that every generation approach would hit again, so
+    # generate_story_with_flow raises them instead of falling back
+    UNRETRYABLE_ERRORS: Tuple[Type[Exception], ...] = (ConfigurationError, InputValidationError)
+    
+    # Transient errors after which the story flow is retried before falling back
+    TRANSIENT_ERRORS: Tuple[Type[Exception], ...] = (ModelConnectionError, ConnectionError)
+    
+    # Number of times the story flow is retried after a transient error
+    FLOW_RETRIES = 1
+    
+    # Number of chapters generate_chapters generates at once by default
+    MAX_PARALLEL_CHAPTERS = 4
+    
+    # Number of tasks, and so model calls, executed at once by default
+    MAX_CONCURRENT_TASKS = 4
+    
     def __init__(
         self,
         crew_factory,  # Circular import prevention
         task_factory: Optional[TaskFactory] = None,
         execution_engine: Optional[ExecutionEngine] = None,
         state_manager: Optional[StoryStateManager] = None,
-        debug_mode: bool = False
+        debug_mode: bool = False,
+        phase_cache: Optional[PhaseCache] = None,
+        max_concurrent_tasks: Optional[int] = None
     ):
         """
         Initialize the story generator with its component dependencies.
@@ -51,22 +278,39 @@ class StoryGenerator:
             execution_engine: Engine for executing tasks and crews
             state_manager: Manager for story state
             debug_mode: Whether debugging is enabled
+            phase_cache: Optional cache sharing phase outputs between projects.
+                         Without it, phases are only resumed from the
+                         checkpoints of their own project.
+            max_concurrent_tasks: Maximum number of tasks executed at once
+                                  across all stories of this generator,
+                                  bounding concurrent model calls. Defaults
+                                  to MAX_CONCURRENT_TASKS.
         """
         self.crew_factory = crew_factory
         self.task_factory = task_factory or TaskFactory(crew_factory.agent_factory)
         self.execution_engine = execution_engine or ExecutionEngine(debug_mode=debug_mode)
         self.state_manager = state_manager or StoryStateManager()
         self.debug_mode = debug_mode
+        self.phase_cache = phase_cache
         
-        # Fallback templates for emergency recovery
-        self.fallback_templates = {
-            "research": "This is placeholder research text for the {genre} genre. The real story generation is currently experiencing technical difficulties.",
-            "worldbuilding": "This is a placeholder world for a {genre} story. The real story generation is currently experiencing technical difficulties.",
-            "characters": "The main character is a typical {genre} protagonist with a strong motivation. The real story generation is currently experiencing technical difficulties.",
-            "plot": "A standard {genre} plot with beginning, middle, and end. The real story generation is currently experiencing technical difficulties.",
-            "draft": "This is a placeholder draft for a {genre} story. The real story generation is currently experiencing technical difficulties.",
-            "final_story": "Your {genre} story is currently experiencing technical difficulties. Please try regenerating it or consider fixing the CrewFactory issue."
-        }
+        # Fallback templates formatted for each genre, filled by _prime_fallbacks
+        self._formatted_fallbacks: Dict[str, Dict[str, str]] = {}
+        
+        # Flow factory for the flow-based methods, created by _get_flow_factory
+        self._flow_factory = None
+        
+        # Flow-generated stories keyed by _story_cache_key, least recently used first
+        self._story_cache: "OrderedDict[str, str]" = OrderedDict()
+        
+        # Stories being generated by generate_story_with_flow, keyed by _story_cache_key
+        self._stories_in_flight: Dict[str, Future] = {}
+        self._story_cache_lock = threading.Lock()
+        
+        # Last visualization written to each output file, as its _story_cache_key and path
+        self._visualization_cache: Dict[str, Tuple[str, str]] = {}
+        
+        # Held while a task executes, limiting concurrent model calls
+        self._task_slots = threading.BoundedSemaphore(max_concurrent_tasks or self.MAX_CONCURRENT_TASKS)
     
     @with_error_handling
     def generate_story(
@@ -80,6 +324,9 @@ class StoryGenerator:
         """
         Generate a complete story.
         
+        Tries each of the strategies from _generation_strategies in turn and
+        falls back to a placeholder story if they all fail.
+        
         Args:
             genre: The genre to generate for
             custom_inputs: Optional custom inputs for the crew
@@ -96,68 +343,104 @@ class StoryGenerator:
             self.debug_mode = debug_mode
             self.execution_engine.debug_mode = debug_mode
         
+        # Format the fallback content for this genre up front
+        self._prime_fallbacks(genre)
+        
         try:
-            logger.info(f"Creating basic crew for genre: {genre}")
-            
-            # Use the create_basic_crew_with_inputs method when custom_inputs are provided
-            # This method will store custom_inputs in the CrewFactory's storage
-            if custom_inputs:
-                logger.info(f"Using create_basic_crew_with_inputs with {len(custom_inputs)} custom inputs")
-                crew = self.crew_factory.create_basic_crew_with_inputs(
-                    genre=genre,
-                    custom_inputs=custom_inputs, 
-                    config=config
-                )
-            else:
-                logger.info(f"Using standard create_basic_crew without custom inputs")
-                crew = self.crew_factory.create_basic_crew(
-                    genre=genre, 
-                    config=config
-                )
-            
-            logger.info(f"Starting crew execution with timeout of {timeout_seconds} seconds")
-            # We pass the crew_factory to the ExecutionEngine so it can retrieve the stored custom inputs
-            result = self.execution_engine.execute_crew(
-                crew, 
-                custom_inputs=custom_inputs,
-                timeout_seconds=timeout_seconds,
-                crew_factory=self.crew_factory
-            )
-            
-            # Log the result for debugging
-            logger.info(f"Story generation complete, result length: {len(result)} characters")
-            
-            return result
-        except Exception as e:
-            logger.error(f"Error during story generation: {str(e)}")
-            logger.error(traceback.format_exc())
-            
-            # Try to generate a story using the phased approach as fallback
-            try:
-                logger.info("Attempting fallback phased story generation...")
-                result = self.generate_story_phased(
-                    genre=genre,
-                    custom_inputs=custom_inputs,
-                    config=config,
-                    timeout_seconds=timeout_seconds
-                )
-                return result
-            except Exception as fallback_error:
-                logger.error(f"Fallback story generation also failed: {str(fallback_error)}")
-                
-                # Use our placeholder story if all else fails
+            for name, strategy in self._generation_strategies(genre, custom_inputs, config, timeout_seconds):
                 try:
-                    logger.info("Generating placeholder story as last resort")
-                    placeholder = self._get_fallback_content("final_story", genre)
-                    return placeholder
-                except:
-                    # If even placeholder generation fails, raise the original error
-                    raise GenerationError(f"Story generation failed: {str(e)}") from e
+                    return strategy()
+                except Exception as e:
+                    logger.error("%s story generation failed: %s", name, e, exc_info=self.debug_mode)
+            
+            logger.info("Generating placeholder story as last resort")
+            return self._get_fallback_content(Phase.FINAL_STORY, genre)
         finally:
             # Restore original debug mode
             self.debug_mode = original_debug_mode
             self.execution_engine.debug_mode = original_debug_mode
     
+    def _generation_strategies(
+        self,
+        genre: str,
+        custom_inputs: Optional[Dict[str, Any]],
+        config: Optional[Dict[str, Any]],
+        timeout_seconds: int
+    ) -> List[Tuple[str, Callable[[], str]]]:
+        """
+        Get the ways generate_story tries to generate a story, in order.
+        
+        Args:
+            genre: The genre to generate for
+            custom_inputs: Optional custom inputs for the crew
+            config: Optional configuration overrides
+            timeout_seconds: Maximum time in seconds to wait for generation
+            
+        Returns:
+            List of strategy names and functions generating the story
+        """
+        return [
+            ("Crew", functools.partial(self._generate_with_crew, genre, custom_inputs, config, timeout_seconds)),
+            ("Phased", functools.partial(
+                self.generate_story_phased,
+                genre=genre,
+                custom_inputs=custom_inputs,
+                config=config,
+                timeout_seconds=timeout_seconds
+            )),
+        ]
+    
+    def _generate_with_crew(
+        self,
+        genre: str,
+        custom_inputs: Optional[Dict[str, Any]],
+        config: Optional[Dict[str, Any]],
+        timeout_seconds: int
+    ) -> str:
+        """
+        Generate a story with a single crew, the primary approach of generate_story.
+        
+        Args:
+            genre: The genre to generate for
+            custom_inputs: Optional custom inputs for the crew
+            config: Optional configuration overrides
+            timeout_seconds: Maximum time in seconds to wait for generation
+            
+        Returns:
+            The generated story
+        """
+        logger.info("Creating basic crew for genre: %s", genre)
+        
+        # Use the create_basic_crew_with_inputs method when custom_inputs are provided
+        # This method will store custom_inputs in the CrewFactory's storage
+        if custom_inputs:
+            logger.info("Using create_basic_crew_with_inputs with %s custom inputs", len(custom_inputs))
+            crew = self.crew_factory.create_basic_crew_with_inputs(
+                genre=genre,
+                custom_inputs=custom_inputs, 
+                config=config
+            )
+        else:
+            logger.info("Using standard create_basic_crew without custom inputs")
+            crew = self.crew_factory.create_basic_crew(
+                genre=genre, 
+                config=config
+            )
+        
+        logger.info("Starting crew execution with timeout of %s seconds", timeout_seconds)
+        # We pass the crew_factory to the ExecutionEngine so it can retrieve the stored custom inputs
+        result = self.execution_engine.execute_crew(
+            crew, 
+            custom_inputs=custom_inputs,
+            timeout_seconds=timeout_seconds,
+            crew_factory=self.crew_factory
+        )
+        
+        # Log the result for debugging
+        logger.info("Story generation complete, result length: %s characters", len(result))
+        
+        return result
+    
     def generate_story_chunked(
         self, 
         genre: str, 
@@ -190,10 +473,8 @@ class StoryGenerator:
             self.execution_engine.debug_mode = debug_mode
         
         try:
-            # Get the chapter number from custom inputs or default to 1
-            chapter_num = custom_inputs.get("chapter_number", 1) if custom_inputs else 1
-            title = custom_inputs.get("title", "Untitled Story") if custom_inputs else "Untitled Story"
-            project_dir = title.lower().replace(" ", "_")
+            # Get the chapter number, title and project directory from custom inputs
+            chapter_num, title, project_dir = self._story_context(custom_inputs)
             
             # Use provided story state or default manager
             story_state = story_state or self.state_manager
@@ -202,6 +483,9 @@ class StoryGenerator:
             # Initialize story artifacts
             artifacts = StoryArtifacts()
             
+            # Task outputs seen by the callback, written to the state in one batch
+            pending_outputs: Dict[str, Any] = {}
+            
             # Define callback to capture task output and dispatch to the user's callback if provided
             def task_output_callback(task: Task) -> None:
                 # Get the task name
@@ -210,98 +494,29 @@ class StoryGenerator:
                 # Store the task output in artifacts
                 if hasattr(task, 'output'):
                     task_output = task.output
-                    story_state.save_task_output(task_name, task_output)
+                    pending_outputs[task_name] = task_output
                     
                     # Store in artifacts
-                    if task_name == "research":
-                        artifacts.research = task_output
-                    elif task_name == "research_expansion":
-                        artifacts.research_expanded = task_output
-                    elif task_name == "worldbuilding":
-                        artifacts.worldbuilding = task_output
-                    elif task_name == "characters":
-                        artifacts.characters = task_output
-                    elif task_name == "character_development":
-                        artifacts.characters_enhanced = task_output
-                    elif task_name == "plot":
-                        artifacts.plot = task_output
-                    elif task_name == "plot_twist":
-                        artifacts.plot_twist = task_output
-                    elif task_name == "draft":
-                        artifacts.draft = task_output
-                    elif task_name == "style_improvement":
-                        artifacts.style_improved = task_output
-                    elif task_name == "consistency_check":
-                        artifacts.consistency_fixed = task_output
-                    elif task_name == "final":
-                        artifacts.final_story = task_output
+                    artifact_name = _TASK_ARTIFACTS.get(task_name)
+                    if artifact_name is not None:
+                        artifacts[artifact_name] = task_output
                 
                 # Call the provided callback
                 if chunk_callback:
                     chunk_callback(task_name, task_output if hasattr(task, 'output') else None)
                         
-            # Process each phase with proper error handling and fallback
-            self._process_step_with_fallback(
-                "research", 
-                self._process_research_phase,
-                genre, 
-                chapter_num, 
-                project_dir, 
-                task_output_callback, 
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
-
-            self._process_worldbuilding_phase(
-                genre, 
-                chapter_num, 
-                project_dir, 
-                task_output_callback, 
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
-            
-            self._process_character_phase(
-                genre, 
-                chapter_num, 
-                project_dir, 
-                task_output_callback, 
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
-            
-            self._process_plot_phase(
-                genre, 
-                chapter_num, 
-                project_dir, 
-                task_output_callback, 
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
-            
-            self._process_draft_phase(
-                genre, 
-                chapter_num, 
-                project_dir, 
-                task_output_callback, 
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
-            
-            self._process_final_phase(
-                genre, 
-                chapter_num, 
-                project_dir, 
-                task_output_callback, 
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
+            try:
+                # Process each phase once the phases it depends on are done. Only
+                # the research phase falls back to placeholder content; errors in
+                # the later phases are raised.
+                self._run_phase_dag(
+                    self.PHASE_DEPENDENCIES,
+                    genre, chapter_num, project_dir, task_output_callback, story_state, artifacts, timeout_seconds,
+                    fallback_phases={Phase.RESEARCH}
+                )
+            finally:
+                # Keep the completed outputs even if a phase failed, so a resumed run reuses them
+                self._save_callback_outputs(story_state, pending_outputs, chapter_num)
             
             return artifacts
         finally:
@@ -309,322 +524,247 @@ class StoryGenerator:
             self.debug_mode = original_debug_mode
             self.execution_engine.debug_mode = original_debug_mode
             
-    def _process_research_phase(
-        self, 
-        genre: str, 
-        chapter_num: int, 
-        project_dir: str, 
-        callback: Callable, 
+    def _save_callback_outputs(
+        self,
         story_state: StoryStateManager,
-        artifacts: StoryArtifacts,
-        timeout_seconds: int
+        outputs: Dict[str, Any],
+        chapter_num: int
     ) -> None:
         """
-        Process the research phase of story generation.
+        Save the task outputs seen by a pipeline's callback that the phases did not save themselves.
+        
+        Waits until the task outputs saved in the background are written.
         
         Args:
-            genre: The genre to research
-            chapter_num: The chapter number
-            project_dir: Project directory for output
-            callback: Callback for task output
             story_state: State manager for tracking progress
-            artifacts: Story artifacts object for storing output
-            timeout_seconds: Timeout for the task
+            outputs: Task outputs seen by the callback, keyed by task name
+            chapter_num: The chapter number
         """
-        # Skip if already completed
-        if story_state.has_task_output("research") and story_state.has_task_output("research_expansion"):
-            artifacts.research = story_state.get_task_output("research")
-            artifacts.research_expanded = story_state.get_task_output("research_expansion")
-            return
-            
-        # Create initial research task
-        research_task = self.task_factory.create_research_task(
-            genre=genre,
-            chapter_num=chapter_num,
-            project_dir=project_dir,
-            callback=callback
-        )
-
-        # Execute the research task
-        research_output = self.execution_engine.execute_task(
-            research_task, 
-            timeout_seconds=timeout_seconds
+        story_state.add_task_outputs(
+            {
+                task_name: output
+                for task_name, output in list(outputs.items())
+                if not story_state.has_completed_task(task_name, chapter_num)
+            },
+            chapter_num
         )
+        story_state.flush()
+    
+    def generate_chapters(
+        self,
+        genre: str,
+        chapters: Iterable[int],
+        custom_inputs: Optional[Dict[str, Any]] = None,
+        chapter_callback: Optional[Callable[[int, StoryArtifacts], None]] = None,
+        max_parallel: Optional[int] = None,
+        timeout_seconds: int = 120
+    ) -> Dict[int, StoryArtifacts]:
+        """
+        Generate several chapters of a story concurrently.
         
-        # Store the research output
-        artifacts.research = research_output
-        story_state.save_task_output("research", research_output)
-        
-        # Create and execute conditional research expansion task
-        research_expansion_task = self.task_factory.create_research_expansion_task(
-            genre=genre,
-            context=research_task,
-            chapter_num=chapter_num,
-            project_dir=project_dir,
-            callback=callback
-        )
+        Each chapter is generated by generate_story_chunked on a worker
+        thread with its own copy of the state manager. Generation is mostly
+        spent waiting for the model, so chapters overlap well. The model
+        calls of all chapters, including their background follow-up tasks,
+        share the generator's max_concurrent_tasks limit.
         
-        try:
-            # Execute the conditional task - it will only run if the condition is met
-            research_expansion_output = self.execution_engine.execute_task(
-                research_expansion_task, 
-                timeout_seconds=timeout_seconds
-            )
+        Args:
+            genre: The genre to generate for
+            chapters: The chapter numbers to generate
+            custom_inputs: Custom inputs shared by every chapter
+            chapter_callback: Optional callback called with the chapter number
+                              and artifacts as each chapter completes
+            max_parallel: Maximum number of chapters generated at once.
+                          Defaults to MAX_PARALLEL_CHAPTERS.
+            timeout_seconds: Maximum time in seconds to wait for each generation stage
             
-            # Store the expanded research if task ran
-            if research_expansion_output:
-                artifacts.research_expanded = research_expansion_output
-                story_state.save_task_output("research_expansion", research_expansion_output)
-        except Exception as e:
-            logger.warning(f"Research expansion task failed or was skipped: {str(e)}")
-
-    def _process_worldbuilding_phase(
-        self, 
-        genre: str, 
-        chapter_num: int, 
-        project_dir: str, 
-        callback: Callable, 
-        story_state: StoryStateManager,
-        artifacts: StoryArtifacts,
-        timeout_seconds: int
-    ) -> None:
+        Returns:
+            Dictionary mapping chapter numbers to their artifacts, in chapter order
         """
-        Process the worldbuilding phase of story generation.
-        
-        Args:
-            genre: The genre for worldbuilding
-            chapter_num: The chapter number
-            project_dir: Project directory for output
-            callback: Callback for task output
-            story_state: State manager for tracking progress
-            artifacts: Story artifacts object for storing output
-            timeout_seconds: Timeout for the task
+        chapters = sorted(set(chapters))
+        if not chapters:
+            return {}
+        
+        max_parallel = min(max_parallel or self.MAX_PARALLEL_CHAPTERS, len(chapters))
+        results: Dict[int, StoryArtifacts] = {}
+        
+        # Give each chapter a state whose current chapter is that chapter, so
+        # its task outputs are looked up and saved under it. The simple task
+        # store holds the outputs of the current chapter only, so it starts empty.
+        chapter_states: Dict[int, StoryStateManager] = {}
+        for chapter_num in chapters:
+            story_state = chapter_states[chapter_num] = self.state_manager.clone()
+            story_state.set_current_chapter(chapter_num)
+            story_state.reset_simple_store()
+        
+        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            futures = {
+                executor.submit(
+                    self.generate_story_chunked,
+                    genre,
+                    custom_inputs={**(custom_inputs or {}), "chapter_number": chapter_num},
+                    story_state=chapter_states[chapter_num],
+                    timeout_seconds=timeout_seconds
+                ): chapter_num
+                for chapter_num in chapters
+            }
+            for future in as_completed(futures):
+                chapter_num = futures[future]
+                results[chapter_num] = future.result()
+                logger.info("Generated chapter %s of %s chapters", chapter_num, len(chapters))
+                if chapter_callback:
+                    chapter_callback(chapter_num, results[chapter_num])
+        
+        return {chapter_num: results[chapter_num] for chapter_num in chapters}
+    
+    def _execute_task(self, task: Task, **kwargs) -> Any:
         """
-        # Skip if already completed
-        if story_state.has_task_output("worldbuilding"):
-            artifacts.worldbuilding = story_state.get_task_output("worldbuilding")
-            return
-        
-        # Determine context - if we have expanded research, use it combined with basic research
-        context = artifacts.research
-        if hasattr(artifacts, 'research_expanded') and artifacts.research_expanded:
-            context = f"{artifacts.research}\n\nEXPANDED RESEARCH:\n{artifacts.research_expanded}"
-        
-        # Create and execute the worldbuilding task
-        worldbuilding_task = self.task_factory.create_worldbuilding_task(
-            genre=genre,
-            context=context,
-            chapter_num=chapter_num,
-            project_dir=project_dir,
-            callback=callback
-        )
+        Execute a task with the execution engine once a task slot is free.
         
-        worldbuilding_output = self.execution_engine.execute_task(
-            worldbuilding_task, 
-            timeout_seconds=timeout_seconds
-        )
+        Chapters, concurrent phases and background follow-up tasks all
+        execute their tasks through here, so together they never make more
+        than max_concurrent_tasks model calls at once.
         
-        # Store the output
-        artifacts.worldbuilding = worldbuilding_output
-        story_state.save_task_output("worldbuilding", worldbuilding_output)
+        Args:
+            task: The task to execute
+            **kwargs: Further arguments for ExecutionEngine.execute_task
             
-    def _process_character_phase(
-        self, 
-        genre: str, 
-        chapter_num: int, 
-        project_dir: str, 
-        callback: Callable, 
+        Returns:
+            The task output
+        """
+        with self._task_slots:
+            return self.execution_engine.execute_task(task, **kwargs)
+    
+    def _run_phase(
+        self,
+        spec: PhaseSpec,
+        genre: str,
+        chapter_num: int,
+        project_dir: str,
+        callback: Callable,
         story_state: StoryStateManager,
         artifacts: StoryArtifacts,
         timeout_seconds: int
     ) -> None:
         """
-        Process the character development phase of story generation.
+        Process a phase described by a PhaseSpec.
+        
+        Runs the phase's main task, then its follow-up task if it has one,
+        unless the phase can be restored from a checkpoint or the story
+        state already holds its outputs. A background follow-up task is
+        left running when the phase returns; the phases using its output
+        wait for it.
         
         Args:
-            genre: The genre for character development
+            spec: Description of the phase
+            genre: The genre of the story
             chapter_num: The chapter number
             project_dir: Project directory for output
             callback: Callback for task output
             story_state: State manager for tracking progress
             artifacts: Story artifacts object for storing output
-            timeout_seconds: Timeout for the task
+            timeout_seconds: Timeout for each task
         """
-        # Skip if already completed
-        if story_state.has_task_output("characters") and story_state.has_task_output("character_development"):
-            artifacts.characters = story_state.get_task_output("characters")
-            artifacts.characters_enhanced = story_state.get_task_output("character_development")
-            return
+        # Wait for the upstream artifacts still generated in the background
+        artifacts.wait_for(self._phase_inputs(spec.phase))
         
-        # Create and execute the character task
-        character_task = self.task_factory.create_character_task(
-            genre=genre,
-            context=[artifacts.research, artifacts.worldbuilding],
-            chapter_num=chapter_num,
-            project_dir=project_dir,
-            callback=callback
-        )
-        
-        character_output = self.execution_engine.execute_task(
-            character_task, 
-            timeout_seconds=timeout_seconds
-        )
-        
-        # Store the output
-        artifacts.characters = character_output
-        story_state.save_task_output("characters", character_output)
-        
-        # Create and execute conditional character development task
-        character_dev_task = self.task_factory.create_character_development_task(
-            genre=genre,
-            context=character_task,
-            chapter_num=chapter_num,
-            project_dir=project_dir,
-            callback=callback
-        )
-        
-        try:
-            # Execute the conditional task - it will only run if the condition is met
-            character_dev_output = self.execution_engine.execute_task(
-                character_dev_task, 
-                timeout_seconds=timeout_seconds
-            )
-            
-            # Store the enhanced characters if task ran
-            if character_dev_output:
-                artifacts.characters_enhanced = character_dev_output
-                story_state.save_task_output("character_development", character_dev_output)
-        except Exception as e:
-            logger.warning(f"Character development task failed or was skipped: {str(e)}")
+        # Resume from a checkpoint saved by an earlier run
+        if self._restore_phase_checkpoint(spec.phase, genre, chapter_num, story_state, artifacts):
+            return
             
-    def _process_plot_phase(
-        self, 
-        genre: str, 
-        chapter_num: int, 
-        project_dir: str, 
-        callback: Callable, 
-        story_state: StoryStateManager,
-        artifacts: StoryArtifacts,
-        timeout_seconds: int
-    ) -> None:
-        """
-        Process the plot development phase of story generation.
-        
-        Args:
-            genre: The genre for plot development
-            chapter_num: The chapter number
-            project_dir: Project directory for output
-            callback: Callback for task output
-            story_state: State manager for tracking progress
-            artifacts: Story artifacts object for storing output
-            timeout_seconds: Timeout for the task
-        """
         # Skip if already completed
-        if story_state.has_task_output("plot") and story_state.has_task_output("plot_twist"):
-            artifacts.plot = story_state.get_task_output("plot")
-            artifacts.plot_twist = story_state.get_task_output("plot_twist")
+        if story_state.has_task_output(spec.task_name) and (
+            spec.followup_name is None or story_state.has_task_output(spec.followup_name)
+        ):
+            artifacts[spec.artifact] = story_state.get_task_output(spec.task_name)
+            if spec.followup_name is not None:
+                artifacts[spec.followup_artifact] = story_state.get_task_output(spec.followup_name)
             return
         
-        # Determine character context
-        character_context = artifacts.characters
-        if hasattr(artifacts, 'characters_enhanced') and artifacts.characters_enhanced:
-            character_context = artifacts.characters_enhanced
+        task_args = {
+            "genre": genre,
+            "chapter_num": chapter_num,
+            "project_dir": project_dir,
+            "callback": callback
+        }
         
-        # Create and execute the plot task
-        plot_task = self.task_factory.create_plot_task(
-            genre=genre,
-            context=[artifacts.research, artifacts.worldbuilding, character_context],
-            chapter_num=chapter_num,
-            project_dir=project_dir,
-            callback=callback
-        )
+        # Create and execute the main task
+        create_task = getattr(self.task_factory, spec.create_task)
+        if spec.context is None:
+            task = create_task(**task_args)
+        else:
+            task = create_task(context=spec.context(artifacts), **task_args)
         
-        plot_output = self.execution_engine.execute_task(
-            plot_task, 
-            timeout_seconds=timeout_seconds
-        )
+        output = self._execute_task(task, timeout_seconds=timeout_seconds)
         
         # Store the output
-        artifacts.plot = plot_output
-        story_state.save_task_output("plot", plot_output)
+        artifacts[spec.artifact] = output
+        story_state.save_task_output(spec.task_name, output)
         
-        # Create and execute conditional plot twist task
-        plot_twist_task = self.task_factory.create_plot_twist_task(
-            genre=genre,
-            context=plot_task,
-            chapter_num=chapter_num,
-            project_dir=project_dir,
-            callback=callback
+        if spec.create_followup is None:
+            self._save_phase_checkpoint(spec.phase, genre, chapter_num, story_state, artifacts)
+            return
+            
+        # Create the conditional follow-up task on the thread executing it,
+        # so it gets an agent of that thread
+        create_followup = functools.partial(
+            getattr(self.task_factory, spec.create_followup), context=task, **task_args
         )
+        followup_args = (spec, create_followup, genre, chapter_num, story_state, artifacts, timeout_seconds)
         
-        try:
-            # Execute the conditional task - it will only run if the condition is met
-            plot_twist_output = self.execution_engine.execute_task(
-                plot_twist_task, 
-                timeout_seconds=timeout_seconds
+        if spec.background_followup:
+            artifacts.defer(
+                spec.followup_artifact,
+                _followup_executor.submit(self._run_followup, *followup_args)
             )
-            
-            # Store the plot twist if task ran
-            if plot_twist_output:
-                artifacts.plot_twist = plot_twist_output
-                story_state.save_task_output("plot_twist", plot_twist_output)
-        except Exception as e:
-            logger.warning(f"Plot twist task failed or was skipped: {str(e)}")
-            
-    def _process_draft_phase(
-        self, 
-        genre: str, 
-        chapter_num: int, 
-        project_dir: str, 
-        callback: Callable, 
+        else:
+            self._run_followup(*followup_args)
+    
+    def _run_followup(
+        self,
+        spec: PhaseSpec,
+        create_task: Callable[[], Task],
+        genre: str,
+        chapter_num: int,
         story_state: StoryStateManager,
         artifacts: StoryArtifacts,
         timeout_seconds: int
     ) -> None:
         """
-        Process the draft writing phase of story generation.
+        Execute the follow-up task of a phase and save the phase's checkpoint.
+        
+        A failed or skipped follow-up task does not fail the phase.
         
         Args:
-            genre: The genre for writing
+            spec: Description of the phase
+            create_task: Function creating the follow-up task
+            genre: The genre of the story
             chapter_num: The chapter number
-            project_dir: Project directory for output
-            callback: Callback for task output
             story_state: State manager for tracking progress
             artifacts: Story artifacts object for storing output
             timeout_seconds: Timeout for the task
         """
-        # Skip if already completed
-        if story_state.has_task_output("draft"):
-            artifacts.draft = story_state.get_task_output("draft")
-            return
-        
-        # Determine plot context
-        plot_context = artifacts.plot
-        if hasattr(artifacts, 'plot_twist') and artifacts.plot_twist:
-            plot_context = f"{artifacts.plot}\n\nPLOT TWIST:\n{artifacts.plot_twist}"
+        try:
+            # Execute the conditional task - it will only run if the condition is met
+            followup_output = self._execute_task(create_task(), timeout_seconds=timeout_seconds)
             
-        # Determine character context
-        character_context = artifacts.characters
-        if hasattr(artifacts, 'characters_enhanced') and artifacts.characters_enhanced:
-            character_context = artifacts.characters_enhanced
-        
-        # Create and execute the writing task
-        writing_task = self.task_factory.create_writing_task(
-            genre=genre,
-            context=[artifacts.research, artifacts.worldbuilding, character_context, plot_context],
-            chapter_num=chapter_num,
-            project_dir=project_dir,
-            callback=callback
-        )
-        
-        draft_output = self.execution_engine.execute_task(
-            writing_task, 
-            timeout_seconds=timeout_seconds
-        )
+            # Store the follow-up output if the task ran
+            if followup_output:
+                artifacts[spec.followup_artifact] = followup_output
+                story_state.save_task_output(spec.followup_name, followup_output)
+        except ConditionalTaskSkipped:
+            logger.debug("%s task was skipped", spec.followup_name)
+        except Exception as e:
+            logger.warning("%s task failed or was skipped: %s", spec.followup_name, e)
         
-        # Store the output
-        artifacts.draft = draft_output
-        story_state.save_task_output("draft", draft_output)
+        self._save_phase_checkpoint(spec.phase, genre, chapter_num, story_state, artifacts)
+    
+    # Processors of the phases described in _PHASE_SPECS
+    _process_research_phase = functools.partialmethod(_run_phase, _PHASE_SPECS[Phase.RESEARCH])
+    _process_worldbuilding_phase = functools.partialmethod(_run_phase, _PHASE_SPECS[Phase.WORLDBUILDING])
+    _process_character_phase = functools.partialmethod(_run_phase, _PHASE_SPECS[Phase.CHARACTERS])
+    _process_plot_phase = functools.partialmethod(_run_phase, _PHASE_SPECS[Phase.PLOT])
+    _process_draft_phase = functools.partialmethod(_run_phase, _PHASE_SPECS[Phase.DRAFT])
             
     def _process_final_phase(
         self, 
@@ -648,6 +788,10 @@ class StoryGenerator:
             artifacts: Story artifacts object for storing output
             timeout_seconds: Timeout for the task
         """
+        # Resume from a checkpoint saved by an earlier run
+        if self._restore_phase_checkpoint(Phase.FINAL_STORY, genre, chapter_num, story_state, artifacts):
+            return
+            
         # Skip if already completed
         if story_state.has_task_output("final"):
             artifacts.final_story = story_state.get_task_output("final")
@@ -665,7 +809,7 @@ class StoryGenerator:
         improved_draft = artifacts.draft
         try:
             # Execute the conditional task - it will only run if the condition is met
-            style_output = self.execution_engine.execute_task(
+            style_output = self._execute_task(
                 style_improvement_task, 
                 timeout_seconds=timeout_seconds
             )
@@ -675,8 +819,10 @@ class StoryGenerator:
                 improved_draft = style_output
                 artifacts.style_improved = style_output
                 story_state.save_task_output("style_improvement", style_output)
+        except ConditionalTaskSkipped:
+            logger.debug("Style improvement task was skipped")
         except Exception as e:
-            logger.warning(f"Style improvement task failed or was skipped: {str(e)}")
+            logger.warning("Style improvement task failed or was skipped: %s", e)
             
         # Create and execute the consistency check task if needed    
         consistency_task = self.task_factory.create_consistency_check_task(
@@ -690,7 +836,7 @@ class StoryGenerator:
         consistent_draft = improved_draft
         try:
             # Execute the conditional task - it will only run if the condition is met
-            consistency_output = self.execution_engine.execute_task(
+            consistency_output = self._execute_task(
                 consistency_task, 
                 timeout_seconds=timeout_seconds
             )
@@ -700,8 +846,10 @@ class StoryGenerator:
                 consistent_draft = consistency_output
                 artifacts.consistency_fixed = consistency_output
                 story_state.save_task_output("consistency_check", consistency_output)
+        except ConditionalTaskSkipped:
+            logger.debug("Consistency check task was skipped")
         except Exception as e:
-            logger.warning(f"Consistency check task failed or was skipped: {str(e)}")
+            logger.warning("Consistency check task failed or was skipped: %s", e)
             
         # Now do the final editing with the best draft we have
         editing_task = self.task_factory.create_editing_task(
@@ -712,7 +860,7 @@ class StoryGenerator:
             callback=callback
         )
         
-        final_output = self.execution_engine.execute_task(
+        final_output = self._execute_task(
             editing_task, 
             timeout_seconds=timeout_seconds
         )
@@ -720,28 +868,35 @@ class StoryGenerator:
         # Store the output
         artifacts.final_story = final_output
         story_state.save_task_output("final", final_output)
+        
+        self._save_phase_checkpoint(Phase.FINAL_STORY, genre, chapter_num, story_state, artifacts)
     
     def execute_detailed_research(
         self, 
         genre: str, 
-        custom_inputs: Optional[Dict[str, Any]] = None
+        custom_inputs: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None
     ) -> str:
         """
         Execute a detailed research process with multiple subtasks.
         
+        Subtasks without context are executed concurrently. Subtasks that
+        take earlier subtasks as context need their output, so they are
+        executed afterwards, in order.
+        
         Args:
             genre: The genre to research
             custom_inputs: Optional custom inputs
+            max_workers: Maximum number of subtasks to execute at once. Defaults
+                         to the number of subtasks, capped at the CPU count.
             
         Returns:
             Comprehensive research results
         """
         # Get chapter number and project directory
-        chapter_num = custom_inputs.get("chapter_number", 1) if custom_inputs else 1
-        title = custom_inputs.get("title", f"{genre} Research") if custom_inputs else f"{genre} Research"
-        project_dir = title.lower().replace(" ", "_")
+        chapter_num, title, project_dir = self._story_context(custom_inputs, f"{genre} Research")
         
-        logger.info(f"Starting detailed research for {genre}")
+        logger.info("Starting detailed research for %s", genre)
         
         # Get research subtasks
         research_tasks = self.task_factory.create_research_subtasks(
@@ -750,47 +905,84 @@ class StoryGenerator:
             project_dir=project_dir
         )
         
-        # Execute each research subtask
-        results = []
-        for task in research_tasks:
-            logger.info(f"Executing research subtask: {task.name}")
-            result = self.execution_engine.execute_task(task)
-            results.append(result)
+        def execute_subtask(task: Task) -> str:
+            logger.info("Executing research subtask: %s", task.name)
+            return self._execute_task(task)
+        
+        if max_workers is None:
+            max_workers = min(len(research_tasks), os.cpu_count() or 1)
+        
+        # Execute the subtasks without context concurrently, then the ones
+        # using their output in order, keeping results in task order
+        outputs: Dict[int, str] = {}
+        independent = [i for i, task in enumerate(research_tasks) if not _has_task_context(task)]
+        if len(independent) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(independent))) as executor:
+                independent_tasks = [research_tasks[i] for i in independent]
+                outputs.update(zip(independent, executor.map(execute_subtask, independent_tasks)))
+        
+        for i, task in enumerate(research_tasks):
+            if i not in outputs:
+                outputs[i] = execute_subtask(task)
+        results = [outputs[i] for i in range(len(research_tasks))]
+        
+        # Compile all research results in one join
+        parts = [f"# {genre.title()} Pulp Fiction Research Brief\n"]
+        for i, section in enumerate(_RESEARCH_SECTIONS):
+            parts += ("\n## ", section, "\n", results[i] if i < len(results) else "", "\n")
+        compiled_research = "".join(parts)
+        
+        # Save the compiled results, waiting for the write so that callers
+        # can read the file as soon as this returns
+        output_file = Path("output") / project_dir / f"chapter_{chapter_num}" / "research.txt"
+        queue_write(output_file, compiled_research)
+        logger.info("Saving compiled research to %s", output_file)
+        flush_writes()
         
-        # Compile all research results
-        compiled_research = f"""# {genre.title()} Pulp Fiction Research Brief
-
-## Core Genre Elements
-{results[0] if len(results) > 0 else ""}
-
-## Historical Context
-{results[1] if len(results) > 1 else ""}
-
-## Writing Style Guide
-{results[2] if len(results) > 2 else ""}
-"""
+        return compiled_research
+    
+    def _story_context(
+        self,
+        custom_inputs: Optional[Dict[str, Any]],
+        default_title: str = "Untitled Story"
+    ) -> Tuple[int, str, str]:
+        """
+        Get the chapter number, title and project directory of a story.
         
-        # Save the compiled results
-        try:
-            # Create the directory structure first
-            output_file = f"output/{project_dir}/chapter_{chapter_num}/research.txt"
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        The project directory is derived the same way as the state
+        manager's, so task output files and saved state share a directory.
+        
+        Args:
+            custom_inputs: Custom inputs of the story, if any
+            default_title: Title used when the inputs do not give one
             
-            # Use FileWriteTool if available from crewai_tools
-            try:
-                from crewai_tools import FileWriteTool
-                file_tool = FileWriteTool()
-                file_tool.write(path=output_file, content=compiled_research)
-                logger.info(f"Saved compiled research to {output_file} using FileWriteTool")
-            except ImportError:
-                # Fallback to direct file writing if tool not available
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(compiled_research)
-                logger.info(f"Saved compiled research to {output_file}")
-        except Exception as e:
-            logger.error(f"Error saving compiled research: {e}")
+        Returns:
+            Tuple of chapter number, title and project directory name
+        """
+        custom_inputs = custom_inputs or {}
+        title = custom_inputs.get("title", default_title)
+        return custom_inputs.get("chapter_number", 1), title, project_dir_name(title)
+    
+    def _prime_fallbacks(self, genre: str) -> Dict[str, str]:
+        """
+        Format every fallback template for a genre, once per genre.
         
-        return compiled_research
+        Called when generation of a story starts, so the fallback path only
+        has to look up the formatted content.
+        
+        Args:
+            genre: The genre of the story
+            
+        Returns:
+            Fallback content for each step type
+        """
+        formatted = self._formatted_fallbacks.get(genre)
+        if formatted is None:
+            formatted = self._formatted_fallbacks[genre] = {
+                step_type: template.format(genre=genre, step_type=step_type)
+                for step_type, template in self.fallback_templates.items()
+            }
+        return formatted
     
     def _get_fallback_content(self, step_type: str, genre: str) -> str:
         """
@@ -801,63 +993,317 @@ class StoryGenerator:
             genre: The genre of the story
             
         Returns:
-            Fallback content for the step
+            Fallback content for the step
+        """
+        content = self._prime_fallbacks(genre).get(step_type)
+        if content is None:
+            content = f"Placeholder content for {genre} {step_type}."
+        return content
+    
+    def _process_step_with_fallback(
+        self, 
+        step_name: str,
+        process_func: Callable,
+        genre: str,
+        chapter_num: int,
+        project_dir: str,
+        callback: Callable,
+        story_state: StoryStateManager,
+        artifacts: StoryArtifacts,
+        timeout_seconds: int,
+        completed_steps: Optional[Set[str]] = None
+    ) -> None:
+        """
+        Process a story generation step with fallback to ensure robustness.
+        
+        Args:
+            step_name: Name of the step
+            process_func: Function to process the step
+            genre: Genre of the story
+            chapter_num: Chapter number
+            project_dir: Project directory
+            callback: Callback function
+            story_state: Story state manager
+            artifacts: Story artifacts
+            timeout_seconds: Timeout in seconds
+            completed_steps: Optional snapshot of the steps already completed for
+                             the chapter, used instead of querying the story state
+                             and updated when the step completes
+        """
+        if completed_steps is not None:
+            already_completed = step_name in completed_steps
+        else:
+            already_completed = story_state.has_completed_task(step_name, chapter_num)
+            
+        try:
+            if not already_completed:
+                # Execute the step process
+                process_func(genre, chapter_num, project_dir, callback, story_state, artifacts, timeout_seconds)
+                if completed_steps is not None:
+                    completed_steps.add(step_name)
+            else:
+                # Load existing content
+                logger.info("Found existing %s output in story state", step_name)
+                content = story_state.get_task_output(step_name, chapter_num)
+                if step_name in artifacts:
+                    artifacts[step_name] = content
+        except Exception as e:
+            logger.error("Error in %s phase: %s", step_name, e, exc_info=True)
+            
+            # Use fallback content only if no existing content
+            is_artifact = step_name in artifacts
+            if not is_artifact or artifacts[step_name] is None:
+                fallback_content = self._get_fallback_content(step_name, genre)
+                logger.warning("Using fallback content for %s", step_name)
+                
+                if is_artifact:
+                    artifacts[step_name] = fallback_content
+                
+                story_state.add_task_output(step_name, chapter_num, fallback_content)
+                if completed_steps is not None:
+                    completed_steps.add(step_name)
+    
+    def _phase_inputs(self, phase: str) -> Tuple[str, ...]:
+        """
+        Get the artifact fields a phase is generated from.
+        
+        Args:
+            phase: Name of the phase
+            
+        Returns:
+            The artifact fields of the phases the phase depends on, less
+            those in PHASE_SKIPPED_INPUTS
+        """
+        skipped = self.PHASE_SKIPPED_INPUTS.get(phase, ())
+        return tuple(
+            field
+            for dependency in self.PHASE_DEPENDENCIES.get(phase, ())
+            for field in self.PHASE_ARTIFACTS[dependency]
+            if field not in skipped
+        )
+    
+    def _phase_input_key(
+        self,
+        phase: str,
+        genre: str,
+        chapter_num: int,
+        artifacts: StoryArtifacts
+    ) -> str:
+        """
+        Build a digest of everything a phase's output is generated from.
+        
+        Covers the genre, the chapter and the upstream artifacts the phase
+        is generated from, so a checkpoint is only reused for the same inputs.
+        
+        Args:
+            phase: Name of the phase
+            genre: Genre of the story
+            chapter_num: Chapter number
+            artifacts: Story artifacts holding the upstream phase outputs
+            
+        Returns:
+            Hex digest identifying the phase inputs
+        """
+        upstream = {field: artifacts[field] for field in self._phase_inputs(phase)}
+        payload = json.dumps(
+            {
+                "version": self.CHECKPOINT_VERSION,
+                "phase": str(phase),
+                "genre": genre,
+                "chapter": chapter_num,
+                "upstream": upstream
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _restore_phase_checkpoint(
+        self,
+        phase: str,
+        genre: str,
+        chapter_num: int,
+        story_state: StoryStateManager,
+        artifacts: StoryArtifacts
+    ) -> bool:
+        """
+        Fill in the artifacts of a phase from its saved checkpoint.
+        
+        Without a checkpoint in the project, the outputs are looked up in
+        the phase cache, if there is one. Outputs found there are saved to
+        the story state and as the project's checkpoint.
+        
+        Args:
+            phase: Name of the phase
+            genre: Genre of the story
+            chapter_num: Chapter number
+            story_state: Story state manager holding the checkpoints
+            artifacts: Story artifacts to fill in
+            
+        Returns:
+            True if the phase was restored and does not need to run
+        """
+        input_key = self._phase_input_key(phase, genre, chapter_num, artifacts)
+        outputs = story_state.load_cached_phase(
+            phase, chapter_num, genre, input_key, max_age=self.CHECKPOINT_TTL
+        )
+        fields = self.PHASE_ARTIFACTS[phase]
+        shared = False
+        if (not outputs or outputs.get(fields[0]) is None) and self.phase_cache is not None:
+            outputs = self.phase_cache.get(input_key)
+            shared = True
+        if not outputs or outputs.get(fields[0]) is None:
+            return False
+            
+        outputs = {field: outputs[field] for field in fields if outputs.get(field) is not None}
+        for field, output in outputs.items():
+            artifacts[field] = output
+            
+        if shared:
+            story_state.add_task_outputs(
+                {_ARTIFACT_TASKS.get(field, field): output for field, output in outputs.items()},
+                chapter_num
+            )
+            story_state.save_cached_phase(phase, chapter_num, genre, outputs, input_key)
+            
+        logger.info(
+            "Restored %s phase for chapter %s from %s",
+            phase, chapter_num, "the phase cache" if shared else "checkpoint"
+        )
+        return True
+    
+    def _save_phase_checkpoint(
+        self,
+        phase: str,
+        genre: str,
+        chapter_num: int,
+        story_state: StoryStateManager,
+        artifacts: StoryArtifacts
+    ) -> None:
+        """
+        Save the artifacts of a completed phase as a checkpoint.
+        
+        They are also added to the phase cache, if there is one.
+        
+        Args:
+            phase: Name of the phase
+            genre: Genre of the story
+            chapter_num: Chapter number
+            story_state: Story state manager holding the checkpoints
+            artifacts: Story artifacts with the phase output
+        """
+        fields = self.PHASE_ARTIFACTS[phase]
+        if artifacts[fields[0]] is None:
+            return
+            
+        outputs = {field: artifacts[field] for field in fields}
+        input_key = self._phase_input_key(phase, genre, chapter_num, artifacts)
+        story_state.save_cached_phase(phase, chapter_num, genre, outputs, input_key)
+        if self.phase_cache is not None:
+            self.phase_cache.put(input_key, outputs)
+    
+    def _get_phase_processors(self) -> Dict[str, Callable]:
+        """
+        Get the processing function of each phase of the phased pipeline.
+        
+        Returns:
+            Dictionary mapping phase names to their processing functions
         """
-        template = self.fallback_templates.get(
-            step_type, 
-            "Placeholder content for {genre} {step_type}."
-        )
-        return template.format(genre=genre, step_type=step_type)
+        return {
+            Phase.RESEARCH: self._process_research_phase,
+            Phase.WORLDBUILDING: self._process_worldbuilding_phase,
+            Phase.CHARACTERS: self._process_character_phase,
+            Phase.PLOT: self._process_plot_phase,
+            Phase.DRAFT: self._process_draft_phase,
+            Phase.FINAL_STORY: self._process_final_phase,
+        }
     
-    def _process_step_with_fallback(
-        self, 
-        step_name: str,
-        process_func: Callable,
+    def _run_phase_dag(
+        self,
+        dependencies: Dict[str, Tuple[str, ...]],
         genre: str,
         chapter_num: int,
         project_dir: str,
         callback: Callable,
         story_state: StoryStateManager,
         artifacts: StoryArtifacts,
-        timeout_seconds: int
+        timeout_seconds: int,
+        completed_steps: Optional[Set[str]] = None,
+        fallback_phases: Optional[Set[str]] = None
     ) -> None:
         """
-        Process a story generation step with fallback to ensure robustness.
+        Process story phases as soon as the phases they depend on are complete.
+        
+        Phases that become ready together are processed concurrently. A phase
+        that is the only one ready runs on the calling thread, so a strictly
+        sequential pipeline behaves exactly like processing the phases in order.
         
         Args:
-            step_name: Name of the step
-            process_func: Function to process the step
+            dependencies: Phase names mapped to the phases they depend on
             genre: Genre of the story
             chapter_num: Chapter number
             project_dir: Project directory
             callback: Callback function
             story_state: Story state manager
             artifacts: Story artifacts
-            timeout_seconds: Timeout in seconds
+            timeout_seconds: Timeout for each phase
+            completed_steps: Optional snapshot of the phases already completed,
+                             passed on to _process_step_with_fallback
+            fallback_phases: Phases processed through _process_step_with_fallback;
+                             all phases if not given. Errors of the other phases
+                             are raised.
+            
+        Raises:
+            GenerationError: If the dependencies are cyclic or name unknown phases
         """
+        processors = self._get_phase_processors()
+        pending = {name: set(deps) for name, deps in dependencies.items()}
+        completed = set()
+        
+        def process(name: str) -> None:
+            if fallback_phases is not None and name not in fallback_phases:
+                processors[name](genre, chapter_num, project_dir, callback, story_state, artifacts, timeout_seconds)
+                return
+            self._process_step_with_fallback(
+                name, processors[name],
+                genre, chapter_num, project_dir, callback, story_state, artifacts, timeout_seconds,
+                completed_steps
+            )
+        
         try:
-            if not story_state.has_completed_task(step_name, chapter_num):
-                # Execute the step process
-                process_func(genre, chapter_num, project_dir, callback, story_state, artifacts, timeout_seconds)
-            else:
-                # Load existing content
-                logger.info(f"Found existing {step_name} output in story state")
-                content = story_state.get_task_output(step_name, chapter_num)
-                if hasattr(artifacts, step_name):
-                    setattr(artifacts, step_name, content)
-        except Exception as e:
-            logger.error(f"Error in {step_name} phase: {str(e)}")
-            logger.error(traceback.format_exc())
-            
-            # Use fallback content only if no existing content
-            if not hasattr(artifacts, step_name) or getattr(artifacts, step_name) is None:
-                fallback_content = self._get_fallback_content(step_name, genre)
-                logger.warning(f"Using fallback content for {step_name}")
-                
-                if hasattr(artifacts, step_name):
-                    setattr(artifacts, step_name, fallback_content)
-                
-                story_state.add_task_output(step_name, chapter_num, fallback_content)
+            with ThreadPoolExecutor(max_workers=max(1, len(pending))) as executor:
+                running = {}
+                while pending or running:
+                    ready = [name for name, deps in pending.items() if deps <= completed]
+                    for name in ready:
+                        del pending[name]
+                    
+                    if len(ready) == 1 and not running:
+                        process(ready[0])
+                        completed.add(ready[0])
+                        continue
+                        
+                    for name in ready:
+                        running[executor.submit(process, name)] = name
+                        
+                    if not running:
+                        raise GenerationError(
+                            f"Phases with unsatisfiable dependencies: {', '.join(sorted(pending))}"
+                        )
+                    
+                    # Unblock dependents as soon as any running phase finishes
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        name = running.pop(future)
+                        future.result()
+                        completed.add(name)
+        except BaseException:
+            # Do not leave follow-up tasks updating the story state after the pipeline failed
+            artifacts.cancel_deferred()
+            raise
+        
+        # Let the follow-up tasks no later phase waited for finish too
+        artifacts.wait_for()
     
     def generate_story_phased(
         self,
@@ -880,55 +1326,110 @@ class StoryGenerator:
         Returns:
             The generated story
         """
-        # Parse the project directory from custom inputs or use default
-        project_dir = custom_inputs.get("project_dir", "default_project") if custom_inputs else "default_project"
+        # Parse the project name from custom inputs or use default
+        project_name = custom_inputs.get("project_dir", "default_project") if custom_inputs else "default_project"
+        
+        # Sanitize it like the state manager does, so task output files and
+        # saved state share a directory
+        project_dir = project_dir_name(project_name)
         
         # Initialize the story state manager with the project directory
-        story_state = copy.deepcopy(self.state_manager)
-        story_state.set_project_directory(project_dir)
+        story_state = self.state_manager.clone()
+        story_state.set_project_directory(project_name)
         
         # Create story artifacts container
         artifacts = StoryArtifacts(
             genre=genre,
-            title=project_dir
+            title=project_name
         )
         
         # Chapter number - currently we just generate one chapter
         chapter_num = 1
         
-        # Process each phase with fallback handling
-        self._process_step_with_fallback(
-            "research", self._process_research_phase,
-            genre, chapter_num, project_dir, callback, story_state, artifacts, timeout_seconds
+        # Check once which phases the story state already has output for
+        completed_steps = story_state.completed_phases(chapter_num, self.PHASE_DEPENDENCIES)
+        
+        # A story whose phases are all done only needs its final story read
+        # back. The final phase saves the story under its task's name, not
+        # the phase's, so placeholder stories saved under the phase's name
+        # are generated again.
+        if completed_steps.issuperset(self.PHASE_DEPENDENCIES.keys() - {Phase.FINAL_STORY}):
+            final_story = story_state.get_task_output(_ARTIFACT_TASKS["final_story"], chapter_num)
+            if final_story:
+                logger.info("All phases of chapter %s already completed", chapter_num)
+                return final_story
+        
+        # Format the fallback content for this genre up front
+        self._prime_fallbacks(genre)
+        
+        # Process each phase with fallback handling, following the phase dependencies
+        self._run_phase_dag(
+            self.PHASE_DEPENDENCIES,
+            genre, chapter_num, project_dir, callback, story_state, artifacts, timeout_seconds,
+            completed_steps
         )
         
-        self._process_step_with_fallback(
-            "worldbuilding", self._process_worldbuilding_phase,
-            genre, chapter_num, project_dir, callback, story_state, artifacts, timeout_seconds
-        )
+        # Wait for the task outputs saved in the background
+        story_state.flush()
         
-        self._process_step_with_fallback(
-            "characters", self._process_character_phase,
-            genre, chapter_num, project_dir, callback, story_state, artifacts, timeout_seconds
-        )
+        # Return the final story
+        return artifacts.final_story or self._get_fallback_content(Phase.FINAL_STORY, genre)
+    
+    async def generate_story_phased_async(
+        self,
+        genre: str,
+        custom_inputs: Optional[Dict[str, Any]] = None,
+        config: Optional[Dict[str, Any]] = None,
+        timeout_seconds: int = 60,  # Per-phase timeout
+        callback: Optional[Callable] = None
+    ) -> str:
+        """
+        Generate a story using the phased approach without blocking the event loop.
         
-        self._process_step_with_fallback(
-            "plot", self._process_plot_phase,
-            genre, chapter_num, project_dir, callback, story_state, artifacts, timeout_seconds
-        )
+        The story is generated by generate_story_phased in the event loop's
+        default executor, so several stories can be generated concurrently
+        from one event loop. Independent phases within a story still run
+        concurrently as in generate_story_phased.
         
-        self._process_step_with_fallback(
-            "draft", self._process_draft_phase,
-            genre, chapter_num, project_dir, callback, story_state, artifacts, timeout_seconds
+        Args:
+            genre: The genre to generate
+            custom_inputs: Custom inputs for the generation
+            config: Configuration overrides
+            timeout_seconds: Timeout for each phase
+            callback: Optional callback function
+            
+        Returns:
+            The generated story
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.generate_story_phased,
+                genre=genre,
+                custom_inputs=custom_inputs,
+                config=config,
+                timeout_seconds=timeout_seconds,
+                callback=callback
+            )
         )
+    
+    def _get_flow_factory(self):
+        """
+        Get the flow factory for the generator's crew factory.
         
-        self._process_step_with_fallback(
-            "final_story", self._process_final_phase,
-            genre, chapter_num, project_dir, callback, story_state, artifacts, timeout_seconds
-        )
+        The flow factory is created on first use and reused until the crew
+        factory is replaced.
         
-        # Return the final story
-        return artifacts.final_story or self._get_fallback_content("final_story", genre)
+        Returns:
+            The FlowFactory wrapping self.crew_factory
+        """
+        if self._flow_factory is None or self._flow_factory.crew_factory is not self.crew_factory:
+            # Import flow components (avoid circular imports)
+            from ..flow.flow_factory import FlowFactory
+            
+            self._flow_factory = FlowFactory(self.crew_factory)
+        return self._flow_factory
     
     def generate_story_with_flow(
         self, 
@@ -936,7 +1437,8 @@ class StoryGenerator:
         custom_inputs: Optional[Dict[str, Any]] = None,
         config: Optional[Dict[str, Any]] = None,
         debug_mode: Optional[bool] = None,
-        timeout_seconds: int = 300
+        timeout_seconds: int = 300,
+        use_cache: bool = True
     ) -> str:
         """
         Generate a story using the CrewAI Flow approach.
@@ -945,68 +1447,210 @@ class StoryGenerator:
         a complete story. The flow approach provides better orchestration,
         state management, and visualization capabilities.
         
+        Stories generated by the flow are cached by genre and custom inputs,
+        so repeating a request returns the earlier story without running the
+        flow again. A request made while an identical one is still running
+        waits up to timeout_seconds for that one's story.
+        
         Args:
             genre: The genre to generate for
             custom_inputs: Optional custom inputs
             config: Optional configuration overrides
             debug_mode: Override the default debug mode setting
             timeout_seconds: Maximum time for generation
+            use_cache: Whether to reuse and cache flow-generated stories
             
         Returns:
             The generated story
+            
+        Raises:
+            ConfigurationError: If the story cannot be generated with the current configuration
+            InputValidationError: If the inputs are invalid
+            TimeoutError: If an identical running request does not finish in time
         """
-        # Allow per-story debug mode override
-        original_debug_mode = self.debug_mode
-        if debug_mode is not None:
-            self.debug_mode = debug_mode
-            self.execution_engine.debug_mode = debug_mode
+        # Key the cache before the flow adds its own entries to custom_inputs
+        if not use_cache:
+            return self._generate_story_with_flow(genre, custom_inputs, config, debug_mode, timeout_seconds)
+        cache_key = _story_cache_key(genre, custom_inputs)
+        
+        # Reuse a cached story, or wait for an identical request that is already running
+        with self._story_cache_lock:
+            cached = self._story_cache.get(cache_key)
+            if cached is not None:
+                self._story_cache.move_to_end(cache_key)
+                logger.info("Using cached flow-generated story for genre: %s", genre)
+                return cached
+            
+            in_flight = self._stories_in_flight.get(cache_key)
+            if in_flight is None:
+                future = self._stories_in_flight[cache_key] = Future()
+        
+        if in_flight is not None:
+            logger.info("Waiting for identical flow-based story request for genre: %s", genre)
+            try:
+                return in_flight.result(timeout=timeout_seconds)
+            except FutureTimeoutError:
+                raise TimeoutError(
+                    f"Identical story request for genre {genre} did not finish within {timeout_seconds} seconds"
+                ) from None
         
         try:
-            logger.info(f"Creating story flow for genre: {genre}")
-            
-            # Import flow components (avoid circular imports)
-            from ..flow.flow_factory import FlowFactory
-            
-            # Create flow factory
-            flow_factory = FlowFactory(self.crew_factory)
-            
-            # Generate the story using the flow
-            logger.info(f"Executing story flow with timeout of {timeout_seconds} seconds")
-            result = flow_factory.generate_story(
-                genre=genre,
-                custom_inputs=custom_inputs,
-                timeout_seconds=timeout_seconds
+            result = self._generate_story_with_flow(
+                genre, custom_inputs, config, debug_mode, timeout_seconds, cache_key
             )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._story_cache_lock:
+                del self._stories_in_flight[cache_key]
+    
+    def _generate_story_with_flow(
+        self,
+        genre: str,
+        custom_inputs: Optional[Dict[str, Any]],
+        config: Optional[Dict[str, Any]],
+        debug_mode: Optional[bool],
+        timeout_seconds: int,
+        cache_key: Optional[str] = None
+    ) -> str:
+        """
+        Generate a story with a story flow, falling back to the traditional approach.
+        
+        Args:
+            genre: The genre to generate for
+            custom_inputs: Optional custom inputs
+            config: Optional configuration overrides
+            debug_mode: Override the default debug mode setting
+            timeout_seconds: Maximum time for generation
+            cache_key: Story cache key to store a flow-generated story under
             
-            # Log the result for debugging
-            logger.info(f"Flow-based story generation complete, result length: {len(result)} characters")
-            
+        Returns:
+            The generated story
+        """
+        # Format the fallback content for this genre up front
+        self._prime_fallbacks(genre)
+        
+        # The flow does not use the execution engine, so the debug mode override
+        # only needs to reach the traditional approach
+        result = self._try_generate_flow(genre, custom_inputs, timeout_seconds)
+        if result is not None:
+            if cache_key is not None:
+                with self._story_cache_lock:
+                    self._story_cache[cache_key] = result
+                    while len(self._story_cache) > self.STORY_CACHE_SIZE:
+                        self._story_cache.popitem(last=False)
             return result
-        except Exception as e:
-            logger.error(f"Error during flow-based story generation: {str(e)}")
-            logger.error(traceback.format_exc())
+        
+        # Fall back to traditional approach, which falls back to the phased
+        # approach and a placeholder story itself
+        logger.info("Falling back to traditional story generation approach")
+        return self.generate_story(
+            genre=genre,
+            custom_inputs=custom_inputs,
+            config=config,
+            debug_mode=debug_mode,
+            timeout_seconds=timeout_seconds
+        )
+    
+    def _try_generate_flow(
+        self,
+        genre: str,
+        custom_inputs: Optional[Dict[str, Any]],
+        timeout_seconds: int
+    ) -> Optional[str]:
+        """
+        Generate a story with a story flow, the primary approach of generate_story_with_flow.
+        
+        The flow is retried FLOW_RETRIES times after transient errors.
+        
+        Args:
+            genre: The genre to generate for
+            custom_inputs: Optional custom inputs
+            timeout_seconds: Maximum time for generation
+            
+        Returns:
+            The generated story, or None if generation failed
             
-            # Fall back to traditional approach
-            logger.info("Falling back to traditional story generation approach")
+        Raises:
+            ConfigurationError: If the story cannot be generated with the current configuration
+            InputValidationError: If the inputs are invalid
+        """
+        attempt = 0
+        while True:
+            attempt += 1
             try:
-                return self.generate_story(
+                logger.info("Creating story flow for genre: %s", genre)
+                
+                flow_factory = self._get_flow_factory()
+                
+                # Generate the story using the flow
+                logger.info("Executing story flow with timeout of %s seconds", timeout_seconds)
+                result = flow_factory.generate_story(
                     genre=genre,
                     custom_inputs=custom_inputs,
-                    config=config,
-                    debug_mode=debug_mode,
                     timeout_seconds=timeout_seconds
                 )
-            except Exception as fallback_error:
-                logger.error(f"Fallback story generation also failed: {str(fallback_error)}")
                 
-                # Use our placeholder story if all else fails
-                logger.info("Generating placeholder story as last resort")
-                placeholder = self._get_fallback_content("final_story", genre)
-                return placeholder
-        finally:
-            # Restore original debug mode
-            self.debug_mode = original_debug_mode
-            self.execution_engine.debug_mode = original_debug_mode
+                # Log the result for debugging
+                logger.info("Flow-based story generation complete, result length: %s characters", len(result))
+                
+                return result
+            except self.UNRETRYABLE_ERRORS:
+                raise
+            except self.TRANSIENT_ERRORS as e:
+                if attempt <= self.FLOW_RETRIES:
+                    logger.warning("Transient error during flow-based story generation, retrying: %s", e)
+                    continue
+                logger.error("Error during flow-based story generation: %s", e, exc_info=True)
+                return None
+            except Exception as e:
+                logger.error("Error during flow-based story generation: %s", e, exc_info=True)
+                return None
+    
+    async def generate_story_with_flow_async(
+        self, 
+        genre: str, 
+        custom_inputs: Optional[Dict[str, Any]] = None,
+        config: Optional[Dict[str, Any]] = None,
+        debug_mode: Optional[bool] = None,
+        timeout_seconds: int = 300,
+        use_cache: bool = True
+    ) -> str:
+        """
+        Generate a story using the CrewAI Flow approach without blocking the event loop.
+        
+        The story is generated by generate_story_with_flow in the event loop's
+        default executor, so several stories can be generated concurrently
+        from one event loop, with the same timeout, fallbacks and caching.
+        
+        Args:
+            genre: The genre to generate for
+            custom_inputs: Optional custom inputs
+            config: Optional configuration overrides
+            debug_mode: Override the default debug mode setting
+            timeout_seconds: Maximum time for generation
+            use_cache: Whether to reuse and cache flow-generated stories
+            
+        Returns:
+            The generated story
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.generate_story_with_flow,
+                genre=genre,
+                custom_inputs=custom_inputs,
+                config=config,
+                debug_mode=debug_mode,
+                timeout_seconds=timeout_seconds,
+                use_cache=use_cache
+            )
+        )
     
     def visualize_story_flow(
         self, 
@@ -1017,6 +1661,9 @@ class StoryGenerator:
         """
         Generate a visualization of the story generation flow.
         
+        A visualization that was already written to the same file for the
+        same genre and custom inputs is reused while the file exists.
+        
         Args:
             genre: The genre for visualization
             output_file: The output file path for the visualization
@@ -1025,14 +1672,19 @@ class StoryGenerator:
         Returns:
             Path to the saved visualization
         """
-        from ..flow.flow_factory import FlowFactory
+        cache_key = _story_cache_key(genre, custom_inputs)
+        cached = self._visualization_cache.get(output_file)
+        if cached is not None and cached[0] == cache_key and os.path.exists(cached[1]):
+            return cached[1]
         
-        flow_factory = FlowFactory(self.crew_factory)
-        return flow_factory.visualize_story_flow(
+        flow_factory = self._get_flow_factory()
+        output_path = flow_factory.visualize_story_flow(
             genre=genre,
             output_file=output_file,
             custom_inputs=custom_inputs
         )
+        self._visualization_cache[output_file] = (cache_key, output_path)
+        return output_path
 
     def _process_raw_tool_outputs(
         self,
@@ -1048,6 +1700,10 @@ class StoryGenerator:
         """
         Process raw tool outputs before main story generation.
         
+        The tool tasks do not depend on each other, so they are executed
+        concurrently. Their outputs are stored on the calling thread as
+        they complete.
+        
         Args:
             genre: The genre for the tasks
             tools: Dictionary of tools to use for different tasks
@@ -1060,166 +1716,68 @@ class StoryGenerator:
         """
         logger.info("Processing raw tool outputs for additional data collection")
         
-        # Dictionary mapping task names to artifacts attributes
-        task_to_artifact = {
-            "raw_genre_research": "raw_genre_research",
-            "raw_character_references": "raw_character_references",
-            "raw_style_examples": "raw_style_examples",
-            "raw_plot_structures": "raw_plot_structures"
-        }
-        
-        # Check for web search tool for research
-        if "search_tool" in tools:
+        # Create the tasks of the tools whose output is not saved yet
+        tasks: Dict[str, Task] = {}
+        for tool_name, tool in tools.items():
+            task_name, create_task = _RAW_TOOL_TASKS.get(tool_name, (f"raw_{tool_name}", None))
+            
             # Skip if already completed
-            if not story_state.has_task_output("raw_genre_research"):
-                logger.info("Executing raw genre research task")
-                
-                try:
-                    # Create and execute the raw research task
-                    raw_research_task = self.task_factory.create_raw_research_task(
+            if story_state.has_task_output(task_name):
+                continue
+            
+            try:
+                if create_task is not None:
+                    tasks[task_name] = getattr(self.task_factory, create_task)(
                         genre=genre,
-                        tool=tools["search_tool"],
+                        tool=tool,
                         chapter_num=chapter_num,
                         project_dir=project_dir,
                         callback=callback
                     )
-                    
-                    raw_research_output = self.execution_engine.execute_task(
-                        raw_research_task, 
-                        timeout_seconds=timeout_seconds
-                    )
-                    
-                    # Store the output
-                    artifacts.raw_genre_research = raw_research_output
-                    story_state.save_task_output("raw_genre_research", raw_research_output)
-                except Exception as e:
-                    logger.warning(f"Raw genre research task failed: {str(e)}")
-        
-        # Check for character reference tool
-        if "character_tool" in tools:
-            # Skip if already completed
-            if not story_state.has_task_output("raw_character_references"):
-                logger.info("Executing raw character references task")
+                    continue
                 
-                try:
-                    # Create and execute the raw character references task
-                    raw_char_task = self.task_factory.create_raw_character_references_task(
-                        genre=genre,
-                        tool=tools["character_tool"],
-                        chapter_num=chapter_num,
-                        project_dir=project_dir,
-                        callback=callback
-                    )
-                    
-                    raw_char_output = self.execution_engine.execute_task(
-                        raw_char_task, 
-                        timeout_seconds=timeout_seconds
-                    )
-                    
-                    # Store the output
-                    artifacts.raw_character_references = raw_char_output
-                    story_state.save_task_output("raw_character_references", raw_char_output)
-                except Exception as e:
-                    logger.warning(f"Raw character references task failed: {str(e)}")
-        
-        # Check for style examples tool
-        if "style_tool" in tools:
-            # Skip if already completed
-            if not story_state.has_task_output("raw_style_examples"):
-                logger.info("Executing raw style examples task")
+                # Create a generic agent for this tool
+                generic_agent = self.task_factory.agent_factory.create_agent(
+                    role=f"{genre.title()} Specialist",
+                    goal=f"Gather information about {genre} using specialized tools",
+                    backstory=f"You are an expert in {genre} fiction with access to specialized research tools."
+                )
                 
-                try:
-                    # Create and execute the raw style examples task
-                    raw_style_task = self.task_factory.create_raw_style_examples_task(
-                        genre=genre,
-                        tool=tools["style_tool"],
-                        chapter_num=chapter_num,
-                        project_dir=project_dir,
-                        callback=callback
-                    )
-                    
-                    raw_style_output = self.execution_engine.execute_task(
-                        raw_style_task, 
-                        timeout_seconds=timeout_seconds
-                    )
-                    
-                    # Store the output
-                    artifacts.raw_style_examples = raw_style_output
-                    story_state.save_task_output("raw_style_examples", raw_style_output)
-                except Exception as e:
-                    logger.warning(f"Raw style examples task failed: {str(e)}")
+                tasks[task_name] = self.task_factory.create_tool_task(
+                    name=task_name,
+                    description=f"Use the provided tool to gather information related to {genre} fiction.",
+                    agent=generic_agent,
+                    tool=tool,
+                    expected_output=f"Raw data from the {tool_name}",
+                    chapter_num=chapter_num,
+                    project_dir=project_dir,
+                    callback=callback
+                )
+            except Exception as e:
+                logger.warning("Raw %s task failed: %s", task_name, e)
         
-        # Check for plot structures tool
-        if "plot_tool" in tools:
-            # Skip if already completed
-            if not story_state.has_task_output("raw_plot_structures"):
-                logger.info("Executing raw plot structures task")
-                
+        if not tasks:
+            return
+        
+        def execute_tool_task(task_name: str) -> str:
+            logger.info("Executing %s task", task_name)
+            return self._execute_task(tasks[task_name], timeout_seconds=timeout_seconds)
+        
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {executor.submit(execute_tool_task, task_name): task_name for task_name in tasks}
+            for future in as_completed(futures):
+                task_name = futures[future]
                 try:
-                    # Create and execute the raw plot structures task
-                    raw_plot_task = self.task_factory.create_raw_plot_structures_task(
-                        genre=genre,
-                        tool=tools["plot_tool"],
-                        chapter_num=chapter_num,
-                        project_dir=project_dir,
-                        callback=callback
-                    )
-                    
-                    raw_plot_output = self.execution_engine.execute_task(
-                        raw_plot_task, 
-                        timeout_seconds=timeout_seconds
-                    )
-                    
-                    # Store the output
-                    artifacts.raw_plot_structures = raw_plot_output
-                    story_state.save_task_output("raw_plot_structures", raw_plot_output)
+                    output = future.result()
                 except Exception as e:
-                    logger.warning(f"Raw plot structures task failed: {str(e)}")
-        
-        # Process any other tools that have been provided
-        for tool_name, tool in tools.items():
-            if tool_name not in ["search_tool", "character_tool", "style_tool", "plot_tool"]:
-                task_name = f"raw_{tool_name}"
-                
-                # Skip if already completed
-                if story_state.has_task_output(task_name):
+                    logger.warning("Raw %s task failed: %s", task_name, e)
                     continue
                 
-                logger.info(f"Executing raw {tool_name} task")
-                
-                try:
-                    # Create a generic agent for this tool
-                    generic_agent = self.agent_factory.create_agent(
-                        role=f"{genre.title()} Specialist",
-                        goal=f"Gather information about {genre} using specialized tools",
-                        backstory=f"You are an expert in {genre} fiction with access to specialized research tools."
-                    )
-                    
-                    # Create and execute the task
-                    raw_task = self.task_factory.create_tool_task(
-                        name=task_name,
-                        description=f"Use the provided tool to gather information related to {genre} fiction.",
-                        agent=generic_agent,
-                        tool=tool,
-                        expected_output=f"Raw data from the {tool_name}",
-                        chapter_num=chapter_num,
-                        project_dir=project_dir,
-                        callback=callback
-                    )
-                    
-                    raw_output = self.execution_engine.execute_task(
-                        raw_task, 
-                        timeout_seconds=timeout_seconds
-                    )
-                    
-                    # Store the output if we have a matching field in artifacts
-                    if hasattr(artifacts, task_name):
-                        setattr(artifacts, task_name, raw_output)
-                    
-                    story_state.save_task_output(task_name, raw_output)
-                except Exception as e:
-                    logger.warning(f"Raw {tool_name} task failed: {str(e)}")
-
+                # Store the output if we have a matching field in artifacts
+                if task_name in artifacts:
+                    artifacts[task_name] = output
+                story_state.save_task_output(task_name, output)
+    
     def generate_story_chunked_with_raw_tools(
         self, 
         genre: str, 
@@ -1254,10 +1812,8 @@ class StoryGenerator:
             self.execution_engine.debug_mode = debug_mode
         
         try:
-            # Get the chapter number from custom inputs or default to 1
-            chapter_num = custom_inputs.get("chapter_number", 1) if custom_inputs else 1
-            title = custom_inputs.get("title", "Untitled Story") if custom_inputs else "Untitled Story"
-            project_dir = title.lower().replace(" ", "_")
+            # Get the chapter number, title and project directory from custom inputs
+            chapter_num, title, project_dir = self._story_context(custom_inputs)
             
             # Use provided story state or default manager
             story_state = story_state or self.state_manager
@@ -1266,6 +1822,9 @@ class StoryGenerator:
             # Initialize story artifacts
             artifacts = StoryArtifacts()
             
+            # Task outputs seen by the callback, written to the state in one batch
+            pending_outputs: Dict[str, Any] = {}
+            
             # Define callback to capture task output and dispatch to the user's callback if provided
             def task_output_callback(task: Task) -> None:
                 # Get the task name
@@ -1274,90 +1833,39 @@ class StoryGenerator:
                 # Store the task output in artifacts
                 if hasattr(task, 'output'):
                     task_output = task.output
-                    story_state.save_task_output(task_name, task_output)
+                    pending_outputs[task_name] = task_output
                     
                     # Store in artifacts based on task name
-                    if hasattr(artifacts, task_name):
-                        setattr(artifacts, task_name, task_output)
+                    if task_name in artifacts:
+                        artifacts[task_name] = task_output
                 
                 # Call the provided callback
                 if chunk_callback:
                     chunk_callback(task_name, task_output if hasattr(task, 'output') else None)
             
-            # First process raw tool outputs
-            self._process_raw_tool_outputs(
-                genre,
-                tools,
-                chapter_num,
-                project_dir,
-                task_output_callback,
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
-            
-            # Then process regular story generation phases
-            self._process_step_with_fallback(
-                "research", 
-                self._process_research_phase,
-                genre, 
-                chapter_num, 
-                project_dir, 
-                task_output_callback, 
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
-
-            self._process_worldbuilding_phase(
-                genre, 
-                chapter_num, 
-                project_dir, 
-                task_output_callback, 
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
-            
-            self._process_character_phase(
-                genre, 
-                chapter_num, 
-                project_dir, 
-                task_output_callback, 
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
-            
-            self._process_plot_phase(
-                genre, 
-                chapter_num, 
-                project_dir, 
-                task_output_callback, 
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
-            
-            self._process_draft_phase(
-                genre, 
-                chapter_num, 
-                project_dir, 
-                task_output_callback, 
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
-            
-            self._process_final_phase(
-                genre, 
-                chapter_num, 
-                project_dir, 
-                task_output_callback, 
-                story_state,
-                artifacts,
-                timeout_seconds
-            )
+            try:
+                # First process raw tool outputs
+                self._process_raw_tool_outputs(
+                    genre,
+                    tools,
+                    chapter_num,
+                    project_dir,
+                    task_output_callback,
+                    story_state,
+                    artifacts,
+                    timeout_seconds
+                )
+                
+                # Then process the story phases once the phases they depend on are
+                # done, falling back to placeholder content for the research only
+                self._run_phase_dag(
+                    self.PHASE_DEPENDENCIES,
+                    genre, chapter_num, project_dir, task_output_callback, story_state, artifacts, timeout_seconds,
+                    fallback_phases={Phase.RESEARCH}
+                )
+            finally:
+                # Keep the completed outputs even if a phase failed, so a resumed run reuses them
+                self._save_callback_outputs(story_state, pending_outputs, chapter_num)
             
             return artifacts
         finally:
@@ -2,18 +2,71 @@
 Data models for story generation.
 """
 
-from typing import Dict, Any, Optional
+from concurrent.futures import Future, wait
+from dataclasses import asdict, dataclass, fields
+from enum import Enum
+from typing import Callable, Dict, Any, Iterable, Optional
 from pydantic import BaseModel, Field
 
 
+class Phase(str, Enum):
+    """Phases of the story generation pipeline, named after their main artifact."""
+    RESEARCH = "research"
+    WORLDBUILDING = "worldbuilding"
+    CHARACTERS = "characters"
+    PLOT = "plot"
+    DRAFT = "draft"
+    FINAL_STORY = "final_story"
+    
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass(frozen=True)
+class PhaseSpec:
+    """
+    A phase made of a main task and an optional follow-up task.
+    
+    The follow-up task is a conditional task that gets the main task as its
+    context; its failure does not fail the phase.
+    
+    Attributes:
+        phase: The phase described
+        create_task: Name of the TaskFactory method creating the main task
+        task_name: Name the main task's output is saved under in the story state
+        artifact: Artifact field holding the main task's output
+        context: Builds the main task's context from the artifacts, if it takes one
+        create_followup: Name of the TaskFactory method creating the follow-up task
+        followup_name: Name the follow-up task's output is saved under
+        followup_artifact: Artifact field holding the follow-up task's output
+        background_followup: Whether the follow-up task runs in the background,
+                             so the phases that do not use its output can start
+    """
+    phase: Phase
+    create_task: str
+    task_name: str
+    artifact: str
+    context: Optional[Callable[["StoryArtifacts"], Any]] = None
+    create_followup: Optional[str] = None
+    followup_name: Optional[str] = None
+    followup_artifact: Optional[str] = None
+    background_followup: bool = False
+
+
 class StoryOutput(BaseModel):
     """Structured output for story content."""
     content: str
     word_count: int = Field(default=0)
 
 
-class StoryArtifacts(BaseModel):
-    """Container for all story generation artifacts."""
+@dataclass
+class StoryArtifacts:
+    """
+    Container for all story generation artifacts.
+    
+    A plain dataclass: the artifacts are set many times during generation
+    and need no validation.
+    """
     genre: Optional[str] = None
     title: Optional[str] = None
     
@@ -40,40 +93,97 @@ class StoryArtifacts(BaseModel):
     raw_plot_structures: Optional[str] = None
     raw_image_descriptions: Optional[Dict[str, str]] = None
     
+    def __post_init__(self) -> None:
+        """Set up the tracking of artifacts generated in the background."""
+        # Artifacts still being generated in the background, keyed by name.
+        # Not a field, so it is left out of comparisons and model_dump.
+        self._deferred: Dict[str, Future] = {}
+    
+    def __contains__(self, name: object) -> bool:
+        """Check if an artifact with the given name exists."""
+        return name in _ARTIFACT_FIELDS
+    
+    def __getitem__(self, name: str) -> Any:
+        """Get an artifact by name."""
+        if name not in _ARTIFACT_FIELDS:
+            raise KeyError(name)
+        return self.__dict__[name]
+    
+    def __setitem__(self, name: str, value: Any) -> None:
+        """Set an artifact by name."""
+        if name not in _ARTIFACT_FIELDS:
+            raise KeyError(name)
+        setattr(self, name, value)
+    
+    def defer(self, name: str, future: Future) -> None:
+        """
+        Mark an artifact as being generated in the background.
+        
+        Args:
+            name: Name of the artifact
+            future: Future of the work that sets the artifact when done
+        """
+        if name not in _ARTIFACT_FIELDS:
+            raise KeyError(name)
+        self._deferred[name] = future
+    
+    def wait_for(self, names: Optional[Iterable[str]] = None) -> None:
+        """
+        Wait until artifacts generated in the background are done.
+        
+        Args:
+            names: Names of the artifacts to wait for; all deferred artifacts if not given
+        """
+        if names is None:
+            names = list(self._deferred)
+        for name in names:
+            future = self._deferred.get(name)
+            if future is not None:
+                future.result()
+    
+    def cancel_deferred(self) -> None:
+        """
+        Cancel the background work on artifacts that has not started yet.
+        
+        Work that has already started cannot be interrupted, so this waits
+        for it to finish. Errors of the background work are not raised.
+        """
+        wait([future for future in list(self._deferred.values()) if not future.cancel()])
+    
     @property
     def is_complete(self) -> bool:
         """Check if all essential story artifacts have been generated."""
-        return all([
-            self.research,
-            self.worldbuilding,
-            self.characters,
-            self.plot,
-            self.draft,
-            self.final_story
-        ])
+        return bool(
+            self.research
+            and self.worldbuilding
+            and self.characters
+            and self.plot
+            and self.draft
+            and self.final_story
+        )
     
     @property
     def has_conditional_content(self) -> bool:
         """Check if any conditional task artifacts were generated."""
-        return any([
-            self.research_expanded,
-            self.characters_enhanced,
-            self.plot_twist,
-            self.style_improved,
-            self.consistency_fixed
-        ])
+        return bool(
+            self.research_expanded
+            or self.characters_enhanced
+            or self.plot_twist
+            or self.style_improved
+            or self.consistency_fixed
+        )
     
     @property
     def has_raw_tool_outputs(self) -> bool:
         """Check if any raw tool outputs were captured."""
-        return any([
-            self.raw_genre_research,
-            self.raw_reference_data,
-            self.raw_character_references,
-            self.raw_style_examples,
-            self.raw_plot_structures,
-            self.raw_image_descriptions
-        ])
+        return bool(
+            self.raw_genre_research
+            or self.raw_reference_data
+            or self.raw_character_references
+            or self.raw_style_examples
+            or self.raw_plot_structures
+            or self.raw_image_descriptions
+        )
     
     def get_conditional_artifacts(self) -> Dict[str, str]:
         """Get a dictionary of all conditional artifacts that were generated."""
@@ -90,6 +200,10 @@ class StoryArtifacts(BaseModel):
             result["consistency_fixed"] = self.consistency_fixed
         return result
         
+    def model_dump(self) -> Dict[str, Any]:
+        """Get all artifacts as a dictionary, like the pydantic model this used to be."""
+        return asdict(self)
+    
     def get_raw_tool_outputs(self) -> Dict[str, Any]:
         """Get a dictionary of all raw tool outputs that were captured."""
         result = {}
@@ -105,4 +219,8 @@ class StoryArtifacts(BaseModel):
             result["raw_plot_structures"] = self.raw_plot_structures
         if self.raw_image_descriptions:
             result["raw_image_descriptions"] = self.raw_image_descriptions
-        return result 
\ No newline at end of file
+        return result 
+
+
+# Names of the artifact fields of StoryArtifacts
+_ARTIFACT_FIELDS = frozenset(field.name for field in fields(StoryArtifacts))
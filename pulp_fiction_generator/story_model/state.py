@@ -4,13 +4,18 @@ Story state management.
 Handles persistence and retrieval of story generation artifacts.
 """
 
-from typing import Dict, Any, Optional, Union, List
+from typing import Callable, Dict, Any, Iterable, Optional, Set, Tuple, Union, List
+import atexit
+import functools
+import hashlib
 import json
 import os
 import re
 from pathlib import Path
 import string
 import logging
+import threading
+import time
 
 # Try to import CrewAI tools
 try:
@@ -38,6 +43,172 @@ def sanitize_filename(filename: str) -> str:
     # Limit length
     return s[:100]
 
+
+@functools.lru_cache(maxsize=256)
+def project_dir_name(title: str) -> str:
+    """
+    Turn a story title into the name of its project directory.
+    
+    Args:
+        title: Story title
+        
+    Returns:
+        Sanitized directory name, never empty
+    """
+    return sanitize_filename(title.lower().replace(" ", "_")) or "untitled_project"
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_file_tools() -> Tuple[Any, Any]:
+    """
+    Create the CrewAI file tools shared by every state manager.
+    
+    Returns:
+        The file read tool and the file write tool
+    """
+    return FileReadTool(), FileWriteTool()
+
+
+# Directories known to exist, so they are not created again for every file
+_ensured_dirs: Set[str] = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def _ensure_dir(path: Union[str, Path]) -> None:
+    """
+    Create a directory and its parents unless it was already created.
+    
+    Args:
+        path: The directory
+    """
+    path = os.path.abspath(path)
+    if path in _ensured_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    with _ensured_dirs_lock:
+        _ensured_dirs.add(path)
+
+
+def _forget_dir(path: Union[str, Path]) -> None:
+    """
+    Forget that a directory was created, after a write to it failed.
+    
+    Args:
+        path: The directory
+    """
+    with _ensured_dirs_lock:
+        _ensured_dirs.discard(os.path.abspath(path))
+
+
+def _write_file(path: str, content: str) -> None:
+    """Write text content to a file."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def _write_in_dir(directory: Union[str, Path], write: Callable[[], Any]) -> None:
+    """
+    Write files into a directory, creating the directory first if needed.
+    
+    A directory removed after it was created is only noticed when writing
+    to it fails, so then the directory is created again and the write is
+    retried once.
+    
+    Args:
+        directory: The directory written to
+        write: Function doing the write
+    """
+    _ensure_dir(directory)
+    try:
+        write()
+    except FileNotFoundError:
+        _forget_dir(directory)
+        _ensure_dir(directory)
+        write()
+
+
+class _WriteQueue:
+    """
+    Writes files on a background thread, so generation does not wait for the disk.
+    
+    A write queued for a path that already has a queued write replaces it,
+    so only the latest content of a path is written. flush waits until
+    every queued write is done.
+    """
+    
+    def __init__(self):
+        """Initialize the write queue; its thread is started by the first write."""
+        # Queued writes as the content and an optional write function, keyed by path
+        self._pending: Dict[str, Tuple[str, Optional[Callable[[str, str], Any]]]] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._writing = False
+    
+    def submit(self, path: str, content: str, write: Optional[Callable[[str, str], Any]] = None) -> None:
+        """
+        Queue a file write.
+        
+        Args:
+            path: Path of the file to write
+            content: Content to write to the file
+            write: Optional function writing content to a path, used instead
+                   of writing the file directly
+        """
+        # Resolve the path now, in case the working directory changes before the write
+        path = os.path.abspath(path)
+        with self._condition:
+            self._pending[path] = (content, write)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="story-state-writer", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+    
+    def flush(self) -> None:
+        """Wait until all queued writes are done."""
+        with self._condition:
+            self._condition.wait_for(lambda: not self._pending and not self._writing)
+    
+    def _run(self) -> None:
+        """Write the queued files, oldest first."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+                path = next(iter(self._pending))
+                content, write = self._pending.pop(path)
+                self._writing = True
+            
+            try:
+                _write_in_dir(os.path.dirname(path), functools.partial(write or _write_file, path, content))
+            except Exception as e:
+                _forget_dir(os.path.dirname(path))
+                logger.error("Error writing %s: %s", path, e)
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+
+# Queue of the story files written in the background
+_write_queue = _WriteQueue()
+atexit.register(_write_queue.flush)
+
+
+def queue_write(path: Union[str, Path], content: str) -> None:
+    """
+    Write a file in the background.
+    
+    Args:
+        path: Path of the file to write; missing directories are created
+        content: Content to write to the file
+    """
+    _write_queue.submit(str(path), content)
+
+
+def flush_writes() -> None:
+    """Wait until all files queued for writing have been written."""
+    _write_queue.flush()
+
+
 class StoryStateManager:
     """
     Manages the state of a story generation process.
@@ -63,12 +234,37 @@ class StoryStateManager:
         # Simple key-value store for conditional tasks
         self.task_store: Dict[str, Any] = {}
         
-        # Create file tools if available
+        # Guards the in-memory task outputs, which phases running
+        # concurrently update
+        self._lock = threading.Lock()
+        
+        # Use the shared file tools if available
         self.file_read_tool = None
         self.file_write_tool = None
         if CREWAI_TOOLS_AVAILABLE:
-            self.file_read_tool = FileReadTool()
-            self.file_write_tool = FileWriteTool()
+            self.file_read_tool, self.file_write_tool = _shared_file_tools()
+    
+    def clone(self) -> "StoryStateManager":
+        """
+        Create an independent copy of this state manager.
+        
+        The task output, chapter and task store containers are copied, so
+        changes to the clone do not affect this manager. The stored outputs
+        themselves and the file tools are shared.
+        
+        Returns:
+            A new state manager with the same state
+        """
+        new = type(self).__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        with self._lock:
+            new.task_outputs = {
+                task_type: chapters.copy() for task_type, chapters in self.task_outputs.items()
+            }
+            new.task_store = self.task_store.copy()
+        new.chapters = self.chapters.copy()
+        new._lock = threading.Lock()
+        return new
     
     def add_task_output(self, task_type: str, chapter_num: int, output: Any) -> None:
         """
@@ -83,16 +279,37 @@ class StoryStateManager:
         if output is None:
             return
             
-        # Initialize task type if needed
-        if task_type not in self.task_outputs:
-            self.task_outputs[task_type] = {}
-            
         # Add to in-memory cache
-        self.task_outputs[task_type][chapter_num] = output
+        with self._lock:
+            self.task_outputs.setdefault(task_type, {})[chapter_num] = output
         
         # Persist to storage
         self._persist_task_output(task_type, chapter_num, output)
     
+    def add_task_outputs(self, outputs: Dict[str, Any], chapter_num: int) -> None:
+        """
+        Add several task outputs of one chapter to the state.
+        
+        Equivalent to calling add_task_output for each entry, but the chapter
+        directory is prepared once for the whole batch.
+        
+        Args:
+            outputs: Mapping of task type to task output
+            chapter_num: Chapter number
+        """
+        # Skip empty outputs
+        outputs = {task_type: output for task_type, output in outputs.items() if output is not None}
+        if not outputs:
+            return
+            
+        # Add to in-memory cache
+        with self._lock:
+            for task_type, output in outputs.items():
+                self.task_outputs.setdefault(task_type, {})[chapter_num] = output
+            
+        # Persist to storage
+        self._persist_task_outputs(outputs, chapter_num)
+    
     def has_completed_task(self, task_type: str, chapter_num: int) -> bool:
         """
         Check if a task has been completed.
@@ -113,9 +330,22 @@ class StoryStateManager:
             filepath = self._get_task_filepath(task_type, chapter_num)
             return os.path.exists(filepath)
         except Exception as e:
-            logger.warning(f"Error checking task completion status: {e}")
+            logger.warning("Error checking task completion status: %s", e)
             return False
     
+    def completed_phases(self, chapter_num: int, phases: Iterable[str]) -> Set[str]:
+        """
+        Get the phases that have been completed for a chapter.
+        
+        Args:
+            chapter_num: Chapter number to check
+            phases: The phases to check
+            
+        Returns:
+            Set of the given phases that have been completed
+        """
+        return {phase for phase in phases if self.has_completed_task(phase, chapter_num)}
+    
     def get_task_output(self, task_type: str, chapter_num: Optional[int] = None) -> Optional[str]:
         """
         Get a task output.
@@ -173,24 +403,136 @@ class StoryStateManager:
         if output is None:
             return
             
+        self._persist_task_outputs({task_type: output}, chapter_num)
+    
+    def _persist_task_outputs(self, outputs: Dict[str, Any], chapter_num: int) -> None:
+        """
+        Save task outputs of one chapter to persistent storage.
+        
+        The files are written in the background; call flush to wait for them.
+        
+        Args:
+            outputs: Mapping of task type to task output content
+            chapter_num: Chapter number
+        """
+        # Write content to file using FileWriteTool if available
+        write = self.file_write_tool.write if CREWAI_TOOLS_AVAILABLE and self.file_write_tool else None
+        
+        for task_type, output in outputs.items():
+            try:
+                filepath = self._get_task_filepath(task_type, chapter_num)
+                _write_queue.submit(filepath, str(output), write)
+                logger.info("Saving %s output for chapter %s to %s", task_type, chapter_num, filepath)
+            except Exception as e:
+                logger.error("Error persisting task output: %s", e)
+    
+    def flush(self) -> None:
+        """Wait until the task outputs being saved in the background are written."""
+        _write_queue.flush()
+    
+    def _get_phase_cache_filepath(self, phase: str, chapter_num: int) -> str:
+        """
+        Get the filepath of a phase checkpoint.
+        
+        Args:
+            phase: Name of the generation phase
+            chapter_num: Chapter number
+            
+        Returns:
+            Filepath for the phase checkpoint
+        """
+        safe_phase = sanitize_filename(phase)
+        safe_chapter_num = max(1, int(chapter_num))
+        return str(Path(self.base_dir) / self.project_dir / f"chapter_{safe_chapter_num}" / f"{safe_phase}.json")
+    
+    def save_cached_phase(
+        self,
+        phase: str,
+        chapter_num: int,
+        genre: str,
+        outputs: Dict[str, Any],
+        input_key: Optional[str] = None
+    ) -> None:
+        """
+        Save the outputs of a completed generation phase as a checkpoint.
+        
+        The checkpoint is written to a temporary file and moved into place,
+        so an interrupted run never leaves a partial checkpoint behind. It
+        records when it was saved, so load_cached_phase can skip stale ones.
+        
+        Args:
+            phase: Name of the generation phase
+            chapter_num: Chapter number
+            genre: Genre the outputs were generated for
+            outputs: The phase outputs, keyed by artifact name
+            input_key: Optional digest of the inputs the outputs were generated from
+        """
+        filepath = self._get_phase_cache_filepath(phase, chapter_num)
+        tmp_filepath = f"{filepath}.tmp"
+        
+        def write_checkpoint() -> None:
+            with open(tmp_filepath, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {"genre": genre, "input_key": input_key, "saved_at": time.time(), "outputs": outputs},
+                    f,
+                    default=str
+                )
+            os.replace(tmp_filepath, filepath)
+        
         try:
-            filepath = self._get_task_filepath(task_type, chapter_num)
-            directory = os.path.dirname(filepath)
-            
-            # Ensure directory exists
-            os.makedirs(directory, exist_ok=True)
-            
-            # Write content to file using FileWriteTool if available
-            if CREWAI_TOOLS_AVAILABLE and self.file_write_tool:
-                self.file_write_tool.write(filepath, str(output))
-            else:
-                # Fallback to direct file writing
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(str(output))
-                    
-            logger.info(f"Saved {task_type} output for chapter {chapter_num} to {filepath}")
+            _write_in_dir(os.path.dirname(filepath), write_checkpoint)
+            logger.info("Saved %s checkpoint for chapter %s to %s", phase, chapter_num, filepath)
         except Exception as e:
-            logger.error(f"Error persisting task output: {e}")
+            _forget_dir(os.path.dirname(filepath))
+            logger.error("Error saving %s checkpoint: %s", phase, e)
+            try:
+                os.remove(tmp_filepath)
+            except OSError:
+                pass
+    
+    def load_cached_phase(
+        self,
+        phase: str,
+        chapter_num: int,
+        genre: str,
+        input_key: Optional[str] = None,
+        max_age: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load the checkpoint of a generation phase.
+        
+        Args:
+            phase: Name of the generation phase
+            chapter_num: Chapter number
+            genre: Genre the outputs must have been generated for
+            input_key: Digest of the inputs the outputs must have been generated
+                       from, as given to save_cached_phase
+            max_age: Optional age in seconds after which a checkpoint is ignored
+            
+        Returns:
+            The saved phase outputs, or None if there is no usable checkpoint
+        """
+        filepath = self._get_phase_cache_filepath(phase, chapter_num)
+        
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable %s checkpoint %s: %s", phase, filepath, e)
+            return None
+            
+        if not isinstance(checkpoint, dict) or checkpoint.get("genre") != genre:
+            return None
+        if checkpoint.get("input_key") != input_key:
+            return None
+        if max_age is not None and time.time() - checkpoint.get("saved_at", 0) > max_age:
+            logger.info("Ignoring stale %s checkpoint %s", phase, filepath)
+            return None
+            
+        outputs = checkpoint.get("outputs")
+        return outputs if isinstance(outputs, dict) else None
     
     def set_project_directory(self, title: str) -> None:
         """
@@ -202,12 +544,7 @@ class StoryStateManager:
         if not title or not isinstance(title, str):
             title = "untitled_project"
             
-        # Sanitize the project directory name
-        self.project_dir = sanitize_filename(title.lower().replace(" ", "_"))
-        
-        # Ensure it's not empty after sanitization
-        if not self.project_dir:
-            self.project_dir = "untitled_project"
+        self.project_dir = project_dir_name(title)
         
     def get_artifacts_for_chapter(self, chapter_num: int) -> Dict[str, Any]:
         """
@@ -306,7 +643,8 @@ class StoryStateManager:
             chapter_num = self.current_chapter
             
             # Also store in simple key-value store for conditional tasks
-            self.task_store[task_type] = output
+            with self._lock:
+                self.task_store[task_type] = output
             
         # Add to legacy storage system too
         self.add_task_output(task_type, chapter_num, output)
@@ -368,7 +706,7 @@ class StoryStateManager:
                 self.task_outputs[task_type][chapter_num] = content
                 return content
         except Exception as e:
-            logger.warning(f"Error loading task output: {e}")
+            logger.warning("Error loading task output: %s", e)
         
         return None
     
@@ -389,11 +727,118 @@ class StoryStateManager:
             chapter_num: Chapter number to set as current
         """
         self.current_chapter = max(1, int(chapter_num))
-        logger.info(f"Set current chapter to {self.current_chapter}")
+        logger.info("Set current chapter to %s", self.current_chapter)
         
     def reset_simple_store(self) -> None:
         """
         Reset the simple key-value store.
         """
         self.task_store.clear()
-        logger.info("Reset simple task store") 
\ No newline at end of file
+        logger.info("Reset simple task store") 
+
+
+class PhaseCache:
+    """
+    Content-addressed cache of phase outputs shared between projects.
+    
+    Unlike the phase checkpoints of a StoryStateManager, which belong to one
+    project, entries are only keyed by the digest of the phase inputs, so a
+    project generating a phase from the same inputs as another reuses its
+    output. Entries are only shared between caches with the same model.
+    The least recently used entries are removed once there are more than
+    max_entries.
+    """
+    
+    def __init__(self, directory: Union[str, Path] = "output/.cache", model: str = "", max_entries: int = 256):
+        """
+        Initialize the phase cache.
+        
+        Args:
+            directory: Directory holding the cache entries
+            model: Name of the model generating the outputs
+            max_entries: Maximum number of entries kept
+        """
+        self.directory = Path(directory)
+        self.model = model
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+    
+    def _get_filepath(self, input_key: str) -> Path:
+        """
+        Get the filepath of the entry for an input digest.
+        
+        Args:
+            input_key: Digest of the phase inputs
+            
+        Returns:
+            Filepath for the entry
+        """
+        digest = hashlib.sha256(f"{self.model}|{input_key}".encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+    
+    def get(self, input_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the outputs cached for an input digest.
+        
+        Args:
+            input_key: Digest of the phase inputs
+            
+        Returns:
+            The cached phase outputs, or None if there are none
+        """
+        filepath = self._get_filepath(input_key)
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                outputs = json.load(f)
+            # Mark the entry as recently used
+            os.utime(filepath)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable phase cache entry %s: %s", filepath, e)
+            return None
+            
+        return outputs if isinstance(outputs, dict) else None
+    
+    def put(self, input_key: str, outputs: Dict[str, Any]) -> None:
+        """
+        Cache the outputs generated from an input digest.
+        
+        Args:
+            input_key: Digest of the phase inputs
+            outputs: The phase outputs, keyed by artifact name
+        """
+        filepath = self._get_filepath(input_key)
+        tmp_filepath = filepath.with_suffix(f".{threading.get_ident()}.tmp")
+        
+        def write_entry() -> None:
+            with open(tmp_filepath, 'w', encoding='utf-8') as f:
+                json.dump(outputs, f, default=str)
+            os.replace(tmp_filepath, filepath)
+        
+        try:
+            _write_in_dir(self.directory, write_entry)
+        except Exception as e:
+            _forget_dir(self.directory)
+            logger.error("Error saving phase cache entry %s: %s", filepath, e)
+            tmp_filepath.unlink(missing_ok=True)
+            return
+            
+        self._evict()
+    
+    def _evict(self) -> None:
+        """Remove the least recently used entries beyond max_entries."""
+        with self._lock:
+            entries = []
+            for filepath in self.directory.glob("*.json"):
+                try:
+                    entries.append((filepath.stat().st_mtime, filepath))
+                except FileNotFoundError:
+                    continue
+                    
+            excess = len(entries) - self.max_entries
+            if excess <= 0:
+                return
+                
+            for _, filepath in sorted(entries)[:excess]:
+                filepath.unlink(missing_ok=True)
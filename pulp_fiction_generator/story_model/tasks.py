@@ -4,9 +4,10 @@ Task factory for story generation.
 Creates and configures tasks for different story generation steps.
 """
 
-from typing import Any, Dict, Optional, Callable, List, Type, Union
+from typing import Any, Dict, Optional, Callable, List, Tuple, Type, Union
 import os
 import copy
+import threading
 
 from crewai import Task
 from crewai.tasks.conditional_task import ConditionalTask
@@ -43,6 +44,38 @@ class TaskFactory:
         """
         self.agent_factory = agent_factory
         self.validator = StoryValidator()
+        
+        # Agents created by _get_agent on each thread, in the thread's
+        # "agents" dict keyed by creator method and genre
+        self._thread_agents = threading.local()
+    
+    def _get_agent(self, creator: str, genre: str) -> Any:
+        """
+        Get the agent of a role for a genre, creating it on first use.
+        
+        Tasks created on the same thread share one agent per role and genre,
+        so the phases of a story do not build the same agent again. An agent
+        keeps the state of the task it is executing and must not execute two
+        tasks at once, so each thread gets agents of its own. Tasks have to
+        be executed on the thread that created them, or be created with an
+        agent of their own.
+        
+        Args:
+            creator: Name of the agent factory method creating the agent
+            genre: The genre the agent works in
+            
+        Returns:
+            The agent
+        """
+        agents = getattr(self._thread_agents, "agents", None)
+        if agents is None:
+            agents = self._thread_agents.agents = {}
+        
+        key = (creator, genre)
+        agent = agents.get(key)
+        if agent is None:
+            agent = agents[key] = getattr(self.agent_factory, creator)(genre)
+        return agent
     
     def create_research_task(
         self, 
@@ -63,7 +96,7 @@ class TaskFactory:
         Returns:
             Configured research task
         """
-        research_agent = self.agent_factory.create_researcher(genre)
+        research_agent = self._get_agent("create_researcher", genre)
         
         return Task(
             name="research",
@@ -97,7 +130,7 @@ class TaskFactory:
         Returns:
             Configured worldbuilding task
         """
-        worldbuilding_agent = self.agent_factory.create_worldbuilder(genre)
+        worldbuilding_agent = self._get_agent("create_worldbuilder", genre)
         
         return Task(
             name="worldbuilding",
@@ -134,7 +167,7 @@ class TaskFactory:
         Returns:
             Configured character creation task
         """
-        char_agent = self.agent_factory.create_character_creator(genre)
+        char_agent = self._get_agent("create_character_creator", genre)
         
         return Task(
             name="characters",
@@ -171,7 +204,7 @@ class TaskFactory:
         Returns:
             Configured plot development task
         """
-        plot_agent = self.agent_factory.create_plotter(genre)
+        plot_agent = self._get_agent("create_plotter", genre)
         
         return Task(
             name="plot",
@@ -209,7 +242,7 @@ class TaskFactory:
         Returns:
             Configured writing task
         """
-        writer_agent = self.agent_factory.create_writer(genre)
+        writer_agent = self._get_agent("create_writer", genre)
         
         return Task(
             name="draft",
@@ -248,7 +281,7 @@ class TaskFactory:
         Returns:
             Configured editing task
         """
-        editor_agent = self.agent_factory.create_editor(genre)
+        editor_agent = self._get_agent("create_editor", genre)
         
         return Task(
             name="final_story",
@@ -275,6 +308,9 @@ class TaskFactory:
         """
         Create a set of more granular research subtasks.
         
+        The subtasks may be executed concurrently, so each one gets a
+        researcher of its own instead of the shared one from _get_agent.
+        
         Args:
             genre: The genre to research
             chapter_num: Chapter number
@@ -284,7 +320,7 @@ class TaskFactory:
         Returns:
             List of research subtasks
         """
-        researcher = self.agent_factory.create_researcher(genre)
+        create_researcher = self.agent_factory.create_researcher
         subtasks = []
         
         # First subtask: Core genre elements
@@ -293,7 +329,7 @@ class TaskFactory:
             description=f"Research the essential elements and history of {genre} pulp fiction. "
                       f"Focus only on identifying the core tropes, themes, and conventions. "
                       f"Keep this brief and focused on the most important elements.",
-            agent=researcher,
+            agent=create_researcher(genre),
             expected_output="A concise brief on the core elements of the genre",
             output_file=f"output/{project_dir}/chapter_{chapter_num}/genre_elements.txt",
             create_directory=True,
@@ -308,7 +344,7 @@ class TaskFactory:
             description=f"Based on your initial research on {genre} pulp fiction elements, "
                       f"provide historical context and key time periods or movements that "
                       f"influenced this genre. Keep this brief and focused.",
-            agent=researcher,
+            agent=create_researcher(genre),
             expected_output="Historical context brief for the genre",
             context=[genre_research_task],
             output_file=f"output/{project_dir}/chapter_{chapter_num}/historical_context.txt",
@@ -324,7 +360,7 @@ class TaskFactory:
             description=f"Research the distinctive writing style, language patterns, and "
                       f"vocabulary commonly found in {genre} pulp fiction. Include examples "
                       f"of typical phrasing, dialogue patterns, and narrative voice.",
-            agent=researcher,
+            agent=create_researcher(genre),
             expected_output="Writing style guide for the genre",
             context=[genre_research_task, historical_context_task],
             output_file=f"output/{project_dir}/chapter_{chapter_num}/style_guide.txt",
@@ -414,7 +450,7 @@ class TaskFactory:
         Returns:
             Configured conditional research expansion task
         """
-        research_agent = self.agent_factory.create_researcher(genre)
+        research_agent = self._get_agent("create_researcher", genre)
         
         return self.create_conditional_task(
             name="research_expansion",
@@ -450,7 +486,7 @@ class TaskFactory:
         Returns:
             Configured conditional character development task
         """
-        char_agent = self.agent_factory.create_character_creator(genre)
+        char_agent = self._get_agent("create_character_creator", genre)
         
         return self.create_conditional_task(
             name="character_development",
@@ -486,7 +522,7 @@ class TaskFactory:
         Returns:
             Configured conditional plot twist task
         """
-        plot_agent = self.agent_factory.create_plotter(genre)
+        plot_agent = self._get_agent("create_plotter", genre)
         
         return self.create_conditional_task(
             name="plot_twist",
@@ -521,7 +557,7 @@ class TaskFactory:
         Returns:
             Configured conditional style improvement task
         """
-        editor_agent = self.agent_factory.create_editor(genre)
+        editor_agent = self._get_agent("create_editor", genre)
         
         return self.create_conditional_task(
             name="style_improvement",
@@ -556,7 +592,7 @@ class TaskFactory:
         Returns:
             Configured conditional consistency check task
         """
-        editor_agent = self.agent_factory.create_editor(genre)
+        editor_agent = self._get_agent("create_editor", genre)
         
         return self.create_conditional_task(
             name="consistency_check",
@@ -11,7 +11,7 @@ from .exceptions import (
     ContentGenerationError, AgentError, StoryPersistenceError,
     InputValidationError, CliArgumentError
 )
-from .timeout import TimeoutManager, timeout
+from .timeout import TimeoutManager, timeout, call_with_timeout
 from .diagnostics import DiagnosticCollector, DiagnosticLogger
 from .recovery import (
     RecoveryStrategy, ModelRetryStrategy, FallbackPromptStrategy,
@@ -29,7 +29,7 @@ __all__ = [
     "InputValidationError", "CliArgumentError",
     
     # Timeout handling
-    "TimeoutManager", "timeout",
+    "TimeoutManager", "timeout", "call_with_timeout",
     
     # Diagnostic tools
     "DiagnosticCollector", "DiagnosticLogger",
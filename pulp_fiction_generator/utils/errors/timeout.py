@@ -9,6 +9,8 @@ import signal
 import threading
 import time
 import platform
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
 import logging
 import sys
@@ -27,9 +29,60 @@ class TimeoutManager:
     with different implementations based on the platform.
     """
     
+    @staticmethod
+    def can_interrupt() -> bool:
+        """
+        Check whether the timeout context manager can interrupt an operation in this thread.
+        
+        Returns:
+            True if a signal-based timeout can be used here
+        """
+        # Signal handlers can only be set from the main thread
+        return (
+            hasattr(signal, 'SIGALRM')
+            and platform.system() != 'Darwin'
+            and threading.current_thread() is threading.main_thread()
+        )
+    
+    @staticmethod
+    def call_with_timeout(func, seconds: float, *args, **kwargs):
+        """
+        Call a function, raising TimeoutError if it does not finish in time.
+        
+        Where the timeout context manager cannot interrupt the call, such as
+        in worker threads, the function is run on a thread of its own and the
+        caller stops waiting for it at the deadline. That thread cannot be
+        stopped, so it is left to finish in the background and its result is
+        discarded.
+        
+        Args:
+            func: The function to call
+            seconds: Maximum number of seconds to wait for the function
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+            
+        Returns:
+            The result of the function
+            
+        Raises:
+            TimeoutError: If the function does not finish within the timeout
+        """
+        if TimeoutManager.can_interrupt():
+            with TimeoutManager.timeout(seconds):
+                return func(*args, **kwargs)
+        
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="timeout")
+        future = executor.submit(func, *args, **kwargs)
+        # Do not wait for the thread when giving up on it
+        executor.shutdown(wait=False)
+        try:
+            return future.result(timeout=seconds)
+        except FutureTimeoutError:
+            raise TimeoutError(f"Function call timed out after {seconds} seconds") from None
+    
     @staticmethod
     @contextmanager
-    def timeout(seconds: int):
+    def timeout(seconds: float):
         """
         Context manager for timing out function calls.
         
@@ -37,67 +90,47 @@ class TimeoutManager:
             seconds: Maximum number of seconds to allow for the operation
             
         Raises:
-            TimeoutError: If the operation times out
+            TimeoutError: If the operation times out and can be interrupted.
+                          Operations that cannot be interrupted are left to
+                          finish, and an overrun is only logged so that their
+                          result is not lost. Use call_with_timeout to
+                          enforce the timeout on those.
         """
-        # For Unix-like systems (but not macOS), use signal-based timeout
-        if hasattr(signal, 'SIGALRM') and platform.system() != 'Darwin':
+        # For Unix-like systems (but not macOS), use signal-based timeout.
+        # Signal handlers can only be set from the main thread, so worker
+        # threads use the thread-based timeout below.
+        if TimeoutManager.can_interrupt():
             def timeout_handler(signum, frame):
                 raise TimeoutError(f"Function call timed out after {seconds} seconds")
             
-            # Set the timeout handler
+            # Set the timeout handler; setitimer also takes fractions of a second
             original_handler = signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(seconds)
+            signal.setitimer(signal.ITIMER_REAL, seconds)
             
             try:
                 yield
             finally:
-                # Reset the alarm and restore the original handler
-                signal.alarm(0)
+                # Reset the timer and restore the original handler
+                signal.setitimer(signal.ITIMER_REAL, 0)
                 signal.signal(signal.SIGALRM, original_handler)
         
-        # For Windows, macOS or other systems without SIGALRM, use thread-based timeout
+        # For Windows, macOS, systems without SIGALRM or worker threads, the
+        # operation cannot be interrupted. By the time the deadline can be
+        # checked the operation has completed, so raising would only throw
+        # its result away; an overrun is logged instead.
         else:
-            # Use an event for better synchronization
-            completed = threading.Event()
+            start = time.monotonic()
             
-            def check_timeout():
-                """Thread that checks if the operation has timed out"""
-                start_time = time.time()
-                
-                # Wait either for completion or timeout
-                while not completed.is_set() and time.time() - start_time < seconds:
-                    # Check every 0.1 seconds
-                    completed.wait(0.1)
-                
-                # If completed was not set, then we timed out
-                if not completed.is_set():
-                    logger.warning(f"Operation timed out after {seconds} seconds")
-                    # Since we can't reliably interrupt the main thread on all platforms,
-                    # we'll record the timeout and let the main thread handle it
-                    check_timeout.timed_out = True
+            yield
             
-            # Initialize the flag
-            check_timeout.timed_out = False
-            
-            # Start the timeout thread
-            timer_thread = threading.Thread(target=check_timeout)
-            timer_thread.daemon = True
-            timer_thread.start()
-            
-            try:
-                yield
-            finally:
-                # Set the completion event to stop the timer thread
-                completed.set()
-                
-                # Wait for the timer thread to finish
-                timer_thread.join(0.5)  # Wait up to 0.5s for the thread to finish
-                
-                # Check if we timed out
-                if check_timeout.timed_out:
-                    logger.error(f"Function call timed out after {seconds} seconds")
-                    raise TimeoutError(f"Function call timed out after {seconds} seconds")
+            elapsed = time.monotonic() - start
+            if elapsed > seconds:
+                logger.warning(
+                    "Function call took %.1f seconds, exceeding its timeout of %s seconds",
+                    elapsed, seconds
+                )
 
 
-# Alias for convenience
-timeout = TimeoutManager.timeout 
\ No newline at end of file
+# Aliases for convenience
+timeout = TimeoutManager.timeout
+call_with_timeout = TimeoutManager.call_with_timeout
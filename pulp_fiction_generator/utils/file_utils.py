@@ -5,6 +5,7 @@ This module provides utilities for reading and writing files, loading templates,
 and other file-related operations.
 """
 
+import functools
 import os
 import yaml
 from typing import Dict, Any, List, Optional
@@ -19,6 +20,16 @@ try:
 except ImportError:
     has_crewai_tools = False
 
+@functools.lru_cache(maxsize=None)
+def _file_read_tool() -> "FileReadTool":
+    """
+    Create the FileReadTool shared by the read functions.
+    
+    Returns:
+        The shared file read tool
+    """
+    return FileReadTool()
+
 def read_yaml_file(file_path: str) -> Dict[str, Any]:
     """
     Read and parse a YAML file.
@@ -31,8 +42,7 @@ def read_yaml_file(file_path: str) -> Dict[str, Any]:
     """
     if has_crewai_tools:
         # Use CrewAI's FileReadTool if available
-        file_tool = FileReadTool()
-        content = file_tool.file_read(file_path)
+        content = _file_read_tool().file_read(file_path)
         return yaml.safe_load(content)
     else:
         # Fallback to standard file reading
@@ -109,8 +119,7 @@ def read_file(file_path: str) -> Optional[str]:
     if has_crewai_tools:
         # Use CrewAI's FileReadTool if available
         try:
-            file_tool = FileReadTool()
-            return file_tool.file_read(file_path)
+            return _file_read_tool().file_read(file_path)
         except Exception as e:
             print(f"Error reading file with CrewAI tools {file_path}: {str(e)}")
             return None
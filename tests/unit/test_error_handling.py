@@ -21,7 +21,7 @@ from pulp_fiction_generator.utils.errors import (
     RecoveryStrategy, ModelRetryStrategy, FallbackPromptStrategy, ConfigurationFixStrategy,
     
     # Core functionality
-    ErrorHandler, with_error_handling, DiagnosticCollector, timeout, setup_error_handling, DiagnosticLogger,
+    ErrorHandler, with_error_handling, DiagnosticCollector, timeout, call_with_timeout, setup_error_handling, DiagnosticLogger,
     RecoveryStrategyRegistry
 )
 
@@ -59,6 +59,41 @@ def test_timeout_does_not_raise_if_fast_enough():
     with timeout(0.2):
         time.sleep(0.1)  # Sleep shorter than the timeout
 
+def test_timeout_in_worker_thread():
+    """Test that the timeout context manager works outside the main thread."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def run_with_timeout():
+        with timeout(1):
+            return "done"
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(run_with_timeout).result() == "done"
+
+def test_timeout_in_worker_thread_keeps_result_when_exceeded():
+    """Test that an overrun in a worker thread is logged without discarding the completed result."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def run_too_long():
+        with timeout(0.05):
+            time.sleep(0.1)
+            return "done"
+    
+    with patch('pulp_fiction_generator.utils.errors.timeout.logger') as mock_logger:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(run_too_long).result() == "done"
+    
+    mock_logger.warning.assert_called_once()
+
+def test_call_with_timeout_in_worker_thread_raises():
+    """Test that call_with_timeout enforces the timeout outside the main thread."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(call_with_timeout, lambda: "done", 1).result() == "done"
+        with pytest.raises(TimeoutError):
+            executor.submit(call_with_timeout, time.sleep, 0.05, 0.2).result()
+
 # ===== Test Diagnostic Info =====
 
 def test_diagnostic_info_collection():
@@ -0,0 +1,47 @@
+"""
+Unit tests for the ExecutionEngine.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from crewai.tasks.conditional_task import ConditionalTask
+
+from pulp_fiction_generator.story_model.execution import ConditionalTaskSkipped, ExecutionEngine
+from pulp_fiction_generator.utils.errors import TimeoutError
+
+
+class TestExecutionEngine:
+    """Tests for the ExecutionEngine class."""
+    
+    def test_conditional_task_skipped_without_crew(self):
+        """Test that a conditional task whose condition is not met never builds a crew."""
+        task = Mock(spec=ConditionalTask)
+        task.name = "plot_twist"
+        task.context = [Mock(output=None), Mock(output="A plot")]
+        task.should_execute = Mock(return_value=False)
+        
+        with patch("pulp_fiction_generator.story_model.execution.Crew") as mock_crew:
+            with pytest.raises(ConditionalTaskSkipped):
+                ExecutionEngine().execute_task(task)
+        
+        task.should_execute.assert_called_once_with("A plot")
+        mock_crew.assert_not_called()
+    
+    def test_timed_out_task_is_retried_in_worker_thread(self):
+        """Test that a task timing out on a worker thread is retried with a longer timeout."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        task = Mock()
+        task.description = "Write a chapter"
+        task.output = Mock(parsed=None, raw="A chapter")
+        task.callback = None
+        
+        with patch("pulp_fiction_generator.story_model.execution.Crew"), \
+                patch("pulp_fiction_generator.story_model.execution.call_with_timeout",
+                      side_effect=[TimeoutError("timed out"), "A chapter"]) as mock_call:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(ExecutionEngine(max_retries=1).execute_task, task, 10)
+                assert future.result() == "A chapter"
+        
+        assert [call.args[1] for call in mock_call.call_args_list] == [10, 15]
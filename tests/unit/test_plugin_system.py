@@ -150,6 +150,28 @@ class TestPluginRegistry:
 class TestPluginBaseClasses:
     """Tests for the plugin base classes."""
     
+    def test_concrete_plugins_recorded_in_module(self):
+        """Test that PluginMeta records concrete plugins in their defining module."""
+        import sys
+        
+        class AbstractGenreBase(GenrePlugin):
+            abstract = True
+        
+        class RecordedPlugin(AbstractGenreBase):
+            plugin_id = "recorded-plugin"
+            plugin_name = "Recorded Plugin"
+            plugin_description = "A plugin recorded by its metaclass"
+            
+            def get_prompt_enhancers(self): return {}
+            def get_character_templates(self): return []
+            def get_plot_templates(self): return []
+            def get_example_passages(self): return []
+        
+        recorded = sys.modules[__name__].__pulp_plugins__
+        assert RecordedPlugin in recorded
+        assert AbstractGenreBase not in recorded
+        assert GenrePlugin not in recorded
+    
     def test_base_plugin_info(self):
         """Test the get_plugin_info method of BasePlugin."""
         class TestPlugin(GenrePlugin):
@@ -220,4 +242,235 @@ class TestPluginManager:
         
         # Check that the plugin was registered
         assert len(registry.plugins) == 1
-        assert "mock-plugin" in registry.plugins 
\ No newline at end of file
+        assert "mock-plugin" in registry.plugins 
+
+class TestPluginManagerEntryPoints:
+    """Tests for entry-point based plugin discovery."""
+    
+    def test_entry_point_plugins_registered(self):
+        """Test that classes referenced by entry points are registered directly."""
+        from pulp_fiction_generator.plugins.manager import PluginManager
+        
+        class EntryPointPlugin(GenrePlugin):
+            plugin_id = "entry-point-genre"
+            plugin_name = "Entry Point Genre"
+            plugin_description = "A genre plugin declared via an entry point"
+            
+            def get_prompt_enhancers(self): return {}
+            def get_character_templates(self): return []
+            def get_plot_templates(self): return []
+            def get_example_passages(self): return []
+        
+        entry_point = Mock()
+        entry_point.name = "entry-point-genre"
+        entry_point.load.return_value = EntryPointPlugin
+        
+        def fake_entry_points(group):
+            return [entry_point] if group == "pulp_fiction.genres" else []
+        
+        manager = PluginManager()
+        manager.plugin_paths = []
+        with patch(
+            'pulp_fiction_generator.plugins.manager._iter_entry_points',
+            side_effect=fake_entry_points,
+        ):
+            manager._discover_entry_point_plugins()
+        
+        assert manager.get_plugin("entry-point-genre") is EntryPointPlugin
+    
+    def test_entry_point_rediscovery_does_not_reregister(self):
+        """Test that discovering entry points again skips registered classes."""
+        from pulp_fiction_generator.plugins.manager import PluginManager
+        
+        class RediscoveredPlugin(GenrePlugin):
+            plugin_id = "rediscovered-genre"
+            plugin_name = "Rediscovered Genre"
+            plugin_description = "A genre plugin discovered twice"
+            
+            def get_prompt_enhancers(self): return {}
+            def get_character_templates(self): return []
+            def get_plot_templates(self): return []
+            def get_example_passages(self): return []
+        
+        entry_point = Mock()
+        entry_point.name = "rediscovered-genre"
+        entry_point.load.return_value = RediscoveredPlugin
+        
+        def fake_entry_points(group):
+            return [entry_point] if group == "pulp_fiction.genres" else []
+        
+        manager = PluginManager()
+        manager.plugin_paths = []
+        with patch(
+            'pulp_fiction_generator.plugins.manager._iter_entry_points',
+            side_effect=fake_entry_points,
+        ), patch('pulp_fiction_generator.plugins.manager.logger') as mock_logger:
+            manager._discover_entry_point_plugins()
+            manager._discover_entry_point_plugins()
+        
+        assert manager.get_plugin("rediscovered-genre") is RediscoveredPlugin
+        mock_logger.warning.assert_not_called()
+    
+    def test_directory_scan_skipped_without_plugin_paths(self, tmp_path):
+        """Test that no directory scan happens when no plugin path exists."""
+        from pulp_fiction_generator.plugins.manager import PluginManager
+        
+        manager = PluginManager()
+        manager.plugin_paths = []
+        
+        assert not manager.add_path(tmp_path / "missing")
+        
+        with patch.object(manager, '_collect_path_modules') as mock_collect, \
+             patch.object(manager, '_load_plugin_modules') as mock_load, \
+             patch.object(manager, '_discover_entry_point_plugins'), \
+             patch.object(manager, '_discover_installed_plugins'):
+            manager.discover_plugins()
+        
+        assert not manager.plugin_paths_present()
+        mock_collect.assert_not_called()
+        mock_load.assert_not_called()
+    
+    def test_add_path_only_accepts_new_directories(self, tmp_path):
+        """Test that add_path validates and deduplicates plugin directories."""
+        from pulp_fiction_generator.plugins.manager import PluginManager
+        
+        manager = PluginManager()
+        manager.plugin_paths = []
+        
+        assert manager.add_path(tmp_path)
+        assert not manager.add_path(tmp_path)
+        assert manager.plugin_paths == [tmp_path]
+    
+    def test_reloading_module_uses_cached_plugins(self):
+        """Test that loading a module twice neither re-imports nor re-registers it."""
+        import sys
+        import types
+        from pulp_fiction_generator.plugins.manager import PluginManager
+        
+        module = types.ModuleType("cached_plugin_module")
+        
+        class CachedPlugin(GenrePlugin):
+            plugin_id = "cached-genre"
+            plugin_name = "Cached Genre"
+            plugin_description = "A genre plugin loaded twice"
+            
+            def get_prompt_enhancers(self): return {}
+            def get_character_templates(self): return []
+            def get_plot_templates(self): return []
+            def get_example_passages(self): return []
+        
+        CachedPlugin.__module__ = module.__name__
+        module.CachedPlugin = CachedPlugin
+        module.__pulp_plugins__ = [CachedPlugin]
+        
+        manager = PluginManager()
+        with patch.dict(sys.modules, {module.__name__: module}), \
+             patch('pulp_fiction_generator.plugins.manager.importlib.import_module') as mock_import, \
+             patch.object(manager, '_find_plugin_classes', wraps=manager._find_plugin_classes) as mock_find:
+            manager._load_plugin_module(module.__name__)
+            manager._load_plugin_module(module.__name__)
+        
+        mock_import.assert_not_called()
+        assert mock_find.call_count == 1
+        assert manager.get_plugins() == [CachedPlugin]
+
+
+class TestPluginRegistryBuckets:
+    """Tests for the per-base-class plugin buckets in PluginRegistry."""
+    
+    def test_bucket_lookup_returns_copy(self):
+        """Test that typed lookups come from buckets and can be mutated safely."""
+        class BucketGenrePlugin(GenrePlugin):
+            plugin_id = "bucket-genre"
+            plugin_name = "Bucket Genre"
+            plugin_description = "A genre plugin for bucket tests"
+            
+            def get_prompt_enhancers(self): return {}
+            def get_character_templates(self): return []
+            def get_plot_templates(self): return []
+            def get_example_passages(self): return []
+        
+        registry = PluginRegistry()
+        registry.register_plugin(BucketGenrePlugin)
+        
+        genre_plugins = registry.get_genre_plugins()
+        genre_plugins.clear()
+        
+        assert registry.get_genre_plugins() == [BucketGenrePlugin]
+        assert registry.get_model_plugins() == []
+        assert registry.get_plugins(BasePlugin) == [BucketGenrePlugin]
+    
+    def test_all_plugins_cache_invalidated_on_register(self):
+        """Test that the cached list of all plugins is rebuilt after registration."""
+        class FirstPlugin(GenrePlugin):
+            plugin_id = "first-genre"
+            plugin_name = "First Genre"
+            plugin_description = "The first genre plugin"
+            
+            def get_prompt_enhancers(self): return {}
+            def get_character_templates(self): return []
+            def get_plot_templates(self): return []
+            def get_example_passages(self): return []
+        
+        class SecondPlugin(FirstPlugin):
+            plugin_id = "second-genre"
+            plugin_name = "Second Genre"
+        
+        registry = PluginRegistry()
+        registry.register_plugin(FirstPlugin)
+        
+        assert registry.get_plugins() is registry.get_plugins()
+        
+        registry.register_plugin(SecondPlugin)
+        
+        assert registry.get_plugins() == [FirstPlugin, SecondPlugin]
+        assert registry.get_plugins_snapshot() is not registry.get_plugins()
+
+
+class TestPluginManagerDirectoryDiscovery:
+    """Tests for discovering plugins from plugin directories."""
+    
+    PLUGIN_SOURCE = '''
+from pulp_fiction_generator.plugins.base import GenrePlugin
+
+class {name}(GenrePlugin):
+    plugin_id = "{plugin_id}"
+    plugin_name = "{name}"
+    plugin_description = "A plugin loaded from a directory"
+
+    def get_prompt_enhancers(self): return {{}}
+    def get_character_templates(self): return []
+    def get_plot_templates(self): return []
+    def get_example_passages(self): return []
+'''
+    
+    def test_discover_modules_in_directory(self, tmp_path):
+        """Test that every plugin module in a directory is imported and registered."""
+        import sys
+        from pulp_fiction_generator.plugins.manager import PluginManager
+        
+        module_names = ["dir_plugin_one", "dir_plugin_two", "dir_plugin_broken"]
+        (tmp_path / "dir_plugin_one.py").write_text(
+            self.PLUGIN_SOURCE.format(name="DirPluginOne", plugin_id="dir-one")
+        )
+        (tmp_path / "dir_plugin_two.py").write_text(
+            self.PLUGIN_SOURCE.format(name="DirPluginTwo", plugin_id="dir-two")
+        )
+        (tmp_path / "dir_plugin_broken.py").write_text("raise ImportError('broken plugin')")
+        
+        manager = PluginManager()
+        manager.plugin_paths = []
+        manager.add_path(tmp_path)
+        path_length = len(sys.path)
+        
+        try:
+            with patch.object(manager, '_discover_entry_point_plugins'), \
+                 patch.object(manager, '_discover_installed_plugins'):
+                manager.discover_plugins()
+        finally:
+            for module_name in module_names:
+                sys.modules.pop(module_name, None)
+        
+        plugin_ids = sorted(plugin.plugin_id for plugin in manager.get_plugins())
+        assert plugin_ids == ["dir-one", "dir-two"]
+        assert len(sys.path) == path_length
@@ -0,0 +1,338 @@
+"""
+Unit tests for the prompt template system.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from pulp_fiction_generator.prompts.templates import CompiledTemplate, PromptLibrary, PromptTemplate
+from pulp_fiction_generator.prompts.genre_templates import register_genre_templates
+
+
+class TestPromptLibrary:
+    """Tests for the PromptLibrary class."""
+    
+    @pytest.fixture
+    def library(self):
+        """Create a fresh prompt library for each test."""
+        return PromptLibrary()
+    
+    def test_genre_templates_built_on_first_access(self, library):
+        """Test that genre templates are registered lazily."""
+        register_genre_templates(library)
+        
+        # Nothing is built until the template is requested
+        assert "noir" not in library.templates.get("writer", {})
+        
+        template = library.get_template("writer", "noir")
+        
+        assert template.variables["genre"] == "noir"
+        assert template.template_str == library.get_template("writer", "base").template_str
+        assert library.templates["writer"]["noir"] is template
+        assert library.get_template("writer", "noir") is template
+    
+    def test_base_templates_built_on_first_access(self, library):
+        """Test that base templates are only built for agent types that are used."""
+        assert library.templates == {}
+        
+        template = library.get_template("writer")
+        
+        assert "$genre" in template.template_str
+        assert list(library.templates) == ["writer"]
+    
+    def test_add_template_overrides_lazy_registration(self, library):
+        """Test that an explicitly added template replaces a lazy one."""
+        register_genre_templates(library)
+        custom = PromptTemplate("Custom $genre prompt", {"genre": "noir"})
+        
+        library.add_template("writer", "noir", custom)
+        
+        assert library.get_template("writer", "noir") is custom
+    
+    def test_materialize_templates(self, library):
+        """Test that materializing builds every lazy template."""
+        register_genre_templates(library)
+        
+        library.materialize_templates()
+        
+        assert "horror" in library.templates["editor"]
+    
+    def test_get_template_not_found(self, library):
+        """Test that missing templates raise ValueError."""
+        with pytest.raises(ValueError):
+            library.get_template("nonexistent")
+        
+        with pytest.raises(ValueError):
+            library.get_template("writer", "nonexistent")
+
+
+class TestPromptTemplate:
+    """Tests for the PromptTemplate class."""
+    
+    def test_render(self):
+        """Test rendering with default variables and context."""
+        template = PromptTemplate("A $genre story about ${hero}.", {"genre": "noir"})
+        
+        assert template.render({"hero": "Sam"}) == "A noir story about Sam."
+        assert template.render() == "A noir story about ${hero}."
+        assert template.render({"genre": "western", "hero": "Jed"}) == "A western story about Jed."
+        assert PromptTemplate("A $genre story.").render({"genre": "horror"}) == "A horror story."
+        assert template.variables == {"genre": "noir"}
+    
+    def test_substitution_matches_safe_substitute(self):
+        """Test that rendering follows string.Template.safe_substitute."""
+        from string import Template
+        
+        template_str = "$$5 for $name, ${name}s and $missing at $ 10 or ${other} $"
+        context = {"name": "Sam", "other": 3}
+        
+        rendered = PromptTemplate(template_str).render(context)
+        
+        assert rendered == Template(template_str).safe_substitute(context)
+    
+    def test_placeholders(self):
+        """Test that placeholders are extracted in order without duplicates."""
+        template = PromptTemplate("$role writes $genre, ${role} again, $$escaped")
+        
+        assert template.placeholders == ("role", "genre")
+    
+    def test_templates_share_compiled_form(self):
+        """Test that templates built from the same string share parsed state."""
+        template_str = "You are a $role writing $genre fiction."
+        first = PromptTemplate(template_str, {"genre": "noir"})
+        second = PromptTemplate(template_str, {"genre": "horror"})
+        
+        assert first.template is second.template
+        assert first.placeholders is second.placeholders
+        assert first.render({"role": "writer"}) != second.render({"role": "writer"})
+    
+    def test_reloaded_text_shares_compiled_form(self):
+        """Test that the dedented text of a template reuses its compiled form."""
+        original = PromptTemplate("""
+            A $genre story
+            about $hero.
+            """)
+        reloaded = PromptTemplate(original.template_str)
+        
+        assert reloaded.compiled is original.compiled
+    
+    def test_compiled_cache_is_bounded(self):
+        """Test that the compiled template cache keeps a limited number of strings."""
+        from pulp_fiction_generator.prompts import templates
+        
+        with patch.object(templates, "COMPILED_CACHE_SIZE", 4):
+            for i in range(10):
+                templates.compile_template(f"Template {i} for $genre")
+            
+            assert len(templates._COMPILED_CACHE) <= 4
+            assert "Template 9 for $genre" in templates._COMPILED_CACHE
+    
+    def test_from_base(self):
+        """Test that from_base reuses the base template with new variables."""
+        base = PromptTemplate("You are a $role writing $genre fiction.")
+        derived = PromptTemplate.from_base(base, {"genre": "western"})
+        
+        assert derived.template is base.template
+        assert derived.placeholders is base.placeholders
+        assert derived.render({"role": "writer"}) == "You are a writer writing western fiction."
+
+
+class TestGenreTemplates:
+    """Tests for the built-in genre templates."""
+    
+    def test_genre_contexts_are_read_only(self):
+        """Test that shared genre contexts cannot be modified through a template."""
+        library = PromptLibrary()
+        register_genre_templates(library)
+        template = library.get_template("writer", "noir")
+        
+        with pytest.raises(TypeError):
+            template.variables["genre"] = "changed"
+    
+    def test_save_and_load_library(self, tmp_path):
+        """Test that a library with genre templates survives a save/load round trip."""
+        from pulp_fiction_generator.prompts.utility import save_library, load_library
+        
+        library = PromptLibrary()
+        register_genre_templates(library)
+        
+        save_library(library, tmp_path)
+        loaded = load_library(tmp_path)
+        
+        original = library.get_template("plotter", "western")
+        restored = loaded.get_template("plotter", "western")
+        assert restored.template_str == original.template_str
+        assert restored.variables == dict(original.variables)
+        assert [p.name for p in tmp_path.iterdir()] == ["library.json"]
+    
+    def test_load_library_per_file_layout(self, tmp_path):
+        """Test that libraries saved one file per template can still be loaded."""
+        from pulp_fiction_generator.prompts.utility import load_library, save_template
+        
+        save_template(PromptTemplate("A $genre tale", {"genre": "noir"}), tmp_path / "writer" / "pulp.json")
+        save_template(PromptTemplate("A $genre plot", {"genre": "horror"}), tmp_path / "plotter" / "pulp.json")
+        
+        loaded = load_library(tmp_path)
+        
+        assert loaded.get_template("writer", "pulp").render() == "A noir tale"
+        assert loaded.get_template("plotter", "pulp").render() == "A horror plot"
+
+
+class TestPromptTemplateRenderCache:
+    """Tests for the render cache of PromptTemplate."""
+    
+    def test_repeated_render_uses_cache(self):
+        """Test that identical renders are served from the cache."""
+        template = PromptTemplate("A $genre story about $hero.", {"genre": "noir"})
+        
+        first = template.render({"hero": "Sam", "unused": "ignored"})
+        
+        with patch.object(CompiledTemplate, "substitute") as mock_substitute:
+            second = template.render({"hero": "Sam"})
+        
+        assert second == first == "A noir story about Sam."
+        mock_substitute.assert_not_called()
+    
+    def test_unhashable_values_are_rendered(self):
+        """Test that unhashable placeholder values render their current contents."""
+        template = PromptTemplate("Characters: $characters")
+        characters = ["Sam", "Vera"]
+        
+        assert template.render({"characters": characters}) == "Characters: ['Sam', 'Vera']"
+        
+        characters.append("Moose")
+        assert template.render({"characters": characters}) == "Characters: ['Sam', 'Vera', 'Moose']"
+    
+    def test_equal_values_of_different_types_are_cached_apart(self):
+        """Test that values which compare equal but render differently are not confused."""
+        template = PromptTemplate("count=$n")
+        
+        assert template.render({"n": 1}) == "count=1"
+        assert template.render({"n": True}) == "count=True"
+        assert template.render({"n": 1.0}) == "count=1.0"
+        assert template.render({"n": 1}) == "count=1"
+    
+    def test_cache_is_bounded(self):
+        """Test that the cache evicts the oldest renders."""
+        from pulp_fiction_generator.prompts.templates import RENDER_CACHE_SIZE
+        
+        template = PromptTemplate("Chapter $number")
+        for number in range(RENDER_CACHE_SIZE + 10):
+            template.render({"number": number})
+        
+        assert len(template._render_cache) == RENDER_CACHE_SIZE
+        
+        template.clear_cache()
+        assert not template._render_cache
+    
+    def test_template_text_is_dedented(self):
+        """Test that indentation of triple-quoted templates is removed once."""
+        template = PromptTemplate("""
+            You are a $role.
+            
+                Indented $genre line.
+            """)
+        
+        assert template.template_str == "You are a $role.\n\n    Indented $genre line."
+        assert template.render({"role": "writer", "genre": "noir"}) == (
+            "You are a writer.\n\n    Indented noir line."
+        )
+
+
+class TestPromptUtilities:
+    """Tests for the prompt utility functions."""
+    
+    def test_extract_placeholders(self):
+        """Test that plain and braced placeholders are found once each."""
+        from pulp_fiction_generator.prompts.utility import extract_placeholders
+        
+        placeholders = extract_placeholders("$role and ${genre}: $role costs $5")
+        
+        assert isinstance(placeholders, tuple)
+        assert placeholders == ("role", "genre")
+    
+    def test_validate_context(self):
+        """Test that placeholders covered by defaults or context are not missing."""
+        from pulp_fiction_generator.prompts.utility import validate_context
+        
+        template = PromptTemplate("$role writes $genre for $audience", {"genre": "noir"})
+        
+        assert validate_context(template, {"role": "writer"}) == ["audience"]
+        assert validate_context(template, {"role": "writer", "audience": "all"}) == []
+        assert validate_context(template, None) == ["role", "audience"]
+        assert template.required == frozenset({"role", "genre", "audience"})
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_prompt_context_round_trip(self, tmp_path, use_orjson):
+        """Test that contexts round trip with and without orjson."""
+        from pulp_fiction_generator.prompts import utility
+        
+        if use_orjson and not utility.ORJSON_AVAILABLE:
+            pytest.skip("orjson is not installed")
+        
+        context = {"genre": "noir", "hero": "Sam Spade", "tags": ["rain", "smoke"]}
+        path = tmp_path / "context.json"
+        
+        with patch.object(utility, "ORJSON_AVAILABLE", use_orjson):
+            utility.save_prompt_context(context, path)
+            assert utility.load_prompt_context(path) == context
+            
+            utility.save_prompt_context(context, path, pretty=False)
+            assert utility.load_prompt_context(path) == context
+    
+    def test_placeholder_names_are_interned(self):
+        """Test that templates share one copy of each placeholder name."""
+        first = PromptTemplate("".join(["$gen", "re one"]))
+        second = PromptTemplate("${" + "".join(["gen", "re"]) + "} two")
+        
+        assert first.placeholders[0] is second.placeholders[0]
+    
+    def test_failed_save_keeps_existing_context(self, tmp_path):
+        """Test that a failed save leaves the previous file and no temporary file."""
+        from pulp_fiction_generator.prompts.utility import load_prompt_context, save_prompt_context
+        
+        path = tmp_path / "context.json"
+        save_prompt_context({"genre": "noir"}, path)
+        
+        with pytest.raises(TypeError):
+            save_prompt_context({"genre": object()}, path)
+        
+        assert load_prompt_context(path) == {"genre": "noir"}
+        assert [p.name for p in tmp_path.iterdir()] == ["context.json"]
+
+
+class TestSharedPromptLibrary:
+    """Tests for the shared prompt library."""
+    
+    def test_prompt_library_is_shared(self):
+        """Test that every way of getting the shared library returns one instance."""
+        from pulp_fiction_generator import prompts
+        from pulp_fiction_generator.prompts import templates
+        from pulp_fiction_generator.prompts import prompt_library
+        
+        assert prompt_library is prompts.get_prompt_library()
+        assert templates.prompt_library is prompt_library
+        assert prompt_library.get_template("writer", "noir").variables["genre"] == "noir"
+    
+    def test_unknown_attribute(self):
+        """Test that other missing module attributes still raise AttributeError."""
+        from pulp_fiction_generator import prompts
+        
+        with pytest.raises(AttributeError):
+            prompts.not_a_library
+
+
+class TestLoadPromptContextKeys:
+    """Tests for loading selected keys of a prompt context."""
+    
+    def test_load_selected_keys(self, tmp_path):
+        """Test that only the requested keys that exist are returned."""
+        from pulp_fiction_generator.prompts.utility import load_prompt_context_keys, save_prompt_context
+        
+        path = tmp_path / "context.json"
+        save_prompt_context({"genre": "noir", "draft": "x" * 1000, "chapters": [1, 2.5]}, path)
+        
+        assert load_prompt_context_keys(path, {"genre", "chapters", "missing"}) == {
+            "genre": "noir",
+            "chapters": [1, 2.5]
+        }
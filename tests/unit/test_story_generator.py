@@ -3,6 +3,7 @@ Unit tests for the modular StoryGenerator.
 """
 
 import os
+import threading
 import pytest
 from unittest.mock import Mock, patch, MagicMock, call
 
@@ -12,6 +13,8 @@ from pulp_fiction_generator.story_model.execution import ExecutionEngine
 from pulp_fiction_generator.story_model.validation import StoryValidator
 from pulp_fiction_generator.story_model.tasks import TaskFactory
 from pulp_fiction_generator.story_model.state import StoryStateManager
+from pulp_fiction_generator.story_model.models import StoryArtifacts
+from pulp_fiction_generator.utils.errors import ConfigurationError, ModelConnectionError
 
 
 class TestStoryGenerator:
@@ -113,6 +116,185 @@ class TestStoryGenerator:
             # Verify the expected result was returned
             assert result == mock_execution_engine.execute_crew.return_value
     
+    def test_generate_story_falls_back(self, story_generator, mock_execution_engine):
+        """Test that generate_story falls back to phased generation, then to a placeholder."""
+        mock_execution_engine.execute_crew.side_effect = RuntimeError("crew failed")
+        
+        with patch.object(story_generator, 'generate_story_phased', return_value="Phased story"):
+            assert story_generator.generate_story(genre="noir") == "Phased story"
+        
+        with patch.object(story_generator, 'generate_story_phased', side_effect=RuntimeError("phases failed")):
+            result = story_generator.generate_story(genre="noir")
+        
+        assert result == story_generator._get_fallback_content("final_story", "noir")
+    
+    def test_flow_factory_is_reused(self, story_generator):
+        """Test that the flow factory is created once per crew factory."""
+        flow_factory = story_generator._get_flow_factory()
+        
+        assert story_generator._get_flow_factory() is flow_factory
+        assert flow_factory.crew_factory is story_generator.crew_factory
+        
+        story_generator.crew_factory = Mock()
+        assert story_generator._get_flow_factory() is not flow_factory
+    
+    def test_generate_story_with_flow_caches_stories(self, story_generator):
+        """Test that repeated flow requests are served from the story cache."""
+        flow_factory = Mock()
+        flow_factory.generate_story = Mock(side_effect=["First story", "Second story", "Third story"])
+        
+        with patch.object(story_generator, '_get_flow_factory', return_value=flow_factory):
+            first = story_generator.generate_story_with_flow(genre="noir", custom_inputs={"title": "Rain"})
+            again = story_generator.generate_story_with_flow(genre="noir", custom_inputs={"title": "Rain"})
+            other = story_generator.generate_story_with_flow(genre="noir", custom_inputs={"title": "Smoke"})
+            uncached = story_generator.generate_story_with_flow(
+                genre="noir", custom_inputs={"title": "Rain"}, use_cache=False
+            )
+        
+        assert first == again == "First story"
+        assert other == "Second story"
+        assert uncached == "Third story"
+        assert flow_factory.generate_story.call_count == 3
+    
+    def test_generate_story_with_flow_falls_back(self, story_generator):
+        """Test that a failed flow falls back to generate_story and is not cached."""
+        flow_factory = Mock()
+        flow_factory.generate_story = Mock(side_effect=RuntimeError("flow failed"))
+        
+        with patch.object(story_generator, '_get_flow_factory', return_value=flow_factory), \
+                patch.object(story_generator, 'generate_story', return_value="Traditional story") as mock_generate:
+            assert story_generator.generate_story_with_flow(genre="noir") == "Traditional story"
+            assert story_generator.generate_story_with_flow(genre="noir", debug_mode=True) == "Traditional story"
+        
+        assert mock_generate.call_count == 2
+        assert mock_generate.call_args.kwargs["debug_mode"] is True
+        assert story_generator.debug_mode is False
+        assert not story_generator._story_cache
+    
+    def test_generate_story_with_flow_retries_transient_errors(self, story_generator):
+        """Test that the flow is retried once after a connection error."""
+        flow_factory = Mock()
+        flow_factory.generate_story = Mock(side_effect=[ModelConnectionError("reset"), "A noir story"])
+        
+        with patch.object(story_generator, '_get_flow_factory', return_value=flow_factory), \
+                patch.object(story_generator, 'generate_story') as mock_generate:
+            assert story_generator.generate_story_with_flow(genre="noir") == "A noir story"
+        
+        assert flow_factory.generate_story.call_count == 2
+        mock_generate.assert_not_called()
+    
+    def test_generate_story_with_flow_raises_unretryable_errors(self, story_generator):
+        """Test that configuration errors are raised instead of falling back."""
+        flow_factory = Mock()
+        flow_factory.generate_story = Mock(side_effect=ConfigurationError("no model configured"))
+        
+        with patch.object(story_generator, '_get_flow_factory', return_value=flow_factory), \
+                patch.object(story_generator, 'generate_story') as mock_generate:
+            with pytest.raises(ConfigurationError):
+                story_generator.generate_story_with_flow(genre="noir")
+        
+        assert flow_factory.generate_story.call_count == 1
+        mock_generate.assert_not_called()
+    
+    def test_visualize_story_flow_reuses_file(self, story_generator, tmp_path):
+        """Test that an existing visualization is not rendered again."""
+        output_file = str(tmp_path / "flow.html")
+        
+        def render(genre, output_file, custom_inputs):
+            with open(output_file, "w") as f:
+                f.write(genre)
+            return output_file
+        
+        flow_factory = Mock()
+        flow_factory.visualize_story_flow = Mock(side_effect=render)
+        
+        with patch.object(story_generator, '_get_flow_factory', return_value=flow_factory):
+            assert story_generator.visualize_story_flow("noir", output_file) == output_file
+            assert story_generator.visualize_story_flow("noir", output_file) == output_file
+            assert flow_factory.visualize_story_flow.call_count == 1
+            
+            story_generator.visualize_story_flow("western", output_file)
+            story_generator.visualize_story_flow("noir", output_file)
+            os.remove(output_file)
+            story_generator.visualize_story_flow("noir", output_file)
+        
+        assert flow_factory.visualize_story_flow.call_count == 4
+    
+    def test_identical_flow_requests_share_one_run(self, story_generator):
+        """Test that concurrent identical requests wait for the running one."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        
+        started = threading.Event()
+        release = threading.Event()
+        
+        def generate(genre, **kwargs):
+            started.set()
+            release.wait(5)
+            return f"A {genre} story"
+        
+        flow_factory = Mock()
+        flow_factory.generate_story = Mock(side_effect=generate)
+        
+        with patch.object(story_generator, '_get_flow_factory', return_value=flow_factory), \
+                ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(story_generator.generate_story_with_flow, genre="noir")
+            started.wait(5)
+            second = executor.submit(story_generator.generate_story_with_flow, genre="noir")
+            release.set()
+            results = [first.result(5), second.result(5)]
+        
+        assert results == ["A noir story", "A noir story"]
+        assert flow_factory.generate_story.call_count == 1
+        assert not story_generator._stories_in_flight
+    
+    def test_identical_flow_request_wait_times_out(self, story_generator):
+        """Test that a request waiting for a stuck identical request gives up after its timeout."""
+        from concurrent.futures import ThreadPoolExecutor
+        from pulp_fiction_generator.utils.errors import TimeoutError
+        
+        started = threading.Event()
+        release = threading.Event()
+        
+        def generate(genre, **kwargs):
+            started.set()
+            release.wait(5)
+            return f"A {genre} story"
+        
+        flow_factory = Mock()
+        flow_factory.generate_story = Mock(side_effect=generate)
+        
+        with patch.object(story_generator, '_get_flow_factory', return_value=flow_factory), \
+                ThreadPoolExecutor(max_workers=1) as executor:
+            first = executor.submit(story_generator.generate_story_with_flow, genre="noir")
+            started.wait(5)
+            try:
+                with pytest.raises(TimeoutError):
+                    story_generator.generate_story_with_flow(genre="noir", timeout_seconds=0.1)
+            finally:
+                release.set()
+            assert first.result(5) == "A noir story"
+        
+        assert flow_factory.generate_story.call_count == 1
+    
+    def test_generate_story_with_flow_async(self, story_generator):
+        """Test that several flow-based stories can be awaited concurrently."""
+        import asyncio
+        
+        flow_factory = Mock()
+        flow_factory.generate_story = Mock(side_effect=lambda genre, **kwargs: f"A {genre} story")
+        
+        async def generate_all():
+            return await asyncio.gather(
+                story_generator.generate_story_with_flow_async(genre="noir"),
+                story_generator.generate_story_with_flow_async(genre="western")
+            )
+        
+        with patch.object(story_generator, '_get_flow_factory', return_value=flow_factory):
+            results = asyncio.run(generate_all())
+        
+        assert results == ["A noir story", "A western story"]
+    
     def test_generate_story_chunked(self, story_generator, mock_execution_engine):
         """Test generate_story_chunked method."""
         # Create a mock callback
@@ -179,8 +361,11 @@ class TestStoryGenerator:
             call("final_story", "This is test task output."),
         ], any_order=True)
     
-    def test_execute_detailed_research(self, story_generator, mock_execution_engine):
+    def test_execute_detailed_research(self, story_generator, mock_execution_engine, tmp_path, monkeypatch):
         """Test execute_detailed_research method."""
+        # Write the research brief under a temporary directory
+        monkeypatch.chdir(tmp_path)
+        
         # Mock the logger
         with patch('pulp_fiction_generator.story.generator.logger') as mock_logger:
             # Call the method
@@ -195,6 +380,538 @@ class TestStoryGenerator:
             # Verify the expected result was returned
             assert result is not None
     
+    def test_execute_detailed_research_keeps_subtask_order(self, story_generator, mock_execution_engine, tmp_path, monkeypatch):
+        """Test that concurrently executed research subtasks keep their sections."""
+        tasks = [Mock(name=f"subtask_{i}") for i in range(3)]
+        story_generator.task_factory.create_research_subtasks.return_value = tasks
+        outputs = {id(task): f"output {i}" for i, task in enumerate(tasks)}
+        mock_execution_engine.execute_task.side_effect = lambda task: outputs[id(task)]
+        
+        monkeypatch.chdir(tmp_path)
+        result = story_generator.execute_detailed_research(genre="noir", max_workers=3)
+        
+        assert mock_execution_engine.execute_task.call_count == 3
+        assert result == (
+            "# Noir Pulp Fiction Research Brief\n\n"
+            "## Core Genre Elements\noutput 0\n\n"
+            "## Historical Context\noutput 1\n\n"
+            "## Writing Style Guide\noutput 2\n"
+        )
+        # The brief is written by the time the method returns
+        assert (tmp_path / "output" / "noir_research" / "chapter_1" / "research.txt").read_text() == result
+    
+    def test_execute_detailed_research_waits_for_context(self, story_generator, mock_execution_engine, tmp_path, monkeypatch):
+        """Test that subtasks using earlier subtasks as context only start once those are done."""
+        genre_elements, historical_context, style_guide = tasks = [Mock(name=f"subtask_{i}") for i in range(3)]
+        genre_elements.context = None
+        historical_context.context = [genre_elements]
+        style_guide.context = [genre_elements, historical_context]
+        story_generator.task_factory.create_research_subtasks.return_value = tasks
+        
+        finished = []
+        
+        def execute_task(task):
+            assert all(context in finished for context in (task.context or []))
+            finished.append(task)
+            return "output"
+        
+        mock_execution_engine.execute_task.side_effect = execute_task
+        
+        monkeypatch.chdir(tmp_path)
+        story_generator.execute_detailed_research(genre="noir", max_workers=3)
+        
+        assert finished == tasks
+    
+    def test_fallback_content(self, story_generator):
+        """Test that fallback content is formatted for the requested genre."""
+        assert "noir" in story_generator._get_fallback_content("plot", "noir")
+        assert "western" in story_generator._get_fallback_content("plot", "western")
+        assert story_generator._get_fallback_content("unknown", "noir") == "Placeholder content for noir unknown."
+        assert set(story_generator._formatted_fallbacks) == {"noir", "western"}
+        
+        # The templates are shared by every generator and cannot be changed
+        with pytest.raises(TypeError):
+            story_generator.fallback_templates["plot"] = "changed"
+    
+    def test_run_phase_dag_respects_dependencies(self, story_generator, mock_story_state):
+        """Test that phases only run after the phases they depend on."""
+        order = []
+        processors = {
+            name: (lambda *args, name=name: order.append(name))
+            for name in ("research", "worldbuilding", "characters", "plot")
+        }
+        dependencies = {
+            "research": (),
+            "worldbuilding": ("research",),
+            "characters": ("research",),
+            "plot": ("worldbuilding", "characters"),
+        }
+        
+        with patch.object(story_generator, '_get_phase_processors', return_value=processors):
+            story_generator._run_phase_dag(
+                dependencies, "noir", 1, "project", None, mock_story_state, StoryArtifacts(), 60
+            )
+        
+        assert sorted(order) == sorted(dependencies)
+        assert order[0] == "research"
+        assert order[-1] == "plot"
+    
+    def test_generate_story_chunked_runs_phases_in_dependency_order(self, story_generator, mock_story_state):
+        """Test that chunked generation follows the phase dependencies and only falls back for research."""
+        order = []
+        
+        def processor(name):
+            def process(*args):
+                order.append(name)
+                if name == "research":
+                    raise RuntimeError("research failed")
+            return process
+        
+        processors = {name: processor(name) for name in StoryGenerator.PHASE_DEPENDENCIES}
+        
+        with patch.object(story_generator, '_get_phase_processors', return_value=processors):
+            artifacts = story_generator.generate_story_chunked(genre="noir", story_state=mock_story_state)
+        
+        assert order == list(StoryGenerator.PHASE_DEPENDENCIES)
+        assert artifacts.research == story_generator._get_fallback_content("research", "noir")
+        
+        processors["plot"] = Mock(side_effect=RuntimeError("plot failed"))
+        with patch.object(story_generator, '_get_phase_processors', return_value=processors):
+            with pytest.raises(RuntimeError):
+                story_generator.generate_story_chunked(genre="noir", story_state=mock_story_state)
+    
+    def test_generate_story_chunked_stores_task_outputs(self, story_generator, mock_story_state):
+        """Test that task outputs reported to the callback land in their artifacts."""
+        def task(name, output):
+            mock_task = Mock(output=output)
+            mock_task.name = name
+            return mock_task
+        
+        def process(genre, chapter_num, project_dir, callback, *args):
+            callback(task("character_development", "deeper characters"))
+            callback(task("unknown_task", "ignored"))
+        
+        processors = {name: Mock() for name in StoryGenerator.PHASE_DEPENDENCIES}
+        processors["characters"] = process
+        chunk_callback = Mock()
+        
+        with patch.object(story_generator, '_get_phase_processors', return_value=processors):
+            artifacts = story_generator.generate_story_chunked(
+                genre="noir", story_state=mock_story_state, chunk_callback=chunk_callback
+            )
+        
+        assert artifacts.characters_enhanced == "deeper characters"
+        chunk_callback.assert_any_call("unknown_task", "ignored")
+    
+    def test_raw_tools_pipeline_saves_callback_outputs_once(self, story_generator, mock_story_state):
+        """Test that outputs reported to the callback are saved in one batch, not per task."""
+        def process_raw(genre, tools, chapter_num, project_dir, callback, *args):
+            task = Mock(output="Raw research")
+            task.name = "raw_genre_research"
+            callback(task)
+        
+        phases = [
+            '_process_research_phase', '_process_worldbuilding_phase', '_process_character_phase',
+            '_process_plot_phase', '_process_draft_phase', '_process_final_phase'
+        ]
+        with patch.object(story_generator, '_process_raw_tool_outputs', side_effect=process_raw):
+            with patch.multiple(story_generator, **{name: Mock() for name in phases}):
+                artifacts = story_generator.generate_story_chunked_with_raw_tools(
+                    genre="noir", tools={}, story_state=mock_story_state
+                )
+        
+        assert artifacts.raw_genre_research == "Raw research"
+        mock_story_state.save_task_output.assert_not_called()
+        mock_story_state.add_task_outputs.assert_called_once_with({"raw_genre_research": "Raw research"}, 1)
+    
+    def test_raw_tool_tasks_run_concurrently(self, story_generator, mock_execution_engine, mock_story_state):
+        """Test that the raw tool tasks run at the same time and keep their own outputs."""
+        mock_story_state.has_task_output.return_value = False
+        task_factory = story_generator.task_factory
+        plot_task = task_factory.create_raw_plot_structures_task.return_value
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def execute_task(task, timeout_seconds):
+            barrier.wait()
+            if task is plot_task:
+                raise RuntimeError("plot tool failed")
+            return "Raw research"
+        
+        mock_execution_engine.execute_task.side_effect = execute_task
+        artifacts = StoryArtifacts()
+        
+        story_generator._process_raw_tool_outputs(
+            "noir", {"search_tool": Mock(), "plot_tool": Mock()}, 1, "project", None,
+            mock_story_state, artifacts, 60
+        )
+        
+        assert artifacts.raw_genre_research == "Raw research"
+        assert artifacts.raw_plot_structures is None
+        mock_story_state.save_task_output.assert_called_once_with("raw_genre_research", "Raw research")
+    
+    def test_generate_chapters(self, story_generator, mock_story_state):
+        """Test that chapters are generated with their own inputs and state, and returned in order."""
+        def generate(genre, custom_inputs=None, story_state=None, timeout_seconds=120):
+            return StoryArtifacts(genre=genre, title=f"{custom_inputs['title']} {custom_inputs['chapter_number']}")
+        
+        mock_story_state.clone.side_effect = lambda: Mock(spec=StoryStateManager)
+        chapter_callback = Mock()
+        
+        with patch.object(story_generator, 'generate_story_chunked', side_effect=generate) as mock_generate:
+            results = story_generator.generate_chapters(
+                "noir", [3, 1, 2, 1], custom_inputs={"title": "Rain"}, chapter_callback=chapter_callback
+            )
+        
+        assert list(results) == [1, 2, 3]
+        assert results[2].title == "Rain 2"
+        assert chapter_callback.call_count == 3
+        states = [c.kwargs["story_state"] for c in mock_generate.call_args_list]
+        assert len({id(state) for state in states}) == 3
+        assert story_generator.generate_chapters("noir", []) == {}
+    
+    def test_generate_chapters_keeps_chapter_outputs_apart(self, story_generator, mock_execution_engine, tmp_path):
+        """Test that each chapter generates and saves its own outputs, in its own directory."""
+        def create_task(**kwargs):
+            task = Mock()
+            task.chapter_num = kwargs["chapter_num"]
+            return task
+        
+        for method in (
+            "create_research_task", "create_research_expansion_task", "create_worldbuilding_task",
+            "create_character_task", "create_character_development_task", "create_plot_task",
+            "create_plot_twist_task", "create_writing_task", "create_style_improvement_task",
+            "create_consistency_check_task", "create_editing_task",
+        ):
+            getattr(story_generator.task_factory, method).side_effect = create_task
+        mock_execution_engine.execute_task.side_effect = (
+            lambda task, timeout_seconds=None: f"Chapter {task.chapter_num} output"
+        )
+        
+        # Save the task outputs as plain files
+        with patch('pulp_fiction_generator.story_model.state.CREWAI_TOOLS_AVAILABLE', False):
+            story_generator.state_manager = StoryStateManager(base_dir=str(tmp_path))
+            results = story_generator.generate_chapters("noir", [1, 2, 3], custom_inputs={"title": "Rain"})
+        
+        for chapter_num in (1, 2, 3):
+            assert results[chapter_num].final_story == f"Chapter {chapter_num} output"
+            chapter_dir = tmp_path / "rain" / f"chapter_{chapter_num}"
+            assert (chapter_dir / "final.txt").read_text() == f"Chapter {chapter_num} output"
+            assert (chapter_dir / "research.txt").read_text() == f"Chapter {chapter_num} output"
+    
+    def test_generate_story_chunked_keeps_outputs_of_failed_run(self, story_generator, tmp_path):
+        """Test that outputs completed before a phase fails are saved for a resumed run."""
+        def research(genre, chapter_num, project_dir, callback, state, artifacts, timeout_seconds):
+            task = Mock()
+            task.name = "research"
+            task.output = "Noir research"
+            callback(task)
+        
+        processors = {name: Mock() for name in StoryGenerator.PHASE_DEPENDENCIES}
+        processors["research"] = research
+        processors["worldbuilding"].side_effect = RuntimeError("no world")
+        
+        with patch('pulp_fiction_generator.story_model.state.CREWAI_TOOLS_AVAILABLE', False):
+            state = StoryStateManager(base_dir=str(tmp_path))
+            with patch.object(story_generator, '_get_phase_processors', return_value=processors), \
+                    pytest.raises(RuntimeError):
+                story_generator.generate_story_chunked("noir", story_state=state)
+        
+        assert (tmp_path / "untitled_story" / "chapter_1" / "research.txt").read_text() == "Noir research"
+    
+    def test_concurrent_tasks_are_limited(self, mock_crew_factory, mock_execution_engine, mock_story_state):
+        """Test that tasks executed from many threads never exceed max_concurrent_tasks at once."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        
+        story_generator = StoryGenerator(
+            crew_factory=mock_crew_factory,
+            task_factory=Mock(spec=TaskFactory),
+            execution_engine=mock_execution_engine,
+            state_manager=mock_story_state,
+            max_concurrent_tasks=2
+        )
+        lock = threading.Lock()
+        running = []
+        peak = []
+        
+        def execute_task(task, timeout_seconds=None):
+            with lock:
+                running.append(task)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(task)
+            return "Output"
+        
+        mock_execution_engine.execute_task.side_effect = execute_task
+        
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            outputs = list(executor.map(
+                lambda task: story_generator._execute_task(task, timeout_seconds=60), [Mock() for _ in range(6)]
+            ))
+        
+        assert outputs == ["Output"] * 6
+        assert max(peak) == 2
+    
+    def test_run_phase_dag_rejects_cycles(self, story_generator, mock_story_state):
+        """Test that cyclic phase dependencies raise a GenerationError."""
+        from pulp_fiction_generator.story_model.generator import GenerationError
+        
+        with pytest.raises(GenerationError):
+            story_generator._run_phase_dag(
+                {"research": ("plot",), "plot": ("research",)},
+                "noir", 1, "project", None, mock_story_state, StoryArtifacts(), 60
+            )
+    
+    def test_run_phase_dag_cancels_followups_on_failure(self, story_generator, mock_story_state):
+        """Test that background follow-ups do not outlive a failed pipeline."""
+        from concurrent.futures import Future
+        
+        queued = Future()
+        
+        def research(genre, chapter_num, project_dir, callback, state, artifacts, timeout_seconds):
+            artifacts.defer("research_expanded", queued)
+        
+        processors = {"research": research, "worldbuilding": Mock(side_effect=RuntimeError("no world"))}
+        
+        with patch.object(story_generator, '_get_phase_processors', return_value=processors), \
+                pytest.raises(RuntimeError):
+            story_generator._run_phase_dag(
+                {"research": (), "worldbuilding": ("research",)},
+                "noir", 1, "project", None, mock_story_state, StoryArtifacts(), 60,
+                fallback_phases=set()
+            )
+        
+        assert queued.cancelled()
+    
+    def test_generate_story_phased_checks_completion_once(self, story_generator, tmp_path):
+        """Test that phase completion is looked up once per phase, not once per step."""
+        state = StoryStateManager(base_dir=str(tmp_path))
+        state.has_completed_task = Mock(return_value=False)
+        story_generator.state_manager = state
+        processed = []
+        processors = {
+            name: (lambda *args, name=name: processed.append(name))
+            for name in StoryGenerator.PHASE_DEPENDENCIES
+        }
+        
+        with patch.object(story_generator, '_get_phase_processors', return_value=processors):
+            story_generator.generate_story_phased(genre="noir")
+        
+        assert processed == list(StoryGenerator.PHASE_DEPENDENCIES)
+        assert state.has_completed_task.call_count == len(StoryGenerator.PHASE_DEPENDENCIES)
+    
+    def test_generate_story_phased_all_phases_completed(self, story_generator, tmp_path):
+        """Test that a story with every phase completed is read back without running phases."""
+        state = StoryStateManager(base_dir=str(tmp_path))
+        state.set_project_directory("default_project")
+        outputs = {phase: f"Saved {phase}" for phase in StoryGenerator.PHASE_DEPENDENCIES}
+        # The final phase saves the story as its "final" task
+        outputs["final"] = outputs.pop("final_story")
+        state.add_task_outputs(outputs, 1)
+        story_generator.state_manager = state
+        
+        with patch.object(story_generator, '_run_phase_dag') as mock_run_phase_dag:
+            result = story_generator.generate_story_phased(genre="noir")
+        
+        assert result == "Saved final_story"
+        mock_run_phase_dag.assert_not_called()
+    
+    def test_generate_story_phased_reads_back_completed_run(self, story_generator, mock_execution_engine, tmp_path):
+        """Test that the story of a completed phased run is read back by the next run."""
+        mock_execution_engine.execute_task.side_effect = lambda task, timeout_seconds=None: "The story"
+        
+        # Save the task outputs as plain files, which the next run reads back
+        with patch('pulp_fiction_generator.story_model.state.CREWAI_TOOLS_AVAILABLE', False):
+            story_generator.state_manager = StoryStateManager(base_dir=str(tmp_path))
+            first = story_generator.generate_story_phased(genre="noir")
+            
+            with patch.object(story_generator, '_run_phase_dag') as mock_run_phase_dag:
+                second = story_generator.generate_story_phased(genre="noir")
+        
+        assert first == second == "The story"
+        mock_run_phase_dag.assert_not_called()
+    
+    def test_generate_story_phased_regenerates_placeholder_story(self, story_generator, tmp_path):
+        """Test that a placeholder final story saved by the fallback path is not read back."""
+        state = StoryStateManager(base_dir=str(tmp_path))
+        state.set_project_directory("default_project")
+        state.add_task_outputs({phase: f"Saved {phase}" for phase in StoryGenerator.PHASE_DEPENDENCIES}, 1)
+        story_generator.state_manager = state
+        
+        with patch.object(story_generator, '_run_phase_dag') as mock_run_phase_dag:
+            story_generator.generate_story_phased(genre="noir")
+        
+        mock_run_phase_dag.assert_called_once()
+    
+    def test_generate_story_phased_sanitizes_project_dir(self, story_generator, tmp_path):
+        """Test that phased generation gives the phases the same project directory as the state."""
+        story_generator.state_manager = StoryStateManager(base_dir=str(tmp_path))
+        processors = {name: Mock() for name in StoryGenerator.PHASE_DEPENDENCIES}
+        
+        with patch.object(story_generator, '_get_phase_processors', return_value=processors):
+            story_generator.generate_story_phased(genre="noir", custom_inputs={"project_dir": "The Big Sleep"})
+        
+        genre, chapter_num, project_dir, callback, state, artifacts, timeout_seconds = processors["research"].call_args.args
+        assert project_dir == state.project_dir == "the_big_sleep"
+        assert artifacts.title == "The Big Sleep"
+    
+    def test_generate_story_phased_async(self, story_generator, tmp_path):
+        """Test that several phased stories can be awaited concurrently."""
+        import asyncio
+        
+        story_generator.state_manager = StoryStateManager(base_dir=str(tmp_path))
+        
+        def final_phase(genre, chapter_num, project_dir, callback, state, artifacts, timeout_seconds):
+            artifacts.final_story = f"A {genre} story"
+        
+        processors = {name: Mock() for name in StoryGenerator.PHASE_DEPENDENCIES}
+        processors["final_story"] = final_phase
+        
+        async def generate_all():
+            return await asyncio.gather(
+                story_generator.generate_story_phased_async(genre="noir"),
+                story_generator.generate_story_phased_async(genre="western")
+            )
+        
+        with patch.object(story_generator, '_get_phase_processors', return_value=processors):
+            results = asyncio.run(generate_all())
+        
+        assert results == ["A noir story", "A western story"]
+    
+    def test_phase_checkpoint_skips_phase(self, story_generator, mock_execution_engine, tmp_path):
+        """Test that a phase with a saved checkpoint is not executed again."""
+        story_state = StoryStateManager(base_dir=str(tmp_path))
+        story_generator._save_phase_checkpoint(
+            "worldbuilding", "noir", 1, story_state,
+            StoryArtifacts(research="Noir research", worldbuilding="Saved world")
+        )
+        artifacts = StoryArtifacts(research="Noir research")
+        
+        story_generator._process_worldbuilding_phase(
+            "noir", 1, "project", None, story_state, artifacts, 60
+        )
+        
+        assert artifacts.worldbuilding == "Saved world"
+        mock_execution_engine.execute_task.assert_not_called()
+    
+    def test_run_phase_runs_main_and_followup_tasks(self, story_generator, mock_execution_engine, tmp_path):
+        """Test that a phase stores its main output and tolerates a failed follow-up task."""
+        story_state = StoryStateManager(base_dir=str(tmp_path))
+        artifacts = StoryArtifacts(research="Noir research", worldbuilding="A rainy city")
+        mock_execution_engine.execute_task.side_effect = ["Sam Spade", "Sam Spade, haunted"]
+        
+        story_generator._process_character_phase("noir", 1, "project", None, story_state, artifacts, 60)
+        
+        story_generator.task_factory.create_character_task.assert_called_once_with(
+            context=["Noir research", "A rainy city"],
+            genre="noir", chapter_num=1, project_dir="project", callback=None
+        )
+        assert artifacts.characters == "Sam Spade"
+        assert artifacts.characters_enhanced == "Sam Spade, haunted"
+        assert story_state.get_task_output("character_development") == "Sam Spade, haunted"
+        
+        artifacts = StoryArtifacts(research="Noir research", worldbuilding="A rainy city", characters="Sam Spade")
+        mock_execution_engine.execute_task.side_effect = ["The plot", RuntimeError("no twist")]
+        
+        story_state = StoryStateManager(base_dir=str(tmp_path / "plot"))
+        story_generator._process_plot_phase("noir", 1, "project", None, story_state, artifacts, 60)
+        
+        assert artifacts.plot == "The plot"
+        assert artifacts.plot_twist is None
+    
+    def test_research_expansion_runs_in_background(self, story_generator, mock_execution_engine, tmp_path):
+        """Test that the world is built from the raw research while the research is expanded."""
+        story_state = StoryStateManager(base_dir=str(tmp_path))
+        artifacts = StoryArtifacts()
+        task_factory = story_generator.task_factory
+        expansion_task = task_factory.create_research_expansion_task.return_value
+        worldbuilding_task = task_factory.create_worldbuilding_task.return_value = Mock()
+        expansion_started = threading.Event()
+        release_expansion = threading.Event()
+        
+        def execute_task(task, timeout_seconds):
+            if task is expansion_task:
+                expansion_started.set()
+                release_expansion.wait(5)
+                return "Expanded research"
+            return "A rainy city" if task is worldbuilding_task else "Noir research"
+        
+        mock_execution_engine.execute_task.side_effect = execute_task
+        args = ("noir", 1, "project", None, story_state, artifacts, 60)
+        
+        story_generator._process_research_phase(*args)
+        assert expansion_started.wait(5)
+        story_generator._process_worldbuilding_phase(*args)
+        
+        task_factory.create_worldbuilding_task.assert_called_once_with(
+            context="Noir research", genre="noir", chapter_num=1, project_dir="project", callback=None
+        )
+        assert artifacts.research_expanded is None
+        
+        release_expansion.set()
+        story_generator._process_character_phase(*args)
+        
+        assert task_factory.create_character_task.call_args.kwargs["context"] == [
+            "Noir research\n\nEXPANDED RESEARCH:\nExpanded research", "A rainy city"
+        ]
+        assert story_state.get_task_output("research_expansion") == "Expanded research"
+    
+    def test_draft_context_shortens_background(self, story_generator):
+        """Test that the draft gets the characters and plot in full but only the start of the background."""
+        from pulp_fiction_generator.story_model import generator
+        
+        opening = "The city never sleeps, and neither do the crooks who run it."
+        research = opening + "\n\n" + "x" * 5000
+        artifacts = StoryArtifacts(
+            research=research, worldbuilding="A rainy city", characters="Sam", plot="P" * 5000, plot_twist="Twist"
+        )
+        
+        with patch.object(generator, "_BACKGROUND_CONTEXT_CHARS", 100):
+            context = generator._PHASE_SPECS["draft"].context(artifacts)
+        
+        assert context[0] == opening + "\n[...]"
+        assert context[1:3] == ["A rainy city", "Sam"]
+        assert context[3] == "P" * 5000 + "\n\nPLOT TWIST:\nTwist"
+    
+    def test_phase_checkpoint_requires_same_inputs(self, story_generator, tmp_path):
+        """Test that a checkpoint is not reused once the upstream artifacts change."""
+        story_state = StoryStateManager(base_dir=str(tmp_path))
+        story_generator._save_phase_checkpoint(
+            "worldbuilding", "noir", 1, story_state,
+            StoryArtifacts(research="Noir research", worldbuilding="Saved world")
+        )
+        
+        changed = StoryArtifacts(research="Revised research")
+        assert not story_generator._restore_phase_checkpoint("worldbuilding", "noir", 1, story_state, changed)
+        assert changed.worldbuilding is None
+        
+        with patch.object(StoryGenerator, "CHECKPOINT_VERSION", StoryGenerator.CHECKPOINT_VERSION + 1):
+            same = StoryArtifacts(research="Noir research")
+            assert not story_generator._restore_phase_checkpoint("worldbuilding", "noir", 1, story_state, same)
+    
+    def test_phase_cache_is_shared_between_projects(self, story_generator, mock_execution_engine, tmp_path):
+        """Test that a phase generated in one project is reused by another from the phase cache."""
+        from pulp_fiction_generator.story_model.state import PhaseCache
+        
+        story_generator.phase_cache = PhaseCache(tmp_path / "cache")
+        first = StoryStateManager(base_dir=str(tmp_path / "first"))
+        story_generator._process_worldbuilding_phase(
+            "noir", 1, "first", None, first, StoryArtifacts(research="Noir research"), 60
+        )
+        mock_execution_engine.execute_task.reset_mock()
+        
+        second = StoryStateManager(base_dir=str(tmp_path / "second"))
+        artifacts = StoryArtifacts(research="Noir research")
+        story_generator._process_worldbuilding_phase("noir", 1, "second", None, second, artifacts, 60)
+        
+        mock_execution_engine.execute_task.assert_not_called()
+        assert artifacts.worldbuilding == "This is test task output."
+        assert second.has_completed_task("worldbuilding", 1)
+        assert second.load_cached_phase(
+            "worldbuilding", 1, "noir", story_generator._phase_input_key("worldbuilding", "noir", 1, artifacts)
+        ) == {"worldbuilding": "This is test task output."}
+    
     def test_reuse_completed_tasks(self, story_generator, mock_story_state, mock_execution_engine):
         """Test that completed tasks are reused from story state."""
         # Configure mock state to have a completed task
@@ -0,0 +1,62 @@
+"""
+Unit tests for the story data models.
+"""
+
+import pytest
+
+from pulp_fiction_generator.story_model.models import Phase, StoryArtifacts
+
+
+class TestStoryArtifacts:
+    """Tests for the StoryArtifacts model."""
+    
+    def test_item_access(self):
+        """Test that artifacts can be read and written by name."""
+        artifacts = StoryArtifacts(research="Noir research")
+        
+        artifacts["plot"] = "A double cross"
+        
+        assert artifacts["research"] == "Noir research"
+        assert artifacts.plot == "A double cross"
+        assert artifacts["draft"] is None
+        assert artifacts.model_dump()["plot"] == "A double cross"
+    
+    def test_unknown_artifact(self):
+        """Test that names that are not artifact fields are rejected."""
+        artifacts = StoryArtifacts()
+        
+        assert "research" in artifacts
+        assert "is_complete" not in artifacts
+        with pytest.raises(KeyError):
+            artifacts["is_complete"]
+        with pytest.raises(KeyError):
+            artifacts["unknown"] = "value"
+    
+    def test_phase_access(self):
+        """Test that phases can be used wherever their artifact names are."""
+        artifacts = StoryArtifacts()
+        
+        artifacts[Phase.PLOT] = "A double cross"
+        
+        assert Phase.PLOT in artifacts
+        assert artifacts["plot"] == artifacts[Phase.PLOT] == "A double cross"
+        assert Phase("final_story") is Phase.FINAL_STORY
+        assert {"draft": 1}[Phase.DRAFT] == 1
+        assert f"{Phase.DRAFT}.json" == "draft.json"
+    
+    def test_completeness_checks(self):
+        """Test that the completeness checks return booleans for partial and full artifacts."""
+        artifacts = StoryArtifacts(research="Research", worldbuilding="World", characters="Sam", plot="Plot")
+        
+        assert artifacts.is_complete is False
+        assert artifacts.has_conditional_content is False
+        assert artifacts.has_raw_tool_outputs is False
+        
+        artifacts.draft = "Draft"
+        artifacts.final_story = "Story"
+        artifacts.plot_twist = "Twist"
+        artifacts.raw_image_descriptions = {"cover": "A rainy street"}
+        
+        assert artifacts.is_complete is True
+        assert artifacts.has_conditional_content is True
+        assert artifacts.has_raw_tool_outputs is True
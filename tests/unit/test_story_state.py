@@ -0,0 +1,187 @@
+"""
+Unit tests for the StoryStateManager.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from pulp_fiction_generator.story_model.state import PhaseCache, StoryStateManager, project_dir_name
+
+
+class TestStoryStateManager:
+    """Tests for the StoryStateManager class."""
+    
+    @pytest.fixture
+    def state_manager(self, tmp_path):
+        """Create a state manager that stores its files in a temporary directory."""
+        return StoryStateManager(base_dir=str(tmp_path))
+    
+    def test_clone_is_independent(self, state_manager):
+        """Test that changes to a clone do not affect the original manager."""
+        state_manager.save_task_output("research", "Original research")
+        state_manager.add_chapter(1, "Chapter one")
+        
+        clone = state_manager.clone()
+        clone.set_project_directory("Other Story")
+        clone.save_task_output("research", "New research", chapter_num=2)
+        clone.save_task_output("plot", "A plot")
+        clone.add_chapter(2, "Chapter two")
+        
+        assert isinstance(clone, StoryStateManager)
+        assert clone.get_task_output("research") == "Original research"
+        assert clone.get_task_output("plot") == "A plot"
+        
+        assert state_manager.project_dir == "default_project"
+        assert state_manager.get_task_types(2) == []
+        assert "plot" not in state_manager.task_store
+        assert state_manager.get_chapters() == [1]
+    
+    def test_set_project_directory(self, state_manager):
+        """Test that titles become sanitized, non-empty project directory names."""
+        state_manager.set_project_directory("Who Killed: Mr. Black?")
+        assert state_manager.project_dir == "who_killed_mr._black" == project_dir_name("Who Killed: Mr. Black?")
+        
+        state_manager.set_project_directory("???")
+        assert state_manager.project_dir == "untitled_project"
+        
+        state_manager.set_project_directory(None)
+        assert state_manager.project_dir == "untitled_project"
+    
+    def test_completed_phases(self, state_manager):
+        """Test that only the given phases with output are reported as completed."""
+        state_manager.save_task_output("research", "Research", chapter_num=1)
+        state_manager.save_task_output("plot", "Plot", chapter_num=2)
+        
+        assert state_manager.completed_phases(1, ["research", "plot", "draft"]) == {"research"}
+    
+    def test_phase_checkpoint_round_trip(self, state_manager, tmp_path):
+        """Test that phase checkpoints are saved and loaded for the same genre."""
+        state_manager.set_project_directory("Test Story")
+        outputs = {"research": "Noir research", "research_expanded": None}
+        
+        state_manager.save_cached_phase("research", 1, "noir", outputs)
+        
+        assert state_manager.load_cached_phase("research", 1, "noir") == outputs
+        assert state_manager.load_cached_phase("research", 1, "western") is None
+        assert state_manager.load_cached_phase("research", 2, "noir") is None
+        assert state_manager.load_cached_phase("plot", 1, "noir") is None
+        
+        state_manager.save_cached_phase("plot", 1, "noir", {"plot": "A plot"}, input_key="abc")
+        assert state_manager.load_cached_phase("plot", 1, "noir", input_key="abc") == {"plot": "A plot"}
+        assert state_manager.load_cached_phase("plot", 1, "noir", input_key="def") is None
+        assert state_manager.load_cached_phase("plot", 1, "noir") is None
+        assert sorted(p.name for p in (tmp_path / "test_story" / "chapter_1").iterdir()) == [
+            "plot.json",
+            "research.json"
+        ]
+    
+    def test_corrupt_phase_checkpoint_is_ignored(self, state_manager, tmp_path):
+        """Test that an unreadable checkpoint is treated as missing."""
+        checkpoint = tmp_path / "default_project" / "chapter_1" / "plot.json"
+        checkpoint.parent.mkdir(parents=True)
+        checkpoint.write_text('{"genre": "noir", "outp')
+        
+        assert state_manager.load_cached_phase("plot", 1, "noir") is None
+    
+    def test_stale_phase_checkpoint_is_ignored(self, state_manager):
+        """Test that checkpoints older than the maximum age are not resumed."""
+        with patch("pulp_fiction_generator.story_model.state.time.time", return_value=1000.0):
+            state_manager.save_cached_phase("plot", 1, "noir", {"plot": "A plot"})
+        
+        with patch("pulp_fiction_generator.story_model.state.time.time", return_value=1100.0):
+            assert state_manager.load_cached_phase("plot", 1, "noir", max_age=200) == {"plot": "A plot"}
+            assert state_manager.load_cached_phase("plot", 1, "noir", max_age=50) is None
+            assert state_manager.load_cached_phase("plot", 1, "noir") == {"plot": "A plot"}
+    
+    def test_add_task_outputs(self, state_manager, tmp_path):
+        """Test that a batch of outputs is stored and persisted like single outputs."""
+        state_manager.file_write_tool = None
+        state_manager.add_task_outputs({"research": "Research", "plot": "Plot", "draft": None}, 2)
+        state_manager.flush()
+        
+        assert state_manager.get_task_output_by_chapter("research", 2) == "Research"
+        assert state_manager.has_completed_task("plot", 2)
+        assert not state_manager.has_completed_task("draft", 2)
+        assert sorted(p.name for p in (tmp_path / "default_project" / "chapter_2").iterdir()) == [
+            "plot.txt",
+            "research.txt"
+        ]
+    
+    def test_concurrent_task_outputs(self, state_manager):
+        """Test that outputs saved from several threads at once are all kept."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        state_manager.file_write_tool = None
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(
+                lambda chapter_num: state_manager.save_task_output("draft", f"Draft {chapter_num}", chapter_num),
+                range(1, 21)
+            ))
+        
+        assert state_manager.task_outputs["draft"] == {n: f"Draft {n}" for n in range(1, 21)}
+        assert state_manager.clone()._lock is not state_manager._lock
+
+    
+    def test_queued_writes_keep_latest_content(self, state_manager, tmp_path):
+        """Test that repeated saves of an output in the background leave its latest content."""
+        state_manager.file_write_tool = None
+        for version in range(10):
+            state_manager.add_task_output("draft", 1, f"Draft {version}")
+        
+        state_manager.flush()
+        
+        assert (tmp_path / "default_project" / "chapter_1" / "draft.txt").read_text() == "Draft 9"
+    
+    def test_removed_directory_is_recreated(self, state_manager, tmp_path):
+        """Test that the first write after a directory was removed creates it again."""
+        import shutil
+        
+        state_manager.save_cached_phase("plot", 1, "noir", {"plot": "A plot"})
+        shutil.rmtree(tmp_path / "default_project")
+        
+        state_manager.save_cached_phase("plot", 1, "noir", {"plot": "Another plot"})
+        
+        assert state_manager.load_cached_phase("plot", 1, "noir") == {"plot": "Another plot"}
+    
+    def test_queued_write_to_removed_directory_is_not_lost(self, state_manager, tmp_path):
+        """Test that a background write recreates a directory removed since the last write."""
+        import shutil
+        
+        state_manager.file_write_tool = None
+        state_manager.add_task_output("draft", 1, "Draft 1")
+        state_manager.flush()
+        shutil.rmtree(tmp_path / "default_project")
+        
+        state_manager.add_task_output("draft", 1, "Draft 2")
+        state_manager.flush()
+        
+        assert (tmp_path / "default_project" / "chapter_1" / "draft.txt").read_text() == "Draft 2"
+
+class TestPhaseCache:
+    """Tests for the PhaseCache class."""
+    
+    def test_round_trip_per_model(self, tmp_path):
+        """Test that entries are found by input digest, for the same model only."""
+        cache = PhaseCache(tmp_path, model="llama3")
+        cache.put("inputs", {"research": "Noir research"})
+        
+        assert cache.get("inputs") == {"research": "Noir research"}
+        assert cache.get("other inputs") is None
+        assert PhaseCache(tmp_path, model="mistral").get("inputs") is None
+    
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        """Test that the cache keeps at most max_entries, dropping the least recently used."""
+        import os
+        
+        cache = PhaseCache(tmp_path, max_entries=2)
+        cache.put("first", {"plot": "1"})
+        cache.put("second", {"plot": "2"})
+        os.utime(cache._get_filepath("first"), (1, 1))
+        os.utime(cache._get_filepath("second"), (2, 2))
+        assert cache.get("first") == {"plot": "1"}
+        
+        cache.put("third", {"plot": "3"})
+        
+        assert cache.get("second") is None
+        assert cache.get("first") == {"plot": "1"}
+        assert cache.get("third") == {"plot": "3"}
@@ -0,0 +1,58 @@
+"""
+Unit tests for the TaskFactory.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from pulp_fiction_generator.story_model.tasks import TaskFactory
+
+
+class TestTaskFactory:
+    """Tests for the TaskFactory class."""
+    
+    def test_agents_are_shared_per_role_and_genre(self):
+        """Test that tasks of one role and genre reuse a single agent."""
+        agent_factory = Mock()
+        agent_factory.create_researcher.side_effect = lambda genre: Mock(name=f"{genre} researcher")
+        task_factory = TaskFactory(agent_factory)
+        
+        first = task_factory._get_agent("create_researcher", "noir")
+        
+        assert task_factory._get_agent("create_researcher", "noir") is first
+        assert task_factory._get_agent("create_researcher", "western") is not first
+        assert agent_factory.create_researcher.call_count == 2
+    
+    def test_concurrent_tasks_do_not_share_an_agent(self):
+        """Test that tasks running at the same time on two threads get their own agents."""
+        agent_factory = Mock()
+        agent_factory.create_writer.side_effect = lambda genre: Mock(name=f"{genre} writer")
+        task_factory = TaskFactory(agent_factory)
+        both_running = threading.Barrier(2)
+        
+        def run_task():
+            agent = task_factory._get_agent("create_writer", "noir")
+            # Keep the agent busy until the other task is running too
+            both_running.wait(timeout=5)
+            assert task_factory._get_agent("create_writer", "noir") is agent
+            return agent
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first, second = executor.map(lambda _: run_task(), range(2))
+        
+        assert first is not second
+        assert agent_factory.create_writer.call_count == 2
+    
+    def test_research_subtasks_get_their_own_agents(self):
+        """Test that research subtasks, which may run concurrently, do not share an agent."""
+        agent_factory = Mock()
+        agent_factory.create_researcher.side_effect = lambda genre: Mock(name=f"{genre} researcher")
+        task_factory = TaskFactory(agent_factory)
+        
+        with patch('pulp_fiction_generator.story_model.tasks.Task') as mock_task:
+            task_factory.create_research_subtasks("noir")
+        
+        agents = [call.kwargs["agent"] for call in mock_task.call_args_list]
+        assert len(agents) == 3
+        assert len({id(agent) for agent in agents}) == 3